@@ -1,76 +1,136 @@
 import streamlit as st
 import os
-import tempfile
 from pathlib import Path
-from services.resume_parser import extract_text
-from services.db.lancedb_client import store_resume, is_duplicate, extract_signals_if_llm_ready
+from services.resume_parser import EXTRACTION_TIMEOUT
+from services.ingest_pipeline import run_ingest_pipeline
+from services.resume_archive import is_archive, open_archive
+from services.db.lancedb_client import count_missing_signals
+from services.signal_backfill import start_background_backfill, get_background_backfill
 
 PROJECT_ROOT = Path(__file__).resolve().parent.parent
 UPLOAD_DIR = str(PROJECT_ROOT / "data" / "raw_resumes")
 os.makedirs(UPLOAD_DIR, exist_ok=True)
 
 st.title("📂 Upload Resumes")
-st.caption("Upload PDF or DOCX files to parse and store in the vector database.")
+st.caption("Upload PDF or DOCX files, or ZIP exports of them, to parse and store in the vector database.")
 
 st.markdown("---")
 
 files = st.file_uploader(
     "Select resume files",
-    type=["pdf", "docx"],
+    type=["pdf", "docx", "zip"],
     accept_multiple_files=True,
 )
 
 store_db = st.checkbox("Store in Vector Database (LanceDB)", value=True)
 
+NEAR_DUPLICATE_OPTIONS = {
+    "Link to original": "link",
+    "Skip": "skip",
+    "Store separately": "keep",
+}
+near_duplicate_choice = st.radio(
+    "Near-duplicates (same resume re-exported or slightly edited)",
+    list(NEAR_DUPLICATE_OPTIONS),
+    horizontal=True,
+    disabled=not store_db,
+)
+near_duplicate_mode = NEAR_DUPLICATE_OPTIONS[near_duplicate_choice]
+
 if st.button("Process Resumes", type="primary"):
     if not files:
         st.warning("Please upload at least one resume.")
     else:
+        # ZIP uploads are expanded into lazy members: only the archive's
+        # directory is read here, each resume is decompressed when parsed.
+        sources = []
+        archives = []
+        for upload in files:
+            if not is_archive(upload.name):
+                sources.append(upload)
+                continue
+            try:
+                archive, members, skipped = open_archive(upload)
+            except ValueError as e:
+                st.error(f"❌ {upload.name}: {e}")
+                continue
+            archives.append(archive)
+            sources.extend(members)
+            st.caption(f"📦 {upload.name}: {len(members)} resume(s) found")
+            for path, reason in skipped:
+                st.caption(f"⏭️ {upload.name}/{path} skipped ({reason})")
+
         progress = st.progress(0, text="Processing...")
         success_count = 0
         dup_count = 0
+        near_dup_count = 0
+        linked_count = 0
         signals_count = 0
-        for idx, file in enumerate(files):
-            try:
-                # Extract text from temp file first (before committing to disk)
-                suffix = os.path.splitext(file.name)[1]
-                with tempfile.NamedTemporaryFile(delete=False, suffix=suffix) as tmp:
-                    tmp.write(file.getbuffer())
-                    tmp_path = tmp.name
 
-                text = extract_text(tmp_path)
-                os.unlink(tmp_path)
+        # Resolve the LLM here: pipeline stages run in worker threads without session state
+        llm = None
+        if store_db and st.session_state.get("llm_configured"):
+            try:
+                from services.llm_config import get_llm
+                llm = get_llm(temperature=0)
+            except Exception as e:
+                st.warning(f"⚠️ LLM unavailable, storing without signals: {e}")
 
-                # Check for duplicate content before saving anything
-                if store_db and is_duplicate(text):
-                    dup_count += 1
-                    st.warning(f"⚠️ {file.name} — duplicate content, skipped.")
-                else:
-                    # Save file to disk
-                    file_path = os.path.join(UPLOAD_DIR, file.name)
-                    with open(file_path, "wb") as f:
-                        f.write(file.getbuffer())
-
-                    # Index in LanceDB (with cached signals if LLM is ready)
-                    if store_db:
-                        progress.progress(
-                            (idx + 0.5) / len(files),
-                            text=f"Extracting signals for {file.name}..."
-                        )
-                        signals = extract_signals_if_llm_ready(text)
-                        store_resume(file.name, text, signals=signals)
-                        if signals:
-                            signals_count += 1
+        def save_upload(file):
+            # Archive members are named "<archive>/<path in archive>": keep that tree
+            path = os.path.join(UPLOAD_DIR, file.name)
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            with open(path, "wb") as f:
+                f.write(file.getbuffer())
 
+        # Parse, dedup, LLM extraction and batched writes run as overlapping stages
+        events = run_ingest_pipeline(
+            sources, llm=llm, store=store_db, near_duplicates=near_duplicate_mode, timeout=EXTRACTION_TIMEOUT,
+        )
+        for event in events:
+            kind = event["event"]
+            file = sources[event["index"]] if "index" in event else None
+            if kind == "failed":
+                st.error(f"❌ Failed to process {file.name}: {event['error']}")
+            elif kind == "error":
+                st.error(f"❌ Ingest {event['stage']} stage failed: {event['error']}")
+            elif kind == "duplicate":
+                dup_count += 1
+                st.warning(f"⚠️ {file.name} — duplicate content, skipped.")
+            elif kind == "near_duplicate":
+                near_dup_count += 1
+                st.warning(f"⚠️ {file.name} — near-duplicate of {event['original']}, skipped.")
+            elif kind == "parsed" and not store_db:
+                save_upload(file)
+                success_count += 1
+            elif kind == "stored":
+                if event["status"] in ("stored", "linked"):
+                    save_upload(file)
                     success_count += 1
-            except Exception as e:
-                st.error(f"❌ Failed to process {file.name}: {e}")
+                    signals_count += event["signals"]
+                    linked_count += event["status"] == "linked"
+                elif event["status"] == "near_duplicate":
+                    near_dup_count += 1
+                else:
+                    dup_count += 1
 
-            progress.progress((idx + 1) / len(files), text=f"Processed {file.name}")
+            counts = event.get("counts")
+            if counts and counts["total"]:
+                total = counts["total"]
+                if store_db:
+                    finished = sum(counts[k] for k in ("failed", "duplicate", "near_duplicate", "stored", "linked"))
+                    text = (f"Parsed {counts['parsed']}/{total} · "
+                            f"signals {counts['extracted']} · stored {counts['stored'] + counts['linked']}")
+                else:
+                    finished = counts["parsed"] + counts["failed"]
+                    text = f"Parsed {finished}/{total} files"
+                progress.progress(min(finished / total, 1.0), text=text)
 
+        for archive in archives:
+            archive.close()
         progress.empty()
         if success_count > 0:
-            st.success(f"Processed {success_count} of {len(files)} resume(s) successfully.")
+            st.success(f"Processed {success_count} of {len(sources)} resume(s) successfully.")
             if store_db:
                 st.info(f"{success_count} resumes indexed in LanceDB.")
                 if signals_count > 0:
@@ -79,4 +139,46 @@ if st.button("Process Resumes", type="primary"):
                     st.caption("💡 Configure an LLM in the sidebar to pre-analyze resumes at upload time for faster matching.")
         if dup_count > 0:
             st.info(f"🔁 {dup_count} duplicate(s) skipped.")
+        if near_dup_count > 0:
+            st.info(f"🔁 {near_dup_count} near-duplicate(s) skipped.")
+        if linked_count > 0:
+            st.info(f"🔗 {linked_count} near-duplicate(s) linked to their original — excluded from database matching.")
 
+# ===== Signal backfill for resumes stored without an LLM =====
+st.markdown("---")
+st.subheader("⚡ Pre-analyze Stored Resumes")
+
+missing_signals = count_missing_signals()
+worker = get_background_backfill()
+
+if worker is not None and worker.is_alive():
+    stats = worker.stats
+    total = max(stats["total"], 1)
+    st.progress(
+        (stats["done"] + stats["failed"]) / total,
+        text=f"Extracting signals: {stats['done']}/{stats['total']} done, {stats['failed']} failed"
+    )
+    col1, col2 = st.columns(2)
+    with col1:
+        st.button("🔄 Refresh status")
+    with col2:
+        if st.button("⏹️ Stop after current batch"):
+            worker.stop()
+else:
+    if worker is not None:
+        if worker.error:
+            st.error(f"❌ Last backfill failed: {worker.error}")
+        else:
+            st.success(f"Last backfill: {worker.stats['done']} extracted, {worker.stats['failed']} failed.")
+
+    if missing_signals == 0:
+        st.caption("All stored resumes have cached signals.")
+    else:
+        st.info(f"{missing_signals} stored resume(s) have no cached signals yet — matching will call the LLM for them.")
+        if st.button("Start background extraction"):
+            if not st.session_state.get("llm_configured"):
+                st.error("⚠️ Please configure an LLM provider in the sidebar first.")
+            else:
+                from services.llm_config import get_llm
+                start_background_backfill(get_llm(temperature=0))
+                st.rerun()
@@ -6,6 +6,7 @@ from langchain_core.prompts import PromptTemplate
 from langchain_core.output_parsers import StrOutputParser
 from services.db.lancedb_client import get_or_create_table
 from services.llm_config import get_llm, extract_json
+from services.resume_search import hybrid_search
 
 PROJECT_ROOT = Path(__file__).resolve().parent.parent
 RESUME_DIR = str(PROJECT_ROOT / "data" / "raw_resumes")
@@ -14,21 +15,16 @@ st.title("🔍 Resume Search")
 st.caption("LLM-powered semantic search across all stored resumes.")
 
 # -----------------------------
-# Load resumes from LanceDB
+# Resume pool in LanceDB
 # -----------------------------
 table = get_or_create_table()
-df = table.to_pandas()
+total_resumes = table.count_rows()
 
-if df.empty:
+if total_resumes == 0:
     st.warning("No resumes found. Please upload resumes first.")
     st.stop()
 
-MAX_RESUMES = 50
-if len(df) > MAX_RESUMES:
-    st.warning(f"Database contains {len(df)} resumes. Searching the most recent {MAX_RESUMES}.")
-    df = df.tail(MAX_RESUMES)
-
-st.info(f"Searching across {len(df)} resumes")
+st.info(f"Searching across {total_resumes} resumes")
 
 # -----------------------------
 # User input
@@ -38,18 +34,37 @@ query = st.text_input(
     placeholder="e.g. DevOps Engineer with AWS and CI/CD"
 )
 
+top_n = st.slider(
+    "Candidates sent to the LLM",
+    min_value=1,
+    max_value=30,
+    value=10,
+    help="Keyword (BM25) and vector retrieval rank the whole database; only this many top candidates are reviewed by the LLM."
+)
+
 if not query:
     st.stop()
 
+# -----------------------------
+# Hybrid retrieval (BM25 + vectors, reciprocal-rank fusion)
+# -----------------------------
+candidates = hybrid_search(query, top_n=top_n)
+
+if not candidates:
+    st.info("No matching resumes found.")
+    st.stop()
+
+st.caption(f"Top {len(candidates)} of {total_resumes} resumes retrieved for LLM review.")
+
 # -----------------------------
 # Prepare resume text for LLM
 # -----------------------------
 resumes_text = ""
-for _, row in df.iterrows():
+for candidate in candidates:
     # Truncate individual resumes to avoid exceeding context limits
-    text = row['text'][:3000]
+    text = candidate["text"][:3000]
     resumes_text += f"""
-Filename: {row['filename']}
+Filename: {candidate['filename']}
 Resume:
 {text}
 --------------------
@@ -1,9 +1,11 @@
 import streamlit as st
 import pandas as pd
+from pathlib import Path
 from services.db.lancedb_client import get_or_create_table
+from services.resume_export import EXPORT_FORMATS, export_resumes
 
 st.title("📥 Reports & Export")
-st.caption("Download stored resume data and matching results as CSV.")
+st.caption("Download stored resume data (CSV, Parquet or JSONL) and matching results as CSV.")
 
 st.markdown("---")
 
@@ -11,25 +13,35 @@ st.subheader("Stored Resumes")
 
 try:
     table = get_or_create_table()
-    df = table.to_pandas()
+    resume_count = table.count_rows()
 
-    if not df.empty:
-        st.info(f"Found {len(df)} resumes in database")
+    if resume_count:
+        st.info(f"Found {resume_count} resumes in database")
 
-        export_format = st.selectbox("Export Format", ["CSV"])
+        export_format = st.selectbox("Export Format", list(EXPORT_FORMATS))
+        include_text = st.checkbox("Include full resume text", value=True)
 
         if st.button("⬇️ Export Resume Database"):
-            export_df = df[["id", "filename", "text"]].copy()
-            # Truncate text for readability in CSV
-            export_df["text_preview"] = export_df["text"].str[:500] + "..."
-
-            csv_data = export_df[["id", "filename", "text_preview"]].to_csv(index=False)
-            st.download_button(
-                label="⬇️ Download CSV",
-                data=csv_data,
-                file_name="resumes_export.csv",
-                mime="text/csv"
-            )
+            # Drop the previous export's temp file before writing a new one
+            previous = st.session_state.pop("resume_export_path", None)
+            if previous:
+                Path(previous).unlink(missing_ok=True)
+
+            with st.spinner(f"Exporting {resume_count} resumes..."):
+                export_path = export_resumes(export_format, include_text=include_text)
+            st.session_state["resume_export_path"] = str(export_path)
+            st.session_state["resume_export_format"] = export_format
+
+        export_path = st.session_state.get("resume_export_path")
+        if export_path and Path(export_path).exists():
+            fmt = st.session_state["resume_export_format"]
+            with open(export_path, "rb") as f:
+                st.download_button(
+                    label=f"⬇️ Download {fmt}",
+                    data=f,
+                    file_name=f"resumes_export{EXPORT_FORMATS[fmt]['suffix']}",
+                    mime=EXPORT_FORMATS[fmt]["mime"]
+                )
     else:
         st.warning("No resumes found in database. Upload resumes first on the Upload page.")
 except Exception as e:
@@ -4,10 +4,14 @@ JD-Resume Matching & Ranking Dashboard
 
 import streamlit as st
 import pandas as pd
-from services.matching_workflow import match_resumes_to_jd
-from services.resume_parser import extract_text
-import os
-import tempfile
+from services.matching_workflow import (
+    match_resumes_to_jd,
+    match_database_to_jd,
+    PREFILTER_MIN_SKILLS,
+    PREFILTER_MAX_CANDIDATES,
+)
+from services.resume_parser import extract_text, extract_texts, EXTRACTION_TIMEOUT
+from services.db.lancedb_client import count_missing_signals, get_or_create_table
 
 st.title("🎯 JD-Resume Matching & Ranking")
 st.caption("Explainable, evidence-based candidate screening with 100-point rubric scoring.")
@@ -38,24 +42,13 @@ else:
     )
 
     if jd_file:
-        # Save temporarily and extract text (cross-platform temp file)
-        suffix = os.path.splitext(jd_file.name)[1]
-        with tempfile.NamedTemporaryFile(delete=False, suffix=suffix) as tmp:
-            tmp.write(jd_file.getbuffer())
-            temp_path = tmp.name
-
-        try:
-            if jd_file.name.endswith(".txt"):
-                with open(temp_path, "r", encoding="utf-8") as f:
-                    jd_text = f.read()
-            else:
-                jd_text = extract_text(temp_path)
+        # Parse straight from the upload buffer (no temp file)
+        if jd_file.name.endswith(".txt"):
+            jd_text = jd_file.getvalue().decode("utf-8")
+        else:
+            jd_text = extract_text(jd_file, timeout=EXTRACTION_TIMEOUT)
 
-            st.success(f"✅ Loaded JD from {jd_file.name}")
-        finally:
-            # Clean up temp file
-            if os.path.exists(temp_path):
-                os.unlink(temp_path)
+        st.success(f"✅ Loaded JD from {jd_file.name}")
 
 st.markdown("---")
 
@@ -69,6 +62,7 @@ resume_input_method = st.radio(
 )
 
 resume_texts = []
+skill_prefilter = None
 
 if resume_input_method == "Upload Files":
     resume_files = st.file_uploader(
@@ -78,33 +72,55 @@ if resume_input_method == "Upload Files":
     )
 
     if resume_files:
-        for resume_file in resume_files:
-            # Create cross-platform temp file
-            suffix = os.path.splitext(resume_file.name)[1]
-            with tempfile.NamedTemporaryFile(delete=False, suffix=suffix) as tmp:
-                tmp.write(resume_file.getbuffer())
-                temp_path = tmp.name
-
-            try:
-                text = extract_text(temp_path)
-                resume_texts.append(text)
-            finally:
-                # Clean up temp file
-                if os.path.exists(temp_path):
-                    os.unlink(temp_path)
+        # Parse straight from the upload buffers, in parallel (no temp files)
+        for resume_file, result in zip(resume_files, extract_texts(resume_files, timeout=EXTRACTION_TIMEOUT)):
+            if result["error"]:
+                st.error(f"❌ Failed to parse {resume_file.name}: {result['error']}")
+            else:
+                resume_texts.append(result["text"])
 
         st.success(f"✅ Loaded {len(resume_texts)} resumes")
 
 elif resume_input_method == "Load from Database":
-    from services.db.lancedb_client import get_or_create_table
-
     try:
         table = get_or_create_table()
-        df = table.to_pandas()
-
-        if not df.empty:
-            resume_texts = df["text"].tolist()
-            st.success(f"✅ Loaded {len(resume_texts)} resumes from database")
+        # Linked near-duplicates are the same candidate: count/load originals only
+        stored_count = table.count_rows("duplicate_of IS NULL")
+
+        if stored_count:
+            use_prefilter = st.checkbox(
+                "⚡ Prefilter by JD must-have skills",
+                value=False,
+                help="Score only stored resumes that cover enough of the JD's must-have skills "
+                     "(uses cached signals; resumes never analyzed are not considered)."
+            )
+            if use_prefilter:
+                missing_signals = count_missing_signals()
+                if missing_signals:
+                    st.warning(
+                        f"⚠️ {missing_signals} of {stored_count} stored resume(s) have no cached signals and "
+                        "will not be considered by the prefilter. Run \"Pre-analyze Stored Resumes\" on the "
+                        "Upload page first, or turn the prefilter off to score every resume."
+                    )
+                col1, col2 = st.columns(2)
+                with col1:
+                    min_skills = st.number_input(
+                        "Minimum must-have skills matched",
+                        min_value=1, max_value=10, value=PREFILTER_MIN_SKILLS
+                    )
+                with col2:
+                    max_candidates = st.number_input(
+                        "Maximum candidates to score",
+                        min_value=1, max_value=5000, value=PREFILTER_MAX_CANDIDATES
+                    )
+                skill_prefilter = {"min_skills": int(min_skills), "max_candidates": int(max_candidates)}
+                st.success(f"✅ {stored_count} resumes in database — candidates are picked after the JD is parsed")
+            else:
+                resume_texts = (
+                    table.search().where("duplicate_of IS NULL").select(["text"]).limit(None)
+                    .to_arrow().column("text").to_pylist()
+                )
+                st.success(f"✅ Loaded {len(resume_texts)} resumes from database")
         else:
             st.warning("No resumes found in database. Please upload resumes first.")
     except Exception as e:
@@ -166,13 +182,13 @@ if st.button("🚀 Run Matching & Ranking", type="primary", use_container_width=
         st.error("❌ Please provide a job description")
         st.stop()
 
-    if len(resume_texts) == 0:
+    if len(resume_texts) == 0 and skill_prefilter is None:
         st.error("❌ Please provide at least one resume")
         st.stop()
 
     # Check for empty resumes
     valid_resumes = [r for r in resume_texts if r.strip()]
-    if len(valid_resumes) == 0:
+    if len(valid_resumes) == 0 and skill_prefilter is None:
         st.error("❌ All resumes are empty. Please check your input files.")
         st.stop()
 
@@ -180,9 +196,16 @@ if st.button("🚀 Run Matching & Ranking", type="primary", use_container_width=
         st.warning(f"⚠️ Skipping {len(resume_texts) - len(valid_resumes)} empty resume(s)")
         resume_texts = valid_resumes
 
-    with st.spinner(f"🔄 Processing JD + {len(resume_texts)} resumes..."):
+    spinner_text = (
+        "🔄 Processing JD + skill-prefiltered database resumes..." if skill_prefilter
+        else f"🔄 Processing JD + {len(resume_texts)} resumes..."
+    )
+    with st.spinner(spinner_text):
         try:
-            result = match_resumes_to_jd(jd_text, resume_texts)
+            if skill_prefilter:
+                result = match_database_to_jd(jd_text, **skill_prefilter)
+            else:
+                result = match_resumes_to_jd(jd_text, resume_texts)
 
             st.session_state["matching_result"] = result
             st.success(f"✅ Matching complete! Processed {result['total_candidates']} candidates")
@@ -1,9 +1,19 @@
 import lancedb
 import hashlib
 import json
+import re
+import threading
+import time
+from collections import OrderedDict
 from pathlib import Path
 from uuid import uuid4
 import pyarrow as pa
+from lancedb.query import BooleanQuery, MatchQuery, Occur, PhraseQuery
+
+from services.db.migrations import SCHEMA_VERSION, get_schema_version, migrate_table, set_schema_version
+from services.embedder import EMBEDDING_DIM, embed_texts
+from services.minhash import NUM_PERM, estimate_jaccard, lsh_buckets, minhash_signature
+from services.resume_sections import dump_sections, segment_sections
 
 # ---------- DB PATH ----------
 # Use path relative to project root (parent of services/)
@@ -19,60 +29,464 @@ resume_schema = pa.schema([
     pa.field("filename", pa.string()),
     pa.field("text", pa.string()),
     pa.field("fingerprint", pa.string()),
-    pa.field("signals", pa.string()),  # JSON-serialized structured signals (cached)
+    pa.field("signals", pa.string()),  # JSON-serialized structured signals (cached; empty/NULL = not extracted)
+    pa.field("embedding", pa.list_(pa.float32(), EMBEDDING_DIM)),  # services.embedder vector
+    # Typed copies of ResumeSignals fields for `where` pushdown (NULL = no signals)
+    pa.field("total_years", pa.float32()),
+    pa.field("most_recent_role_year", pa.int32()),
+    pa.field("skills", pa.list_(pa.string())),  # lowercase skill names
+    pa.field("domains", pa.list_(pa.string())),  # lowercase domain names
+    pa.field("outcome_count", pa.int32()),
+    pa.field("project_count", pa.int32()),
+    # Near-duplicate detection (services.minhash)
+    pa.field("minhash", pa.list_(pa.uint32(), NUM_PERM)),
+    pa.field("lsh_buckets", pa.list_(pa.string())),
+    pa.field("duplicate_of", pa.string()),  # id of the resume this one near-duplicates (NULL = original)
+    pa.field("sections", pa.string()),  # JSON services.resume_sections offsets into text
 ])
 
+SIGNAL_COLUMNS = [
+    "total_years", "most_recent_role_year", "skills",
+    "domains", "outcome_count", "project_count",
+]
+
+# ---------- VECTOR INDEX ----------
+# Below this many rows a flat scan is already a few ms, so no ANN index.
+VECTOR_INDEX_MIN_ROWS = 5000
+# Rebuild the IVF-PQ index once unindexed rows exceed this share of indexed rows.
+VECTOR_INDEX_REBUILD_FRACTION = 0.1
+
+# ---------- FULL-TEXT INDEX ----------
+# New rows are searchable right away (unindexed fragments are scanned), but
+# once this many pile up they are merged into the BM25 index via optimize().
+FTS_OPTIMIZE_MIN_UNINDEXED = 1000
+
+# ---------- NEAR-DUPLICATES ----------
+# Estimated Jaccard similarity of word shingles above which two resumes are
+# treated as the same candidate.
+NEAR_DUPLICATE_THRESHOLD = 0.8
+
+NEAR_DUPLICATE_MODES = ("keep", "link", "skip")
+
 # ---------- FINGERPRINT ----------
 def generate_fingerprint(text: str) -> str:
     """SHA-256 fingerprint of normalized resume text for dedup."""
     normalized = " ".join(text.split()).lower()
     return hashlib.sha256(normalized.encode()).hexdigest()
 
+# ---------- STRUCTURED SIGNAL COLUMNS ----------
+def _as_number(value, cast):
+    try:
+        return cast(value) if value is not None else None
+    except (TypeError, ValueError):
+        return None
+
+
+def _names(items, key=None):
+    names = []
+    for item in items or []:
+        name = item.get(key, "") if key and isinstance(item, dict) else item
+        if isinstance(name, str) and name.strip():
+            names.append(name.strip().lower())
+    return list(dict.fromkeys(names))
+
+
+def signal_columns(signals) -> dict:
+    """
+    Typed column values derived from a ResumeSignals dict.
+
+    Args:
+        signals: Parsed signals dict, or None if not extracted yet
+
+    Returns:
+        Dict with one value per SIGNAL_COLUMNS entry (all None without signals)
+    """
+    if signals is None:
+        return {column: None for column in SIGNAL_COLUMNS}
+
+    experience = signals.get("experience_duration") or {}
+    recency = signals.get("recency_indicators") or {}
+    return {
+        "total_years": _as_number(experience.get("total_years"), float),
+        "most_recent_role_year": _as_number(recency.get("most_recent_role_year"), int),
+        "skills": _names(signals.get("skills"), key="skill"),
+        "domains": _names(signals.get("domain_experience")),
+        "outcome_count": len(signals.get("measurable_outcomes") or []),
+        "project_count": len(signals.get("projects") or []),
+    }
+
+
 # ---------- TABLE HANDLER ----------
-def get_or_create_table():
+def _open_or_create_table():
     if "resumes" in db.table_names():
         table = db.open_table("resumes")
-        current_cols = table.schema.names
-        needs_migration = False
-
-        # Migrate old tables that lack required columns
-        if "fingerprint" not in current_cols or "signals" not in current_cols:
-            needs_migration = True
-
-        if needs_migration:
-            df = table.to_pandas()
-            if "fingerprint" not in df.columns:
-                df["fingerprint"] = df["text"].apply(generate_fingerprint)
-            if "signals" not in df.columns:
-                df["signals"] = ""  # Empty string = not yet extracted
-            db.drop_table("resumes")
-            return db.create_table(
-                name="resumes",
-                data=df[["id", "filename", "text", "fingerprint", "signals"]],
-                schema=resume_schema,
-                mode="create"
-            )
+
+        # Upgrade older tables in place (adds columns, backfills in batches)
+        if get_schema_version(table) < SCHEMA_VERSION:
+            if migrate_table(table, resume_schema):
+                _reset_table_state()
 
         return table
 
-    return db.create_table(
+    _reset_table_state()
+    table = db.create_table(
         name="resumes",
         schema=resume_schema,
         mode="create"
     )
+    set_schema_version(table, SCHEMA_VERSION)
+    return table
+
+
+# ---------- TABLE HANDLE CACHE ----------
+# How often (seconds) a cached handle looks for commits made by other
+# processes. Writes made through this process are visible immediately.
+TABLE_REFRESH_INTERVAL = 1.0
+
+
+class TableHandle:
+    """
+    Process-wide, thread-safe holder for the open `resumes` table.
+
+    The table is opened (and migrated) once; afterwards get() only moves the
+    handle to the latest dataset version, at most every TABLE_REFRESH_INTERVAL
+    seconds, instead of listing tables and reopening on every operation.
+
+    `opener` opens another table the same way (e.g. resume_skills).
+    """
+
+    def __init__(self, opener=None):
+        self._opener = opener
+        self._lock = threading.RLock()
+        self._db = None
+        self._table = None
+        self._checked_at = 0.0
+
+    def get(self):
+        with self._lock:
+            now = time.monotonic()
+            opener = self._opener or _open_or_create_table
+            if self._table is None or self._db is not db:
+                self._db = db
+                self._table = opener()
+                self._checked_at = now
+            elif now - self._checked_at >= TABLE_REFRESH_INTERVAL:
+                try:
+                    self._table.checkout_latest()
+                except Exception:
+                    # Dropped or replaced behind our back: reopen
+                    self._table = opener()
+                self._checked_at = now
+            return self._table
+
+    def invalidate(self):
+        """Force the next get() to reopen the table."""
+        with self._lock:
+            self._table = None
+
+
+_table_handle = TableHandle()
+
+
+def get_table_handle() -> TableHandle:
+    """Shared TableHandle for the resumes table."""
+    return _table_handle
+
+
+def get_or_create_table():
+    """
+    Open resumes table, created or migrated on first use.
+
+    Served by the process-wide TableHandle, so pages call this directly on
+    every rerun: all sessions share one open table.
+    """
+    return _table_handle.get()
+
+# ---------- FINGERPRINT INDEX ----------
+# Fingerprint -> {"id", "signals"} rows already read from the table. Misses are
+# cached as None. Entries are only valid for the table version they were read
+# at, so the whole cache is dropped as soon as the table version moves. Bounded
+# LRU: a long-running server or daemon keeps only the recently used entries.
+FINGERPRINT_CACHE_SIZE = 10_000
+_fingerprint_cache = OrderedDict()
+_fingerprint_cache_version = None
+_fingerprint_cache_lock = threading.Lock()
+
+# (table name, column) scalar indices already verified/created in this process.
+_ready_scalar_indices = set()
+
+# Max values per `IN (...)` filter so bulk lookups keep SQL small.
+IN_QUERY_CHUNK = 500
+
+
+def _reset_table_state():
+    """Forget cached rows and index state (the table is being recreated)."""
+    global _fingerprint_cache_version
+    with _fingerprint_cache_lock:
+        _fingerprint_cache.clear()
+        _fingerprint_cache_version = None
+        _ready_scalar_indices.clear()
+
+
+def _sql_quote(value: str) -> str:
+    """Quote a string literal for a LanceDB `where` clause."""
+    return "'" + value.replace("'", "''") + "'"
+
+
+def _ensure_scalar_index(table, column: str, index_type: str = "BTREE"):
+    """Create a scalar index on `column` if the table has none (checked once per process)."""
+    key = (table.name, column)
+    if key in _ready_scalar_indices:
+        return
+    if not any(column in index.columns for index in table.list_indices()):
+        table.create_scalar_index(column, index_type=index_type)
+    _ready_scalar_indices.add(key)
+
+
+def ensure_fingerprint_index(table):
+    """Create the BTREE scalar index on `fingerprint` if the table has none."""
+    _ensure_scalar_index(table, "fingerprint", "BTREE")
+
+
+def _cache_fingerprint(fp: str, row):
+    """Insert or refresh one entry, evicting the least recently used (lock held)."""
+    _fingerprint_cache[fp] = row
+    _fingerprint_cache.move_to_end(fp)
+    while len(_fingerprint_cache) > FINGERPRINT_CACHE_SIZE:
+        _fingerprint_cache.popitem(last=False)
+
+
+def _sync_fingerprint_cache(table):
+    """Invalidate the fingerprint cache if the table has a new version."""
+    global _fingerprint_cache_version
+    version = table.version
+    if version != _fingerprint_cache_version:
+        _fingerprint_cache.clear()
+        _fingerprint_cache_version = version
+
+
+def lookup_fingerprints(fps, table=None) -> dict:
+    """
+    Look up many resume rows by fingerprint.
+
+    Cached fingerprints are answered from memory; the rest are resolved with
+    indexed `fingerprint IN (...)` queries that only project `fingerprint`,
+    `id` and `signals` (resume text is never read).
+
+    Args:
+        fps: Iterable of fingerprints from generate_fingerprint()
+        table: Open resumes table (opened on demand if omitted)
+
+    Returns:
+        Dict mapping every requested fingerprint to {"id": ..., "signals": ...},
+        or to None if it is not stored
+    """
+    table = table if table is not None else get_or_create_table()
+    found = {}
+    with _fingerprint_cache_lock:
+        _sync_fingerprint_cache(table)
+        for fp in fps:
+            if fp in _fingerprint_cache:
+                found[fp] = _fingerprint_cache[fp]
+                _fingerprint_cache.move_to_end(fp)
+            else:
+                found.setdefault(fp, None)
+        missing = [fp for fp in found if fp not in _fingerprint_cache]
+
+    if not missing:
+        return found
+
+    fetched = _query_fingerprints(missing, table)
+    with _fingerprint_cache_lock:
+        _sync_fingerprint_cache(table)
+        for fp in missing:
+            found[fp] = fetched.get(fp)
+            _cache_fingerprint(fp, found[fp])
+    return found
+
+
+def _query_fingerprints(fps, table) -> dict:
+    """Uncached indexed lookup: fingerprint -> {"id", "signals"} for stored fingerprints only."""
+    ensure_fingerprint_index(table)
+    fetched = {}
+    for start in range(0, len(fps), IN_QUERY_CHUNK):
+        chunk = fps[start:start + IN_QUERY_CHUNK]
+        in_list = ", ".join(_sql_quote(fp) for fp in chunk)
+        rows = (
+            table.search()
+            .where(f"fingerprint IN ({in_list})")
+            .select(["fingerprint", "id", "signals"])
+            .limit(len(chunk))
+            .to_list()
+        )
+        for row in rows:
+            fetched.setdefault(row["fingerprint"], {"id": row["id"], "signals": row["signals"]})
+    return fetched
+
+
+def lookup_fingerprint(fp: str, table=None):
+    """
+    Look up a single resume row by fingerprint.
+
+    Args:
+        fp: Fingerprint from generate_fingerprint()
+        table: Open resumes table (opened on demand if omitted)
+
+    Returns:
+        {"id": ..., "signals": ...} if the fingerprint is stored, None otherwise
+    """
+    return lookup_fingerprints([fp], table)[fp]
+
+
+def _record_appended_fingerprints(previous_version: int, table, rows: dict):
+    """
+    Keep the cache warm after our own append.
+
+    If the append is the only change since the cached version, every other
+    cached entry is still correct and only the appended fingerprints
+    (`rows`: fingerprint -> {"id", "signals"}) need updating.
+    """
+    global _fingerprint_cache_version
+    with _fingerprint_cache_lock:
+        if _fingerprint_cache_version == previous_version and table.version == previous_version + 1:
+            _fingerprint_cache_version = table.version
+            for fp, row in rows.items():
+                _cache_fingerprint(fp, row)
+
 
 # ---------- DUPLICATE CHECK ----------
 def is_duplicate(text: str) -> bool:
     """Check if resume content already exists in the database."""
-    table = get_or_create_table()
-    fp = generate_fingerprint(text)
-    df = table.to_pandas()
-    if "fingerprint" in df.columns and not df.empty:
-        return fp in df["fingerprint"].values
-    return False
+    return lookup_fingerprint(generate_fingerprint(text)) is not None
+
+# ---------- NEAR-DUPLICATE CHECK ----------
+def ensure_near_duplicate_index(table):
+    """LABEL_LIST index backing `array_has_any(lsh_buckets, ...)` probes."""
+    _ensure_scalar_index(table, "lsh_buckets", "LABEL_LIST")
+
+
+def _fetch_bucket_rows(buckets, table) -> dict:
+    """Stored rows sharing at least one LSH bucket with `buckets` (id -> row)."""
+    buckets = list(dict.fromkeys(buckets))
+    if not buckets or table.count_rows() == 0:
+        return {}
+
+    ensure_near_duplicate_index(table)
+    rows = {}
+    for start in range(0, len(buckets), IN_QUERY_CHUNK):
+        chunk = buckets[start:start + IN_QUERY_CHUNK]
+        for row in (
+            table.search()
+            .where(f"array_has_any(lsh_buckets, {_sql_list(chunk)})")
+            .select(["id", "filename", "signals", "minhash", "lsh_buckets", "duplicate_of"])
+            .limit(None)
+            .to_list()
+        ):
+            rows[row["id"]] = row
+    return rows
+
+
+def _best_near_duplicate(signature, buckets, candidates, threshold):
+    """Most similar candidate row sharing a bucket and reaching `threshold`, or None."""
+    buckets = set(buckets)
+    best, best_similarity = None, threshold
+    for row in candidates:
+        if buckets.isdisjoint(row["lsh_buckets"] or []):
+            continue
+        similarity = estimate_jaccard(signature, row["minhash"])
+        if similarity >= best_similarity:
+            best, best_similarity = row, similarity
+    if best is None:
+        return None
+    return {
+        "id": best["id"],
+        "filename": best["filename"],
+        "signals": best["signals"],
+        "duplicate_of": best["duplicate_of"],
+        "similarity": best_similarity,
+    }
+
+
+def _match_near_duplicates(signatures, buckets, table, threshold) -> list:
+    rows = _fetch_bucket_rows([b for item in buckets for b in item], table)
+    candidates = list(rows.values())
+    return [_best_near_duplicate(sig, bkts, candidates, threshold) for sig, bkts in zip(signatures, buckets)]
+
+
+def find_near_duplicates(texts, threshold: float = NEAR_DUPLICATE_THRESHOLD) -> list:
+    """
+    Closest stored near-duplicate for each text.
+
+    One bucket probe covers all texts; only rows sharing an LSH bucket are
+    compared, by estimated Jaccard similarity of their MinHash signatures.
+    Exact duplicates match with similarity 1.0.
+
+    Args:
+        texts: Resume texts
+        threshold: Minimum estimated Jaccard similarity
+
+    Returns:
+        List with one entry per text: {"id", "filename", "signals",
+        "duplicate_of", "similarity"} for the best stored match, or None
+    """
+    texts = list(texts)
+    signatures = [minhash_signature(text) for text in texts]
+    buckets = [lsh_buckets(sig) for sig in signatures]
+    return _match_near_duplicates(signatures, buckets, get_or_create_table(), threshold)
+
+
+def near_duplicate_clusters(threshold: float = NEAR_DUPLICATE_THRESHOLD, batch_size: int = 1000) -> list:
+    """
+    Group all stored resumes into near-duplicate clusters.
+
+    The table is streamed once (id, filename and signatures only); resumes
+    are compared only within shared LSH buckets and merged transitively.
+
+    Args:
+        threshold: Minimum estimated Jaccard similarity for a link
+        batch_size: Rows per streamed record batch
+
+    Returns:
+        List of clusters (2+ resumes each), largest first; each cluster is a
+        list of {"id", "filename"} dicts
+    """
+    ids, filenames, signatures = [], [], []
+    bucket_members = {}
+    for batch in iter_resume_batches(["id", "filename", "minhash", "lsh_buckets"], batch_size=batch_size):
+        for row in batch.to_pylist():
+            index = len(ids)
+            ids.append(row["id"])
+            filenames.append(row["filename"])
+            signatures.append(row["minhash"])
+            for bucket in row["lsh_buckets"] or []:
+                bucket_members.setdefault(bucket, []).append(index)
+
+    parent = list(range(len(ids)))
+
+    def find(i):
+        while parent[i] != i:
+            parent[i] = parent[parent[i]]
+            i = parent[i]
+        return i
+
+    checked = set()
+    for members in bucket_members.values():
+        for pos, a in enumerate(members):
+            for b in members[pos + 1:]:
+                if (a, b) in checked:
+                    continue
+                checked.add((a, b))
+                if find(a) != find(b) and estimate_jaccard(signatures[a], signatures[b]) >= threshold:
+                    parent[find(a)] = find(b)
+
+    clusters = {}
+    for index in range(len(ids)):
+        clusters.setdefault(find(index), []).append({"id": ids[index], "filename": filenames[index]})
+    return sorted((c for c in clusters.values() if len(c) > 1), key=len, reverse=True)
+
 
 # ---------- STORE ----------
-def store_resume(filename: str, text: str, signals: dict = None) -> str:
+def store_resume(filename: str, text: str, signals: dict = None, near_duplicates: str = "keep") -> str:
     """
     Store a resume in LanceDB with duplicate detection.
 
@@ -80,56 +494,298 @@ def store_resume(filename: str, text: str, signals: dict = None) -> str:
         filename: Original file name
         text: Raw resume text
         signals: Pre-extracted structured signals (dict). If None, stored empty for lazy extraction.
+        near_duplicates: What to do with near-duplicates, see store_resumes_batch()
 
     Returns:
         "stored" if new resume was added
         "duplicate" if resume content already exists
+        "linked" / "near_duplicate" for near-duplicates (link / skip mode)
+    """
+    return store_resumes_batch([(filename, text, signals)], near_duplicates=near_duplicates)[0]
+
+
+def store_resumes_batch(items, near_duplicates: str = "keep",
+                        threshold: float = NEAR_DUPLICATE_THRESHOLD, table=None) -> list:
+    """
+    Store many resumes with a single duplicate probe and a single write.
+
+    Fingerprints are computed once, checked against the table in one bulk
+    lookup and against earlier items of the same batch, and all new rows are
+    appended with one `table.add` (one Lance fragment per batch).
+
+    Near-duplicates (same candidate, slightly different text) are handled
+    per `near_duplicates`:
+        "keep": store them like any other resume
+        "link": store them with duplicate_of set to the original's id and,
+            when no signals were given, the original's signals
+        "skip": do not store them
+
+    Args:
+        items: Iterable of (filename, text, signals) tuples. signals may be None.
+        near_duplicates: "keep", "link" or "skip"
+        threshold: Minimum estimated Jaccard similarity for a near-duplicate
+        table: Another table with resume_schema to write to (e.g. a reindex
+            staging table). Default: the shared resumes table. Other tables
+            bypass the fingerprint cache, search index upkeep and the skill
+            index.
+
+    Returns:
+        List of "stored" / "duplicate" / "linked" / "near_duplicate", one per
+        item, in input order
+
+    Raises:
+        ValueError: If near_duplicates is not a known mode
     """
+    if near_duplicates not in NEAR_DUPLICATE_MODES:
+        raise ValueError(f"near_duplicates must be one of {', '.join(NEAR_DUPLICATE_MODES)}")
+
+    items = list(items)
+    if not items:
+        return []
+
+    live = table is None
+    table = get_or_create_table() if live else table
+    fps = [generate_fingerprint(text) for _, text, _ in items]
+    existing = lookup_fingerprints(fps, table) if live else _query_fingerprints(list(dict.fromkeys(fps)), table)
+    signatures = [minhash_signature(text) for _, text, _ in items]
+    buckets = [lsh_buckets(sig) for sig in signatures]
+    check_near = near_duplicates != "keep"
+    stored_matches = (
+        _match_near_duplicates(signatures, buckets, table, threshold) if check_near else [None] * len(items)
+    )
+
+    statuses = []
+    new_rows = []
+    cache_rows = {}
+    for (filename, text, signals), fp, sig, bkts, match in zip(items, fps, signatures, buckets, stored_matches):
+        if existing.get(fp) is not None or fp in cache_rows:
+            statuses.append("duplicate")
+            continue
+
+        if check_near and match is None:
+            # Near-duplicates of resumes earlier in this batch
+            match = _best_near_duplicate(sig, bkts, new_rows, threshold)
+        if match is not None and near_duplicates == "skip":
+            statuses.append("near_duplicate")
+            continue
+
+        row_id = str(uuid4())
+        signals_json = json.dumps(signals) if signals else ""
+        duplicate_of = None
+        if match is not None:
+            duplicate_of = match["duplicate_of"] or match["id"]
+            signals_json = signals_json or match["signals"] or ""
+        new_rows.append({
+            "id": row_id,
+            "filename": filename,
+            "text": text,
+            "fingerprint": fp,
+            "signals": signals_json,
+            **signal_columns(_parse_signals(signals_json)),
+            "minhash": sig,
+            "lsh_buckets": bkts,
+            "duplicate_of": duplicate_of,
+            "sections": dump_sections(segment_sections(text)),
+        })
+        cache_rows[fp] = {"id": row_id, "signals": signals_json}
+        statuses.append("linked" if duplicate_of else "stored")
+
+    if new_rows:
+        embeddings = embed_texts([row["text"] for row in new_rows])
+        for row, embedding in zip(new_rows, embeddings):
+            row["embedding"] = embedding
+        previous_version = table.version
+        table.add(pa.Table.from_pylist(new_rows, schema=resume_schema))
+        if live:
+            _record_appended_fingerprints(previous_version, table, cache_rows)
+            _maintain_indices(table)
+            _index_skills({row["id"]: row["skills"] for row in new_rows if row["skills"]})
+    return statuses
+
+
+def _index_skills(skills_by_id: dict, replace: bool = False):
+    """Keep the resume_skills inverted index in step with the typed `skills` column."""
+    from services.db.skill_index import index_resume_skills
+
+    index_resume_skills(skills_by_id, replace=replace)
+
+
+def _maintain_indices(table):
+    """Keep the search indices current after an append (cheap checks only)."""
+    maintain_text_index(table)
+    if vector_index_due(table):
+        from services.db.maintenance import schedule_vector_index_rebuild
+
+        schedule_vector_index_rebuild(table)
+
+
+# ---------- TABLE SWAP ----------
+# Rows per batch streamed from a staging table into the resumes table.
+SWAP_BATCH_SIZE = 1000
+
+
+def create_staging_table(name: str):
+    """Empty table with resume_schema (current schema version) for bulk rebuilds."""
+    table = db.create_table(name, schema=resume_schema, mode="overwrite")
+    set_schema_version(table, SCHEMA_VERSION)
+    return table
+
+
+def swap_in_table(source) -> int:
+    """
+    Replace every row of the resumes table with the rows of `source`.
+
+    The rows are streamed into one overwrite commit, so readers see either
+    the old or the new table, never a mix (the old version stays restorable
+    until maintenance prunes it). Afterwards the shared handle and caches
+    are reset and every index, including resume_skills, is rebuilt.
+
+    Args:
+        source: Open table with resume_schema (e.g. from create_staging_table())
+
+    Returns:
+        Number of rows in the swapped-in table
+    """
+    live = get_or_create_table()
+    live.add(source.search().limit(None).to_batches(SWAP_BATCH_SIZE), mode="overwrite")
+    set_schema_version(live, SCHEMA_VERSION)
+
+    _table_handle.invalidate()
+    _reset_table_state()
+    live = get_or_create_table()
+    rows = live.count_rows()
+    if rows:
+        ensure_fingerprint_index(live)
+        ensure_near_duplicate_index(live)
+        ensure_signal_indices(live)
+        _maintain_indices(live)
+
+    from services.db.skill_index import rebuild_skill_index
+    rebuild_skill_index(live)
+    return rows
+
+
+# ---------- FETCH BY ID ----------
+def get_resumes_by_ids(ids, columns=None) -> dict:
+    """
+    Fetch specific resumes with a projected `id IN (...)` read.
+
+    Args:
+        ids: Iterable of resume ids
+        columns: Columns to return (default: id, filename, text)
+
+    Returns:
+        Dict mapping id -> row dict for the ids that exist
+    """
+    ids = list(dict.fromkeys(ids))
+    if not ids:
+        return {}
+
+    columns = list(columns or ["id", "filename", "text"])
+    if "id" not in columns:
+        columns.append("id")
+
     table = get_or_create_table()
-    fp = generate_fingerprint(text)
+    rows = {}
+    for start in range(0, len(ids), IN_QUERY_CHUNK):
+        chunk = ids[start:start + IN_QUERY_CHUNK]
+        in_list = ", ".join(_sql_quote(item_id) for item_id in chunk)
+        for row in (
+            table.search()
+            .where(f"id IN ({in_list})")
+            .select(columns)
+            .limit(len(chunk))
+            .to_list()
+        ):
+            rows[row["id"]] = row
+    return rows
 
-    # Check for duplicate fingerprint
-    df = table.to_pandas()
-    if "fingerprint" in df.columns and not df.empty:
-        if fp in df["fingerprint"].values:
-            return "duplicate"
 
-    # Serialize signals to JSON string (empty string if not provided)
-    signals_json = json.dumps(signals) if signals else ""
+# ---------- STREAMING READ ----------
+def iter_resume_batches(columns, batch_size: int = 1000, where: str = None):
+    """
+    Stream the resumes table as Arrow record batches.
 
-    table.add([{
-        "id": str(uuid4()),
-        "filename": filename,
-        "text": text,
-        "fingerprint": fp,
-        "signals": signals_json
-    }])
-    return "stored"
+    Args:
+        columns: Columns to read (projection pushed down to Lance)
+        batch_size: Max rows per batch
+        where: Optional SQL filter
 
+    Returns:
+        pyarrow.RecordBatchReader
+    """
+    builder = get_or_create_table().search().select(list(columns)).limit(None)
+    if where:
+        builder = builder.where(where)
+    return builder.to_batches(batch_size)
 
-# ---------- RETRIEVE CACHED SIGNALS ----------
-def get_cached_signals(text: str):
+
+# ---------- SEMANTIC SEARCH ----------
+def _vector_index_name(table):
+    for index in table.list_indices():
+        if "embedding" in index.columns:
+            return index.name
+    return None
+
+
+def vector_index_due(table) -> str:
     """
-    Retrieve cached signals for a resume by its text fingerprint.
+    Why the IVF-PQ index on `embedding` should be (re)trained ("" = it is current).
+
+    Cheap enough for the write path: a row count and index statistics, no
+    data is read. The index is due once the table reaches
+    VECTOR_INDEX_MIN_ROWS, and again when rows appended since the last build
+    exceed VECTOR_INDEX_REBUILD_FRACTION of the indexed rows, so the IVF
+    partitions keep tracking the data. The retrain itself runs in
+    services/db/maintenance.py.
+    """
+    num_rows = table.count_rows()
+    if num_rows < VECTOR_INDEX_MIN_ROWS:
+        return ""
+    index_name = _vector_index_name(table)
+    if index_name is None:
+        return f"no vector index at {num_rows} rows"
+    stats = table.index_stats(index_name)
+    if stats.num_unindexed_rows > VECTOR_INDEX_REBUILD_FRACTION * stats.num_indexed_rows:
+        return f"{stats.num_unindexed_rows} unindexed embeddings"
+    return ""
+
+
+def search_resumes(query: str, k: int = 10, filters: str = None) -> list:
+    """
+    Semantic top-k search over stored resumes.
 
     Args:
-        text: Raw resume text
+        query: Free-text query (skills, role, experience...)
+        k: Number of results
+        filters: Optional SQL `where` clause applied before the vector search,
+            e.g. "filename LIKE '%.pdf'"
 
     Returns:
-        Parsed signals dict if cached, None if not available
+        List of {"id", "filename", "distance"} dicts, closest first
+        (cosine distance, 0 = identical direction)
     """
     table = get_or_create_table()
-    fp = generate_fingerprint(text)
-    df = table.to_pandas()
+    builder = (
+        table.search(embed_texts([query])[0], vector_column_name="embedding")
+        .distance_type("cosine")
+        .select(["id", "filename", "_distance"])
+        .limit(k)
+    )
+    if filters:
+        builder = builder.where(filters, prefilter=True)
+    if _vector_index_name(table):
+        builder = builder.nprobes(20).refine_factor(5)
 
-    if df.empty or "fingerprint" not in df.columns:
-        return None
+    return [
+        {"id": row["id"], "filename": row["filename"], "distance": row["_distance"]}
+        for row in builder.to_list()
+    ]
 
-    match = df[df["fingerprint"] == fp]
-    if match.empty:
-        return None
 
-    signals_json = match.iloc[0].get("signals", "")
+# ---------- RETRIEVE CACHED SIGNALS ----------
+def _parse_signals(signals_json):
+    """Parse a stored signals JSON string; None if empty or invalid."""
     if not signals_json or signals_json.strip() == "":
         return None
 
@@ -139,12 +795,106 @@ def get_cached_signals(text: str):
         return None
 
 
+def get_cached_signals(text: str):
+    """
+    Retrieve cached signals for a resume by its text fingerprint.
+
+    Args:
+        text: Raw resume text
+
+    Returns:
+        Parsed signals dict if cached, None if not available
+    """
+    row = lookup_fingerprint(generate_fingerprint(text))
+    if row is None:
+        return None
+    return _parse_signals(row.get("signals", ""))
+
+
+def get_cached_signals_bulk(texts) -> dict:
+    """
+    Retrieve cached signals for many resumes with one projected lookup.
+
+    Args:
+        texts: Iterable of raw resume texts
+
+    Returns:
+        Dict mapping resume text -> parsed signals dict. Texts that are not
+        stored, or stored without signals, are left out.
+    """
+    fps = {text: generate_fingerprint(text) for text in texts}
+    rows = lookup_fingerprints(fps.values())
+
+    cached = {}
+    for text, fp in fps.items():
+        row = rows.get(fp)
+        signals = _parse_signals(row.get("signals", "")) if row else None
+        if signals is not None:
+            cached[text] = signals
+    return cached
+
+
+# ---------- SIGNAL BACKFILL ----------
+MISSING_SIGNALS_FILTER = "signals IS NULL OR signals = ''"
+
+
+def count_missing_signals() -> int:
+    """Number of stored resumes whose signals were never extracted."""
+    return get_or_create_table().count_rows(MISSING_SIGNALS_FILTER)
+
+
+def get_ids_missing_signals(limit: int = None) -> list:
+    """Ids of stored resumes without signals (projected `id` read only)."""
+    table = get_or_create_table()
+    builder = (
+        table.search()
+        .where(MISSING_SIGNALS_FILTER)
+        .select(["id"])
+        .limit(limit if limit is not None else max(table.count_rows(), 1))
+    )
+    return [row_id for batch in builder.to_batches() for row_id in batch.column("id").to_pylist()]
+
+
+def update_signals(signals_by_id: dict) -> int:
+    """
+    Write extracted signals (and their typed columns) back by id.
+
+    All rows go out in one merge_insert on `id`; ids that no longer exist
+    are ignored.
+
+    Args:
+        signals_by_id: Dict mapping resume id -> signals dict
+
+    Returns:
+        Number of rows updated
+    """
+    if not signals_by_id:
+        return 0
+
+    rows = []
+    for row_id, signals in signals_by_id.items():
+        rows.append({
+            "id": row_id,
+            "signals": json.dumps(signals) if signals else "",
+            **signal_columns(signals or None),
+        })
+    update_schema = pa.schema([resume_schema.field(name) for name in ["id", "signals", *SIGNAL_COLUMNS]])
+
+    table = get_or_create_table()
+    result = table.merge_insert("id").when_matched_update_all().execute(
+        pa.Table.from_pylist(rows, schema=update_schema)
+    )
+    _index_skills({row["id"]: row["skills"] or [] for row in rows}, replace=True)
+    return result.num_updated_rows
+
+
 # ---------- SAFE SIGNAL EXTRACTION ----------
-def extract_signals_if_llm_ready(text: str):
+def extract_signals_if_llm_ready(text: str, sections=None):
     """
     Attempt to extract structured signals via LLM at upload time.
     Returns the signals dict if LLM is configured, None otherwise.
     This ensures uploads work even without an LLM key configured.
+    `sections` (segment_sections() output from parsing) spares re-segmenting.
     """
     try:
         import streamlit as st
@@ -155,7 +905,188 @@ def extract_signals_if_llm_ready(text: str):
 
     try:
         from services.resume_enricher import extract_resume_signals
-        return extract_resume_signals(text)
+        return extract_resume_signals(text, sections=sections)
     except Exception:
         # LLM call failed — don't block the upload
         return None
+
+
+# ---------- KEYWORD SEARCH ----------
+_KEYWORD_TOKEN_RE = re.compile(r'([+-]?)"([^"]*)"|(\S+)')
+
+
+def _text_index_name(table):
+    for index in table.list_indices():
+        if "text" in index.columns:
+            return index.name
+    return None
+
+
+def maintain_text_index(table=None) -> bool:
+    """
+    Create the BM25 full-text index on `text`, or fold new rows into it.
+
+    Rows appended after the last index update are still found (LanceDB scans
+    unindexed fragments); once FTS_OPTIMIZE_MIN_UNINDEXED of them accumulate,
+    optimize() merges them into the existing index incrementally.
+
+    Returns:
+        True if the index was created or updated
+    """
+    table = table if table is not None else get_or_create_table()
+    index_name = _text_index_name(table)
+    if index_name is None:
+        table.create_fts_index("text", with_position=True)
+        return True
+
+    if table.index_stats(index_name).num_unindexed_rows >= FTS_OPTIMIZE_MIN_UNINDEXED:
+        table.optimize()
+        return True
+    return False
+
+
+def parse_keyword_query(query: str):
+    """
+    Turn a recruiter keyword query into a LanceDB full-text query.
+
+    Syntax:
+        terraform eks           either term, ranked by BM25 (both rank highest)
+        "site reliability"      exact phrase
+        +kubernetes / -java     term must / must not appear
+        aws AND terraform       both required
+        python NOT django       exclude the term after NOT
+        a OR b                  either (same as a plain space)
+
+    Returns:
+        A FullTextQuery, or None if the query has no positive term
+    """
+    clauses = []
+    pending = None
+    for match in _KEYWORD_TOKEN_RE.finditer(query):
+        prefix, phrase, word = match.groups()
+        if word in ("AND", "OR", "NOT"):
+            if word == "AND":
+                if clauses and clauses[-1][0] == Occur.SHOULD:
+                    clauses[-1][0] = Occur.MUST
+                pending = Occur.MUST
+            elif word == "NOT":
+                pending = Occur.MUST_NOT
+            else:
+                pending = None
+            continue
+
+        if word is not None and len(word) > 1 and word[0] in "+-":
+            prefix, word = word[0], word[1:]
+        term = phrase if phrase is not None else word
+        if not term.strip():
+            continue
+
+        occur = {"+": Occur.MUST, "-": Occur.MUST_NOT}.get(prefix, pending or Occur.SHOULD)
+        sub_query = PhraseQuery(term, "text") if phrase is not None else MatchQuery(term, "text")
+        clauses.append([occur, sub_query])
+        pending = None
+
+    if not any(occur != Occur.MUST_NOT for occur, _ in clauses):
+        return None
+    if len(clauses) == 1:
+        return clauses[0][1]
+    return BooleanQuery([(occur, sub_query) for occur, sub_query in clauses])
+
+
+def keyword_search(query: str, k: int = 10, filters: str = None) -> list:
+    """
+    BM25 keyword search over the full resume text (no LLM involved).
+
+    Args:
+        query: Keyword query, see parse_keyword_query() for the syntax
+        k: Number of results
+        filters: Optional SQL `where` clause applied before ranking
+
+    Returns:
+        List of {"id", "filename", "score"} dicts, best match first
+    """
+    fts_query = parse_keyword_query(query)
+    if fts_query is None:
+        return []
+
+    table = get_or_create_table()
+    if _text_index_name(table) is None:
+        maintain_text_index(table)
+
+    builder = table.search(fts_query).select(["id", "filename", "_score"]).limit(k)
+    if filters:
+        builder = builder.where(filters, prefilter=True)
+
+    return [
+        {"id": row["id"], "filename": row["filename"], "score": row["_score"]}
+        for row in builder.to_list()
+    ]
+
+
+# ---------- STRUCTURED FILTERS ----------
+def ensure_signal_indices(table):
+    """Scalar indices backing find_candidate_ids() filters."""
+    _ensure_scalar_index(table, "total_years", "BTREE")
+    _ensure_scalar_index(table, "most_recent_role_year", "BTREE")
+    _ensure_scalar_index(table, "skills", "LABEL_LIST")
+    _ensure_scalar_index(table, "domains", "LABEL_LIST")
+
+
+def _sql_list(values) -> str:
+    return "[" + ", ".join(_sql_quote(v.strip().lower()) for v in values) + "]"
+
+
+def build_signal_filter(min_years=None, skills_all=None, skills_any=None,
+                        domains_any=None, recent_since=None, min_outcomes=None,
+                        min_projects=None) -> str:
+    """
+    Build a LanceDB `where` clause over the typed signal columns.
+
+    Skill and domain names are matched case-insensitively but exactly
+    ("kubernetes", not "k8s"). Resumes without signals never match.
+
+    Returns:
+        SQL expression, or "" if no criteria were given
+    """
+    clauses = []
+    if min_years is not None:
+        clauses.append(f"total_years >= {float(min_years)}")
+    if recent_since is not None:
+        clauses.append(f"most_recent_role_year >= {int(recent_since)}")
+    if skills_all:
+        clauses.append(f"array_has_all(skills, {_sql_list(skills_all)})")
+    if skills_any:
+        clauses.append(f"array_has_any(skills, {_sql_list(skills_any)})")
+    if domains_any:
+        clauses.append(f"array_has_any(domains, {_sql_list(domains_any)})")
+    if min_outcomes is not None:
+        clauses.append(f"outcome_count >= {int(min_outcomes)}")
+    if min_projects is not None:
+        clauses.append(f"project_count >= {int(min_projects)}")
+    return " AND ".join(clauses)
+
+
+def find_candidate_ids(limit: int = None, **criteria) -> list:
+    """
+    Ids of resumes matching structured criteria, filtered inside LanceDB.
+
+    No signals JSON is read or parsed; see build_signal_filter() for the
+    accepted criteria, e.g.
+        find_candidate_ids(min_years=5, skills_all=["Kubernetes"], recent_since=2025)
+
+    Args:
+        limit: Max ids to return (default: all matches)
+        **criteria: Keyword arguments of build_signal_filter()
+
+    Returns:
+        List of resume ids
+    """
+    where = build_signal_filter(**criteria)
+    table = get_or_create_table()
+    ensure_signal_indices(table)
+
+    builder = table.search().select(["id"])
+    if where:
+        builder = builder.where(where)
+    builder = builder.limit(limit if limit is not None else max(table.count_rows(), 1))
+    return [batch_id for batch in builder.to_batches() for batch_id in batch.column("id").to_pylist()]
@@ -0,0 +1,275 @@
+"""
+LanceDB maintenance for the `resumes` and `resume_skills` tables.
+
+Every ingest commit adds a fragment and a version to `resumes`, and every
+store or signal update adds postings to `resume_skills`. This module watches
+each table's fragment count and version history and, past the thresholds
+below, runs LanceDB's optimize(): fragment compaction, index optimization
+(new rows are folded into the fingerprint, FTS, vector, signal, LSH and
+skill indices) and cleanup of versions older than the retention window.
+Each run also drops extraction cache entries left by older parser versions.
+
+The IVF-PQ vector index is retrained here too, never inline in a write:
+maintenance runs retrain it when vector_index_due(), and the write path,
+which only runs that cheap check, hands the retrain to a background thread
+(schedule_vector_index_rebuild()).
+
+CLI:
+    python -m services.db.maintenance                  # run if thresholds are exceeded
+    python -m services.db.maintenance --force          # run now
+    python -m services.db.maintenance --every 3600     # check every hour
+    python -m services.db.maintenance --status         # print health only
+"""
+
+import argparse
+import math
+import threading
+import time
+from datetime import timedelta
+from typing import Dict
+
+from services.db.lancedb_client import get_or_create_table, vector_index_due
+from services.db.skill_index import SKILLS_TABLE, get_skills_table
+from services.embedder import EMBEDDING_DIM
+from services.extraction_cache import purge_stale
+
+# Thresholds that trigger maintenance
+MAX_FRAGMENTS = 32
+MAX_SMALL_FRAGMENTS = 16
+MAX_VERSIONS = 100
+
+# Versions younger than this are kept (readers may still be pinned to them)
+DEFAULT_RETENTION = timedelta(days=1)
+
+
+# Column read by the projected scan that measures each table's latency
+SCAN_COLUMNS = {SKILLS_TABLE: "skill"}
+
+
+def maintained_tables() -> list:
+    """Every table this module maintains (opened on demand)."""
+    return [get_or_create_table(), get_skills_table()]
+
+
+def measure_scan_latency(table) -> float:
+    """Milliseconds for a projected full scan of one column (fingerprint for resumes)."""
+    column = SCAN_COLUMNS.get(table.name, "fingerprint")
+    start = time.perf_counter()
+    table.search().select([column]).limit(max(table.count_rows(), 1)).to_arrow()
+    return round((time.perf_counter() - start) * 1000, 2)
+
+
+def table_health(table=None, with_latency: bool = True) -> dict:
+    """
+    Fragment, version and index statistics for one table (default: resumes).
+
+    Returns:
+        Dict with num_rows, num_fragments, num_small_fragments, num_versions,
+        unindexed_rows (per index), vector_index_due (reason, "" if current)
+        and, if requested, scan_ms
+    """
+    table = table if table is not None else get_or_create_table()
+    stats = table.stats()
+    fragments = stats["fragment_stats"]
+    health = {
+        "num_rows": stats["num_rows"],
+        "num_fragments": fragments["num_fragments"],
+        "num_small_fragments": fragments["num_small_fragments"],
+        "num_versions": len(table.list_versions()),
+        "unindexed_rows": {
+            index.name: table.index_stats(index.name).num_unindexed_rows
+            for index in table.list_indices()
+        },
+        "vector_index_due": vector_index_due(table) if "embedding" in table.schema.names else "",
+    }
+    if with_latency:
+        health["scan_ms"] = measure_scan_latency(table)
+    return health
+
+
+def needs_maintenance(health: dict) -> list:
+    """Reasons the table should be maintained (empty list = healthy)."""
+    reasons = []
+    if health["num_fragments"] > MAX_FRAGMENTS:
+        reasons.append(f"{health['num_fragments']} fragments > {MAX_FRAGMENTS}")
+    if health["num_small_fragments"] > MAX_SMALL_FRAGMENTS:
+        reasons.append(f"{health['num_small_fragments']} small fragments > {MAX_SMALL_FRAGMENTS}")
+    if health["num_versions"] > MAX_VERSIONS:
+        reasons.append(f"{health['num_versions']} versions > {MAX_VERSIONS}")
+    if health.get("vector_index_due"):
+        reasons.append(health["vector_index_due"])
+    return reasons
+
+
+def run_maintenance(table=None, force: bool = False, retention: timedelta = DEFAULT_RETENTION) -> dict:
+    """
+    Retrain the vector index, compact, optimize indices and prune old versions if needed.
+
+    Args:
+        table: Open table (default: resumes, opened on demand)
+        force: Run even if no threshold is exceeded
+        retention: Keep versions younger than this
+
+    Returns:
+        Dict with ran (bool), reasons, vector_index_rebuilt, before and after
+        health snapshots (after is None if nothing ran) and duration_s
+    """
+    table = table if table is not None else get_or_create_table()
+    before = table_health(table)
+    reasons = needs_maintenance(before) or (["forced"] if force else [])
+    if not reasons:
+        return {"ran": False, "reasons": [], "vector_index_rebuilt": False, "before": before, "after": None,
+                "duration_s": 0.0}
+
+    start = time.perf_counter()
+    # Before optimize(), which folds new rows into the old partitions
+    rebuilt = bool(before["vector_index_due"]) and rebuild_vector_index(table)
+    table.optimize(cleanup_older_than=retention)
+    duration = round(time.perf_counter() - start, 2)
+
+    return {
+        "ran": True,
+        "reasons": reasons,
+        "vector_index_rebuilt": rebuilt,
+        "before": before,
+        "after": table_health(table),
+        "duration_s": duration,
+    }
+
+
+def run_all_maintenance(force: bool = False, retention: timedelta = DEFAULT_RETENTION) -> Dict[str, dict]:
+    """run_maintenance() for every maintained table, keyed by table name."""
+    return {
+        table.name: run_maintenance(table, force=force, retention=retention)
+        for table in maintained_tables()
+    }
+
+
+# ---------- VECTOR INDEX ----------
+_vector_rebuild_lock = threading.Lock()
+_vector_rebuild = None  # background retrain started from the write path
+
+
+def rebuild_vector_index(table=None, force: bool = False) -> bool:
+    """
+    Train the IVF-PQ index on `embedding` if vector_index_due() says so.
+
+    Args:
+        table: Open resumes table (opened on demand if omitted)
+        force: Rebuild regardless of thresholds (still needs 256+ rows to train PQ)
+
+    Returns:
+        True if an index was (re)built
+    """
+    table = table if table is not None else get_or_create_table()
+    if force:
+        if table.count_rows() < 256:
+            return False
+    elif not vector_index_due(table):
+        return False
+
+    table.create_index(
+        metric="cosine",
+        num_partitions=max(1, int(math.sqrt(table.count_rows()))),
+        num_sub_vectors=EMBEDDING_DIM // 16,
+        vector_column_name="embedding",
+        index_type="IVF_PQ",
+        replace=True,
+    )
+    return True
+
+
+def _rebuild_in_background(table):
+    try:
+        rebuild_vector_index(table)
+    except Exception as e:
+        print(f"⚠️ Vector index rebuild failed: {e}")
+
+
+def schedule_vector_index_rebuild(table) -> bool:
+    """
+    Retrain the vector index on a background thread, one rebuild at a time.
+
+    Appends keep committing while it trains; rows the index does not cover
+    yet are still found by LanceDB's flat scan of unindexed fragments.
+
+    Returns:
+        False if a rebuild was already running
+    """
+    global _vector_rebuild
+    with _vector_rebuild_lock:
+        if _vector_rebuild is not None and _vector_rebuild.is_alive():
+            return False
+        _vector_rebuild = threading.Thread(
+            target=_rebuild_in_background, args=(table,), name="vector-index-rebuild", daemon=True,
+        )
+        _vector_rebuild.start()
+        return True
+
+
+def wait_for_vector_index(timeout: float = None):
+    """Block until the background rebuild, if one is running, has finished."""
+    thread = _vector_rebuild
+    if thread is not None:
+        thread.join(timeout)
+
+
+def purge_extraction_cache() -> int:
+    """Delete extraction cache entries from other parser versions; returns rows removed."""
+    from services.resume_parser import PARSER_VERSION
+
+    return purge_stale(PARSER_VERSION)
+
+
+def _print_health(label: str, health: dict):
+    print(
+        f"{label}: {health['num_rows']} rows, {health['num_fragments']} fragments "
+        f"({health['num_small_fragments']} small), {health['num_versions']} versions, "
+        f"scan {health.get('scan_ms', '?')} ms"
+    )
+    for name, unindexed in health["unindexed_rows"].items():
+        if unindexed:
+            print(f"  {name}: {unindexed} unindexed rows")
+
+
+def _run_once(force: bool, retention: timedelta):
+    for name, result in run_all_maintenance(force=force, retention=retention).items():
+        print(f"📦 {name}")
+        _print_health("Before", result["before"])
+        if not result["ran"]:
+            print("✅ Table is healthy, nothing to do.")
+            continue
+        print(f"🧹 Maintenance ran ({', '.join(result['reasons'])}) in {result['duration_s']}s")
+        _print_health("After ", result["after"])
+    removed = purge_extraction_cache()
+    if removed:
+        print(f"🧹 Extraction cache: removed {removed} entries from older parser versions")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Compact and clean up the LanceDB resume tables.")
+    parser.add_argument("--force", action="store_true", help="run even if thresholds are not exceeded")
+    parser.add_argument("--status", action="store_true", help="print table health and exit")
+    parser.add_argument("--every", type=int, metavar="SECONDS", help="keep running, checking every SECONDS")
+    parser.add_argument("--retention-hours", type=float, default=DEFAULT_RETENTION.total_seconds() / 3600,
+                        help="keep versions younger than this (default: %(default)s)")
+    args = parser.parse_args(argv)
+
+    if args.status:
+        for table in maintained_tables():
+            health = table_health(table)
+            print(f"📦 {table.name}")
+            _print_health("Status", health)
+            reasons = needs_maintenance(health)
+            print("Needs maintenance: " + (", ".join(reasons) if reasons else "no"))
+        return
+
+    retention = timedelta(hours=args.retention_hours)
+    _run_once(args.force, retention)
+    while args.every:
+        time.sleep(args.every)
+        _run_once(args.force, retention)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,206 @@
+"""
+In-place schema migrations for the LanceDB `resumes` table.
+
+Each migration only adds what is missing: new columns are added as
+metadata-only null columns (Lance add_columns) and computed values are
+backfilled in small record batches written back with merge_insert on `id`.
+Nothing ever loads or rewrites the whole table, and every batch is its own
+commit, so an interrupted migration simply resumes from the rows that are
+still NULL.
+
+The applied schema version is stored in the metadata of the `id` field.
+"""
+
+import pyarrow as pa
+
+SCHEMA_VERSION_KEY = "schema_version"
+
+# Rows read, computed and merged back per backfill step.
+BACKFILL_BATCH_SIZE = 1000
+
+
+def get_schema_version(table) -> int:
+    """Schema version recorded on the table (1 = original id/filename/text table)."""
+    metadata = table.schema.field("id").metadata or {}
+    return int(metadata.get(SCHEMA_VERSION_KEY.encode(), b"1"))
+
+
+def set_schema_version(table, version: int):
+    """Record the applied schema version in the table metadata."""
+    table.replace_field_metadata("id", {SCHEMA_VERSION_KEY: str(version)})
+
+
+def add_missing_column(table, field: pa.Field) -> bool:
+    """Add `field` as an all-null column if the table lacks it (metadata-only)."""
+    if field.name in table.schema.names:
+        return False
+    table.add_columns(field)
+    return True
+
+
+def backfill_columns(table, where: str, source_columns, compute, batch_size: int = None) -> int:
+    """
+    Recompute columns for rows matching `where`, batch by batch.
+
+    `compute` must produce values that make the rows stop matching `where`,
+    otherwise the backfill never finishes.
+
+    Args:
+        table: Open LanceDB table
+        where: Filter selecting rows that still need values
+        source_columns: Columns `compute` needs (besides `id`)
+        compute: Function(list of row dicts) -> {column: list of values}
+        batch_size: Rows per read/merge round trip (default BACKFILL_BATCH_SIZE)
+
+    Returns:
+        Number of rows filled
+    """
+    batch_size = batch_size or BACKFILL_BATCH_SIZE
+    filled = 0
+    while True:
+        rows = (
+            table.search()
+            .where(where)
+            .select(["id", *source_columns])
+            .limit(batch_size)
+            .to_list()
+        )
+        if not rows:
+            return filled
+
+        columns = {"id": pa.array([row["id"] for row in rows], type=pa.string())}
+        for column, values in compute(rows).items():
+            columns[column] = pa.array(values, type=table.schema.field(column).type)
+        table.merge_insert("id").when_matched_update_all().execute(pa.table(columns))
+        filled += len(rows)
+
+
+def backfill_column(table, column: str, source_columns, compute, batch_size: int = None) -> int:
+    """
+    Fill NULLs in `column` batch by batch.
+
+    Args:
+        table: Open LanceDB table
+        column: Column to fill
+        source_columns: Columns `compute` needs (besides `id`)
+        compute: Function(list of row dicts) -> list of values for `column`
+        batch_size: Rows per read/merge round trip (default BACKFILL_BATCH_SIZE)
+
+    Returns:
+        Number of rows filled
+    """
+    return backfill_columns(
+        table, f"{column} IS NULL", source_columns,
+        lambda rows: {column: compute(rows)}, batch_size=batch_size,
+    )
+
+
+# ---------- MIGRATION STEPS ----------
+def _migrate_to_v2(table, schema):
+    """fingerprint (backfilled from text) + signals (NULL = not yet extracted)."""
+    from services.db.lancedb_client import generate_fingerprint
+
+    add_missing_column(table, schema.field("fingerprint"))
+    add_missing_column(table, schema.field("signals"))
+    backfill_column(
+        table, "fingerprint", ["text"],
+        lambda rows: [generate_fingerprint(row["text"] or "") for row in rows],
+    )
+
+
+def _migrate_to_v3(table, schema):
+    """embedding (backfilled with the configured embedder)."""
+    from services.embedder import embed_texts
+
+    add_missing_column(table, schema.field("embedding"))
+    backfill_column(
+        table, "embedding", ["text"],
+        lambda rows: embed_texts([row["text"] or "" for row in rows]),
+    )
+
+
+def _migrate_to_v4(table, schema):
+    """Typed signal columns (backfilled from the signals JSON where present)."""
+    from services.db.lancedb_client import SIGNAL_COLUMNS, _parse_signals, signal_columns
+
+    for column in SIGNAL_COLUMNS:
+        add_missing_column(table, schema.field(column))
+
+    def compute(rows):
+        # Unparseable signals still get empty lists so the row is marked done
+        derived = [signal_columns(_parse_signals(row["signals"]) or {}) for row in rows]
+        return {column: [d[column] for d in derived] for column in SIGNAL_COLUMNS}
+
+    backfill_columns(
+        table, "skills IS NULL AND signals IS NOT NULL AND signals != ''",
+        ["signals"], compute,
+    )
+
+
+def _migrate_to_v5(table, schema):
+    """MinHash signature + LSH buckets (backfilled from text) and duplicate_of (NULL)."""
+    from services.minhash import lsh_buckets, minhash_signature
+
+    for column in ("minhash", "lsh_buckets", "duplicate_of"):
+        add_missing_column(table, schema.field(column))
+
+    def compute(rows):
+        signatures = [minhash_signature(row["text"] or "") for row in rows]
+        return {"minhash": signatures, "lsh_buckets": [lsh_buckets(sig) for sig in signatures]}
+
+    backfill_columns(table, "minhash IS NULL", ["text"], compute)
+
+
+def _migrate_to_v6(table, schema):
+    """resume_skills inverted index (posted from the typed skills column)."""
+    from services.db.skill_index import rebuild_skill_index
+
+    rebuild_skill_index(table)
+
+
+def _migrate_to_v7(table, schema):
+    """sections (backfilled by segmenting the stored text)."""
+    from services.resume_sections import dump_sections, segment_sections
+
+    add_missing_column(table, schema.field("sections"))
+    backfill_column(
+        table, "sections", ["text"],
+        lambda rows: [dump_sections(segment_sections(row["text"] or "")) for row in rows],
+    )
+
+
+# (target version, step). Steps must be idempotent: they may be re-run after
+# a crash or on tables whose version was never recorded.
+MIGRATIONS = [
+    (2, _migrate_to_v2),
+    (3, _migrate_to_v3),
+    (4, _migrate_to_v4),
+    (5, _migrate_to_v5),
+    (6, _migrate_to_v6),
+    (7, _migrate_to_v7),
+]
+
+SCHEMA_VERSION = MIGRATIONS[-1][0]
+
+
+def migrate_table(table, schema) -> int:
+    """
+    Bring `table` up to SCHEMA_VERSION in place.
+
+    Args:
+        table: Open resumes table
+        schema: Target pyarrow schema (lancedb_client.resume_schema)
+
+    Returns:
+        Number of migration steps applied
+    """
+    current = get_schema_version(table)
+    applied = 0
+    for version, step in MIGRATIONS:
+        if version <= current:
+            continue
+        print(f"🛠️ Migrating resumes table to schema v{version}...")
+        step(table, schema)
+        set_schema_version(table, version)
+        applied += 1
+    return applied
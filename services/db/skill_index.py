@@ -0,0 +1,208 @@
+"""
+Skill inverted index (`resume_skills` LanceDB table).
+
+One row per (skill term, resume id) posting, built from the typed `skills`
+column of cached signals when resumes are stored or backfilled. A JD's
+must-have skills can then be resolved to the few resumes that cover at least
+k of them with one indexed `skill IN (...)` read, before any LLM work.
+
+A resume skill is posted under its canonical name and every contiguous
+word sub-phrase ("aws lambda" -> "aws lambda", "aws", "lambda"), mirroring
+the substring match the scoring engine uses for must-have skills.
+
+Existing resumes are posted once by the schema v6 migration (or
+rebuild_skill_index()); after that ingest and signal backfill keep the
+table current.
+"""
+
+import threading
+from typing import Dict, List
+
+import pyarrow as pa
+
+from services.db import lancedb_client
+from services.embedder import tokenize
+
+SKILLS_TABLE = "resume_skills"
+
+skills_schema = pa.schema([
+    pa.field("skill", pa.string()),  # canonical skill term
+    pa.field("resume_id", pa.string()),
+])
+
+# Common spellings folded to one canonical term (applied to whole phrases).
+SKILL_ALIASES = {
+    "k8s": "kubernetes",
+    "golang": "go",
+    "js": "javascript",
+    "ts": "typescript",
+    "postgres": "postgresql",
+    "py": "python",
+    "amazon web services": "aws",
+    "google cloud platform": "gcp",
+    "ml": "machine learning",
+}
+
+# Longest skill phrase (in words) expanded into sub-phrases.
+MAX_TERM_WORDS = 5
+
+
+def canonical_skill(name: str) -> str:
+    """Lowercase, tokenized, alias-folded skill name ("" if nothing is left)."""
+    phrase = " ".join(tokenize(name or ""))
+    return SKILL_ALIASES.get(phrase, phrase)
+
+
+def skill_terms(skills) -> set:
+    """Posting terms for a resume's skill names (canonical names + word sub-phrases)."""
+    terms = set()
+    for name in skills or []:
+        words = canonical_skill(name).split()[:MAX_TERM_WORDS]
+        for size in range(1, len(words) + 1):
+            for start in range(len(words) - size + 1):
+                terms.add(canonical_skill(" ".join(words[start:start + size])))
+    terms.discard("")
+    return terms
+
+
+# ---------- TABLE ----------
+def _open_or_create_skills_table():
+    global _skill_index_ready_for
+    db = lancedb_client.db
+    if SKILLS_TABLE in db.table_names():
+        return db.open_table(SKILLS_TABLE)
+    _skill_index_ready_for = None
+    return db.create_table(SKILLS_TABLE, schema=skills_schema, mode="create")
+
+
+_skills_handle = lancedb_client.TableHandle(_open_or_create_skills_table)
+_index_lock = threading.RLock()
+
+# Connection whose resume_skills table is known to have its `skill` index.
+_skill_index_ready_for = None
+
+
+def get_skills_table():
+    """Open resume_skills table, created empty on first use."""
+    return _skills_handle.get()
+
+
+def _posting_table(skills_by_id: Dict[str, list]) -> pa.Table:
+    skills, ids = [], []
+    for resume_id, names in skills_by_id.items():
+        for term in sorted(skill_terms(names)):
+            skills.append(term)
+            ids.append(resume_id)
+    return pa.table({"skill": pa.array(skills, pa.string()), "resume_id": pa.array(ids, pa.string())})
+
+
+def _populate_from_resumes(table, resumes_table, batch_size: int = 1000) -> int:
+    """Post every resume that has extracted skills; returns postings written."""
+    written = 0
+    reader = (
+        resumes_table.search().where("skills IS NOT NULL").select(["id", "skills"])
+        .limit(None).to_batches(batch_size)
+    )
+    for batch in reader:
+        postings = _posting_table(dict(zip(batch.column("id").to_pylist(), batch.column("skills").to_pylist())))
+        if postings.num_rows:
+            table.add(postings)
+            written += postings.num_rows
+    return written
+
+
+def index_resume_skills(skills_by_id: Dict[str, list], replace: bool = False) -> int:
+    """
+    Add postings for resumes.
+
+    Args:
+        skills_by_id: Dict mapping resume id -> skill names (typed `skills` column)
+        replace: Drop existing postings of these ids first (re-extracted signals)
+
+    Returns:
+        Number of postings written
+    """
+    if not skills_by_id:
+        return 0
+    postings = _posting_table(skills_by_id)
+    with _index_lock:
+        table = get_skills_table()
+        if replace:
+            ids = list(skills_by_id)
+            for start in range(0, len(ids), lancedb_client.IN_QUERY_CHUNK):
+                chunk = ids[start:start + lancedb_client.IN_QUERY_CHUNK]
+                table.delete("resume_id IN (" + ", ".join(lancedb_client._sql_quote(i) for i in chunk) + ")")
+        if postings.num_rows:
+            table.add(postings)
+    return postings.num_rows
+
+
+def rebuild_skill_index(resumes_table=None) -> int:
+    """
+    Recreate resume_skills from the resumes table.
+
+    Args:
+        resumes_table: Open resumes table (default: the shared handle's table;
+            migrations pass the table they are upgrading)
+
+    Returns:
+        Number of postings written
+    """
+    global _skill_index_ready_for
+    resumes_table = resumes_table if resumes_table is not None else lancedb_client.get_or_create_table()
+    with _index_lock:
+        table = lancedb_client.db.create_table(SKILLS_TABLE, schema=skills_schema, mode="overwrite")
+        _skills_handle.invalidate()
+        _skill_index_ready_for = None
+        return _populate_from_resumes(table, resumes_table)
+
+
+def _ensure_skill_index(table):
+    """BTREE index on `skill` (created once there are postings)."""
+    global _skill_index_ready_for
+    if _skill_index_ready_for is lancedb_client.db:
+        return
+    if not table.count_rows():
+        return
+    if not any("skill" in index.columns for index in table.list_indices()):
+        table.create_scalar_index("skill", index_type="BTREE")
+    _skill_index_ready_for = lancedb_client.db
+
+
+# ---------- QUERY ----------
+def find_candidates_by_skills(skills, min_match: int = 1, limit: int = None) -> List[tuple]:
+    """
+    Resumes covering at least `min_match` of `skills`.
+
+    Args:
+        skills: Skill names (e.g. a JD's must-have skills)
+        min_match: Minimum number of distinct skills a resume must cover
+            (capped at the number of distinct skills given)
+        limit: Max results (default: all)
+
+    Returns:
+        List of (resume_id, matched_skill_count), most skills first
+    """
+    terms = list(dict.fromkeys(t for t in (canonical_skill(s) for s in skills or []) if t))
+    if not terms:
+        return []
+    min_match = max(1, min(min_match, len(terms)))
+
+    table = get_skills_table()
+    _ensure_skill_index(table)
+    in_list = ", ".join(lancedb_client._sql_quote(term) for term in terms)
+    postings = (
+        table.search()
+        .where(f"skill IN ({in_list})")
+        .select(["skill", "resume_id"])
+        .limit(None)
+        .to_arrow()
+    )
+    if postings.num_rows == 0:
+        return []
+
+    counts = postings.group_by("resume_id").aggregate([("skill", "count_distinct")]).to_pylist()
+    matches = [(row["resume_id"], row["skill_count_distinct"]) for row in counts
+               if row["skill_count_distinct"] >= min_match]
+    matches.sort(key=lambda item: (-item[1], item[0]))
+    return matches[:limit] if limit is not None else matches
@@ -0,0 +1,199 @@
+"""
+Fast DOCX Text Extraction
+Streams word/document.xml (plus headers and footers) straight out of the
+.docx zip with an incremental XML parser instead of building python-docx's
+full object model.
+
+Unlike reading `docx.Document(...).paragraphs`, this keeps text that resume
+templates often put in tables (skills grids, two-column layouts) and text
+boxes, in document order. Table rows become one line with cells joined by
+" | ".
+
+Benchmark against python-docx:
+    python -m services.docx_text data/raw_resumes
+"""
+
+import argparse
+import io
+import re
+import time
+import zipfile
+from pathlib import Path
+from typing import List
+from xml.etree.ElementTree import iterparse
+
+W_NS = "{http://schemas.openxmlformats.org/wordprocessingml/2006/main}"
+MC_FALLBACK = "{http://schemas.openxmlformats.org/markup-compatibility/2006}Fallback"
+
+_P, _T, _TAB, _BR, _CR = (W_NS + tag for tag in ("p", "t", "tab", "br", "cr"))
+_TBL, _TR, _TC, _PPR = (W_NS + tag for tag in ("tbl", "tr", "tc", "pPr"))
+
+_HEADER_RE = re.compile(r"word/header\d*\.xml")
+_FOOTER_RE = re.compile(r"word/footer\d*\.xml")
+
+CELL_SEPARATOR = " | "
+
+
+def _part_lines(stream) -> List[str]:
+    """Paragraph and table-row lines of one WordprocessingML part, in order."""
+    lines = []
+    sinks = [lines]      # where finished paragraphs/rows go (document or table cell)
+    rows = []            # open table rows (lists of cell texts)
+    paragraphs = []      # open paragraphs (text boxes nest inside paragraphs)
+    skip = 0             # depth inside mc:Fallback (duplicate of the mc:Choice content)
+    in_ppr = 0           # depth inside paragraph properties (w:tabs/w:tab are not text)
+
+    for event, elem in iterparse(stream, events=("start", "end")):
+        tag = elem.tag
+        if event == "start":
+            if tag == MC_FALLBACK:
+                skip += 1
+            elif skip:
+                continue
+            elif tag == _P:
+                paragraphs.append([])
+            elif tag == _PPR:
+                in_ppr += 1
+            elif tag == _TR:
+                rows.append([])
+            elif tag == _TC:
+                sinks.append([])
+            continue
+
+        if tag == MC_FALLBACK:
+            skip -= 1
+            elem.clear()
+            continue
+        if skip:
+            continue
+
+        if tag == _T:
+            if paragraphs and elem.text:
+                paragraphs[-1].append(elem.text)
+        elif tag == _TAB:
+            if paragraphs and not in_ppr:
+                paragraphs[-1].append("\t")
+        elif tag in (_BR, _CR):
+            if paragraphs:
+                paragraphs[-1].append("\n")
+        elif tag == _PPR:
+            in_ppr -= 1
+        elif tag == _P:
+            text = "".join(paragraphs.pop())
+            sinks[-1].append(text)
+            elem.clear()
+        elif tag == _TC:
+            cell = " ".join(t.strip() for t in sinks.pop() if t.strip())
+            if rows:
+                rows[-1].append(cell)
+        elif tag == _TR:
+            cells = [c for c in rows.pop() if c]
+            sinks[-1].append(CELL_SEPARATOR.join(cells))
+            elem.clear()
+        elif tag == _TBL:
+            elem.clear()
+    return lines
+
+
+def docx_lines(data: bytes) -> List[str]:
+    """
+    Text lines of a .docx: headers, body, then footers.
+
+    Repeated header/footer lines (first-page, even-page variants) are kept
+    once.
+
+    Args:
+        data: Raw .docx bytes
+
+    Returns:
+        List of lines (empty paragraphs included, like python-docx)
+
+    Raises:
+        KeyError: If the archive has no word/document.xml
+        zipfile.BadZipFile: If the data is not a zip archive
+    """
+    with zipfile.ZipFile(io.BytesIO(data)) as archive:
+        names = archive.namelist()
+        headers = sorted(n for n in names if _HEADER_RE.fullmatch(n))
+        footers = sorted(n for n in names if _FOOTER_RE.fullmatch(n))
+
+        def read(part):
+            with archive.open(part) as stream:
+                return _part_lines(stream)
+
+        body = read("word/document.xml")
+        extra_head, extra_foot = [], []
+        for parts, out in ((headers, extra_head), (footers, extra_foot)):
+            seen = set()
+            for part in parts:
+                for line in read(part):
+                    if line.strip() and line not in seen:
+                        seen.add(line)
+                        out.append(line)
+    return extra_head + body + extra_foot
+
+
+def docx_text(data: bytes) -> str:
+    """Full text of a .docx (see docx_lines())."""
+    return "\n".join(docx_lines(data))
+
+
+# ---------- BENCHMARK ----------
+def benchmark(folder, repeat: int = 5) -> dict:
+    """
+    Time docx_text() against python-docx paragraph extraction.
+
+    Args:
+        folder: Directory with .docx files
+        repeat: Passes over the folder per parser
+
+    Returns:
+        Dict with files, fast_ms and python_docx_ms (per file), speedup and
+        extra_chars (text python-docx's paragraphs miss, summed over files)
+    """
+    import docx
+
+    blobs = [p.read_bytes() for p in sorted(Path(folder).glob("*.docx"))]
+    if not blobs:
+        return {"files": 0}
+
+    def timed(fn):
+        start = time.perf_counter()
+        for _ in range(repeat):
+            for blob in blobs:
+                fn(blob)
+        return (time.perf_counter() - start) * 1000 / (repeat * len(blobs))
+
+    def python_docx(blob):
+        return "\n".join(p.text for p in docx.Document(io.BytesIO(blob)).paragraphs)
+
+    fast_ms = timed(docx_text)
+    slow_ms = timed(python_docx)
+    extra = sum(len(docx_text(b).strip()) - len(python_docx(b).strip()) for b in blobs)
+    return {
+        "files": len(blobs),
+        "fast_ms": round(fast_ms, 3),
+        "python_docx_ms": round(slow_ms, 3),
+        "speedup": round(slow_ms / fast_ms, 1) if fast_ms else None,
+        "extra_chars": extra,
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark fast DOCX extraction against python-docx.")
+    parser.add_argument("folder", nargs="?", default="data/raw_resumes", help="folder with .docx files")
+    parser.add_argument("--repeat", type=int, default=5, help="passes over the folder per parser")
+    args = parser.parse_args(argv)
+
+    result = benchmark(args.folder, args.repeat)
+    if not result["files"]:
+        print(f"❌ No .docx files in {args.folder}")
+        return
+    print(f"📄 {result['files']} files")
+    print(f"  ⚡ streaming XML: {result['fast_ms']} ms/file")
+    print(f"  🐢 python-docx:   {result['python_docx_ms']} ms/file ({result['speedup']}x slower)")
+    print(f"  ➕ {result['extra_chars']} chars of table/header/text-box text recovered")
+
+
+if __name__ == "__main__":
+    main()
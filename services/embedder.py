@@ -0,0 +1,127 @@
+"""
+Resume Embedder
+Turns resume text into fixed-size vectors for LanceDB semantic search.
+
+The default HashingEmbedder is deterministic, needs no network and no model
+download. Heavier local models can be plugged in with set_embedder() as long
+as they produce vectors of EMBEDDING_DIM floats.
+"""
+
+import hashlib
+import re
+import threading
+from functools import lru_cache
+from typing import List
+
+import numpy as np
+
+EMBEDDING_DIM = 256
+
+_TOKEN_RE = re.compile(r"[a-z0-9][a-z0-9+#./-]*")
+
+
+class Embedder:
+    """Interface for text embedders used at ingest and query time."""
+
+    dim: int = EMBEDDING_DIM
+
+    def embed(self, texts: List[str]) -> List[List[float]]:
+        """Return one L2-normalized vector of `dim` floats per text."""
+        raise NotImplementedError
+
+
+@lru_cache(maxsize=200_000)
+def _hash_token(token: str, dim: int):
+    """Stable (bucket, sign) for a token; Python's hash() is salted per process."""
+    digest = hashlib.blake2b(token.encode(), digest_size=8).digest()
+    value = int.from_bytes(digest, "little")
+    return value % dim, 1.0 if (value >> 63) else -1.0
+
+
+def tokenize(text: str) -> List[str]:
+    """Lowercase word tokens; keeps tech names like c++, c#, node.js, ci/cd."""
+    return [t.rstrip("./-") for t in _TOKEN_RE.findall(text.lower())]
+
+
+class HashingEmbedder(Embedder):
+    """
+    Signed feature hashing over unigrams and bigrams with log-scaled counts.
+
+    Cosine similarity between two vectors approximates TF overlap of the
+    texts, which is enough to rank resumes against a short query.
+    """
+
+    def __init__(self, dim: int = EMBEDDING_DIM):
+        self.dim = dim
+
+    def embed(self, texts: List[str]) -> List[List[float]]:
+        vectors = np.zeros((len(texts), self.dim), dtype=np.float32)
+        for row, text in enumerate(texts):
+            tokens = tokenize(text)
+            features = tokens + [f"{a} {b}" for a, b in zip(tokens, tokens[1:])]
+            counts = {}
+            for feature in features:
+                counts[feature] = counts.get(feature, 0) + 1
+            for feature, count in counts.items():
+                bucket, sign = _hash_token(feature, self.dim)
+                vectors[row, bucket] += sign * (1.0 + np.log(count))
+
+        norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+        norms[norms == 0] = 1.0
+        return (vectors / norms).tolist()
+
+
+class SentenceTransformerEmbedder(Embedder):
+    """
+    Local sentence-transformers model (optional dependency, runs offline once
+    the model is cached). set_embedder() only accepts it if the model's
+    output size equals EMBEDDING_DIM.
+    """
+
+    def __init__(self, model_name: str = "all-MiniLM-L6-v2"):
+        try:
+            from sentence_transformers import SentenceTransformer
+        except ImportError as e:
+            raise ImportError(
+                "sentence-transformers is not installed. "
+                "Run: pip install sentence-transformers"
+            ) from e
+        self.model = SentenceTransformer(model_name)
+        self.dim = self.model.get_sentence_embedding_dimension()
+
+    def embed(self, texts: List[str]) -> List[List[float]]:
+        return self.model.encode(list(texts), normalize_embeddings=True).tolist()
+
+
+# ---------------------------------------------------------------------------
+# Process-wide embedder
+# ---------------------------------------------------------------------------
+_embedder: Embedder = HashingEmbedder()
+_embedder_lock = threading.Lock()
+
+
+def get_embedder() -> Embedder:
+    """Embedder used for both ingest and search."""
+    return _embedder
+
+
+def set_embedder(embedder: Embedder):
+    """
+    Swap the process-wide embedder.
+
+    Vectors from different embedders are not comparable, so existing rows must
+    be re-embedded (re-index) after switching.
+    """
+    global _embedder
+    if embedder.dim != EMBEDDING_DIM:
+        raise ValueError(
+            f"Embedder produces {embedder.dim}-dim vectors, "
+            f"resumes table expects {EMBEDDING_DIM}"
+        )
+    with _embedder_lock:
+        _embedder = embedder
+
+
+def embed_texts(texts: List[str]) -> List[List[float]]:
+    """Embed texts with the process-wide embedder."""
+    return get_embedder().embed(list(texts))
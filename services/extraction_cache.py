@@ -0,0 +1,109 @@
+"""
+Extraction Cache
+Content-addressed store of extracted resume text, keyed by the SHA-256 of
+the raw file bytes plus the cache version (resume_parser.cache_version():
+the parser version and the page/character budgets the text was cut to), so re-parsing an unchanged file
+costs a hash and one SQLite lookup instead of a full PDF/DOCX parse.
+
+The cache is a SQLite sidecar (WAL mode, safe for the extract_texts worker
+processes) at data/extraction_cache.sqlite. Set EXTRACTION_CACHE_PATH to
+move it, or to an empty string to disable caching.
+"""
+
+import os
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Optional
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+DEFAULT_CACHE_PATH = PROJECT_ROOT / "data" / "extraction_cache.sqlite"
+
+CACHE_PATH_ENV = "EXTRACTION_CACHE_PATH"
+
+_local = threading.local()
+
+
+def cache_path() -> Optional[Path]:
+    """Active cache file, or None if caching is disabled."""
+    value = os.environ.get(CACHE_PATH_ENV)
+    if value is None:
+        return DEFAULT_CACHE_PATH
+    return Path(value) if value.strip() else None
+
+
+def _connection(path: Path) -> sqlite3.Connection:
+    """One connection per thread and cache file."""
+    connections = getattr(_local, "connections", None)
+    if connections is None:
+        connections = _local.connections = {}
+    conn = connections.get(path)
+    if conn is None:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        conn = sqlite3.connect(str(path), timeout=30)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS extractions ("
+            " sha256 TEXT NOT NULL,"
+            " parser_version TEXT NOT NULL,"
+            " text TEXT NOT NULL,"
+            " created_at REAL NOT NULL,"
+            " PRIMARY KEY (sha256, parser_version))"
+        )
+        conn.commit()
+        connections[path] = conn
+    return conn
+
+
+def get_cached_text(sha256: str, parser_version: str) -> Optional[str]:
+    """
+    Cached extraction for a file hash, if any.
+
+    Args:
+        sha256: Hex digest of the raw file bytes
+        parser_version: resume_parser.cache_version() of the extraction
+
+    Returns:
+        Extracted text, or None on a miss (or if caching is disabled)
+    """
+    path = cache_path()
+    if path is None:
+        return None
+    row = _connection(path).execute(
+        "SELECT text FROM extractions WHERE sha256 = ? AND parser_version = ?",
+        (sha256, parser_version),
+    ).fetchone()
+    return row[0] if row else None
+
+
+def put_cached_text(sha256: str, parser_version: str, text: str):
+    """Store an extraction (no-op if caching is disabled)."""
+    path = cache_path()
+    if path is None:
+        return
+    conn = _connection(path)
+    conn.execute(
+        "INSERT OR REPLACE INTO extractions (sha256, parser_version, text, created_at) VALUES (?, ?, ?, ?)",
+        (sha256, parser_version, text, time.time()),
+    )
+    conn.commit()
+
+
+def purge_stale(parser_version: str) -> int:
+    """
+    Delete entries written by other parser versions; returns rows removed.
+
+    Entries of this version extracted under any budgets ("<version>/...")
+    are kept.
+    """
+    path = cache_path()
+    if path is None:
+        return 0
+    conn = _connection(path)
+    removed = conn.execute(
+        "DELETE FROM extractions WHERE parser_version != ? AND parser_version NOT LIKE ?",
+        (parser_version, parser_version + "/%"),
+    ).rowcount
+    conn.commit()
+    return removed
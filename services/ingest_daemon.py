@@ -0,0 +1,318 @@
+"""
+Folder-Watch Ingest Daemon
+Watches a directory (default data/raw_resumes) and indexes every PDF/DOCX
+dropped into it: parse → fingerprint → dedup → signal extraction → batched
+store, without a Streamlit session.
+
+New or changed files are picked up by polling and debounced: a file is
+ingested once its size and mtime have been unchanged for `debounce` seconds,
+so half-copied ATS exports are never parsed. Each processed file is recorded
+in a JSON manifest (path, size, mtime, sha256, status), written after every
+batch, so a restarted daemon resumes where it stopped instead of re-parsing
+the whole folder. A file interrupted mid-batch is simply processed again;
+fingerprint dedup keeps it from being stored twice.
+
+CLI (signals use LLM_PROVIDER / LLM_API_KEY / LLM_MODEL; without them
+resumes are stored for later `services.signal_backfill`):
+    python -m services.ingest_daemon                       # watch data/raw_resumes
+    python -m services.ingest_daemon /exports --recursive  # watch another tree
+    python -m services.ingest_daemon --once                # ingest what is there, then exit
+"""
+
+import argparse
+import json
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Callable, Dict, List, Optional
+
+from services.db.lancedb_client import NEAR_DUPLICATE_MODES
+from services.ingest_pipeline import run_ingest_pipeline
+from services.resume_parser import EXTRACTION_TIMEOUT
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+DEFAULT_WATCH_DIR = PROJECT_ROOT / "data" / "raw_resumes"
+DEFAULT_MANIFEST = PROJECT_ROOT / "data" / "ingest_manifest.json"
+
+SUPPORTED_SUFFIXES = (".pdf", ".docx")
+
+POLL_INTERVAL = 5.0       # seconds between folder scans
+DEBOUNCE_SECONDS = 10.0   # a file must sit unchanged this long before ingest
+BATCH_SIZE = 50           # files parsed and stored per batch
+LLM_WORKERS = 4           # concurrent signal extraction calls
+
+
+# ---------- MANIFEST ----------
+class IngestManifest:
+    """JSON record of processed files, keyed by absolute path."""
+
+    def __init__(self, path):
+        self.path = Path(path)
+        self.entries: Dict[str, dict] = {}
+        if self.path.exists():
+            try:
+                self.entries = json.loads(self.path.read_text(encoding="utf-8")).get("files", {})
+            except (json.JSONDecodeError, OSError) as e:
+                print(f"⚠️ Ignoring unreadable manifest {self.path}: {e}")
+
+    def is_current(self, path: str, stat) -> bool:
+        """True if `path` was processed with exactly this size and mtime."""
+        entry = self.entries.get(path)
+        return entry is not None and entry["size"] == stat[0] and entry["mtime"] == stat[1]
+
+    def record(self, path: str, stat, status: str, sha256: str = None, error: str = None):
+        self.entries[path] = {
+            "size": stat[0], "mtime": stat[1], "sha256": sha256,
+            "status": status, "error": error, "processed_at": time.time(),
+        }
+
+    def save(self):
+        """Write atomically (temp file + rename), so a crash never leaves half a manifest."""
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = self.path.with_name(self.path.name + ".tmp")
+        tmp.write_text(json.dumps({"files": self.entries}, indent=1), encoding="utf-8")
+        os.replace(tmp, self.path)
+
+
+# ---------- WATCHER ----------
+def scan_folder(folder, recursive: bool = False) -> Dict[str, tuple]:
+    """Supported files under `folder` -> (size, mtime_ns)."""
+    folder = Path(folder)
+    pattern = "**/*" if recursive else "*"
+    found = {}
+    for path in folder.glob(pattern):
+        if path.suffix.lower() not in SUPPORTED_SUFFIXES or path.name.startswith((".", "~$")):
+            continue
+        try:
+            stat = path.stat()
+        except OSError:
+            continue  # deleted between listing and stat
+        if path.is_file():
+            found[str(path.resolve())] = (stat.st_size, stat.st_mtime_ns)
+    return found
+
+
+class FolderWatcher:
+    """Polls a folder and reports files that are new/changed and have settled."""
+
+    def __init__(self, folder, manifest: IngestManifest, debounce: float = DEBOUNCE_SECONDS,
+                 recursive: bool = False):
+        self.folder = Path(folder)
+        self.manifest = manifest
+        self.debounce = debounce
+        self.recursive = recursive
+        self._pending: Dict[str, tuple] = {}  # path -> (stat, unchanged since)
+
+    @property
+    def has_pending(self) -> bool:
+        """Files seen but not settled yet."""
+        return bool(self._pending)
+
+    def poll(self, now: float = None) -> List[tuple]:
+        """
+        Scan once.
+
+        Returns:
+            List of (path, (size, mtime_ns)) ready for ingest, oldest first
+        """
+        now = time.time() if now is None else now
+        current = scan_folder(self.folder, self.recursive)
+        ready = []
+        pending = {}
+        for path, stat in current.items():
+            if self.manifest.is_current(path, stat):
+                continue
+            previous = self._pending.get(path)
+            if previous is not None and previous[0] == stat:
+                since = previous[1]
+            else:
+                # Content has not changed since its mtime, so an old file is settled already
+                since = min(now, stat[1] / 1e9)
+            if now - since >= self.debounce:
+                ready.append((path, stat))
+            else:
+                pending[path] = (stat, since)
+        self._pending = pending
+        ready.sort(key=lambda item: item[1][1])
+        return ready
+
+
+# ---------- PIPELINE ----------
+def _resolve_llm():
+    """Chat model from env/session, or None to store without signals."""
+    try:
+        from services.llm_config import get_llm
+        return get_llm(temperature=0)
+    except Exception as e:
+        print(f"ℹ️ No LLM configured ({e}); storing resumes without signals.")
+        return None
+
+
+def ingest_files(
+    files,
+    manifest: IngestManifest,
+    llm=None,
+    near_duplicates: str = "link",
+    workers: int = None,
+    llm_workers: int = LLM_WORKERS,
+    timeout: float = EXTRACTION_TIMEOUT,
+) -> Dict[str, int]:
+    """
+    Parse, dedup, extract signals for and store one batch of files
+    (services.ingest_pipeline, one database write per batch).
+
+    Args:
+        files: List of (path, (size, mtime_ns)) from FolderWatcher.poll()
+        manifest: Manifest to record results in (saved at the end)
+        llm: Chat model for signal extraction (None = store without signals)
+        near_duplicates: "keep", "link" or "skip" (see store_resumes_batch())
+        workers: Parser processes (default: CPU count)
+        llm_workers: Concurrent signal extraction calls
+        timeout: Wall-clock seconds allowed per file parse
+
+    Returns:
+        Count per status: stored, linked, duplicate, near_duplicate, failed
+    """
+    stats = {"stored": 0, "linked": 0, "duplicate": 0, "near_duplicate": 0, "failed": 0}
+    if not files:
+        return stats
+
+    digests = {}
+    events = run_ingest_pipeline(
+        [path for path, _ in files], llm=llm, near_duplicates=near_duplicates, parse_workers=workers,
+        llm_concurrency=llm_workers, write_batch_size=len(files), timeout=timeout,
+    )
+    for event in events:
+        kind = event["event"]
+        if kind == "parsed":
+            digests[event["index"]] = event["sha256"]
+            continue
+        if kind == "error":
+            print(f"  ❌ {event['stage']} stage: {event['error']}")
+            continue
+        if kind not in ("failed", "duplicate", "near_duplicate", "stored"):
+            continue
+        path, stat = files[event["index"]]
+        status = event.get("status", kind)
+        if kind == "failed":
+            print(f"  ❌ {event['name']}: {event['error']}")
+        manifest.record(path, stat, status, digests.get(event["index"]), event.get("error"))
+        stats[status] += 1
+
+    manifest.save()
+    return stats
+
+
+def watch(
+    folder=DEFAULT_WATCH_DIR,
+    manifest_path=DEFAULT_MANIFEST,
+    interval: float = POLL_INTERVAL,
+    debounce: float = DEBOUNCE_SECONDS,
+    batch_size: int = BATCH_SIZE,
+    recursive: bool = False,
+    once: bool = False,
+    llm=None,
+    near_duplicates: str = "link",
+    workers: int = None,
+    llm_workers: int = LLM_WORKERS,
+    progress: Optional[Callable[[Dict], None]] = None,
+    stop_event: threading.Event = None,
+) -> Dict[str, int]:
+    """
+    Poll `folder` and ingest settled files in batches until stopped.
+
+    Args:
+        folder: Directory to watch
+        manifest_path: JSON manifest of processed files
+        interval: Seconds between scans
+        debounce: Seconds a file must be unchanged before it is ingested
+        batch_size: Files per parse/store batch
+        recursive: Watch subdirectories too
+        once: Ingest the files present now (waiting out their debounce), then return
+        llm: Chat model for signals (None = store without signals)
+        near_duplicates: "keep", "link" or "skip"
+        workers: Parser processes (default: CPU count)
+        llm_workers: Concurrent signal extraction calls
+        progress: Called with the running totals after each batch
+        stop_event: Set it to stop after the current batch
+
+    Returns:
+        Running totals per status (plus "batches")
+
+    Raises:
+        ValueError: If near_duplicates is not a known mode
+    """
+    if near_duplicates not in NEAR_DUPLICATE_MODES:
+        raise ValueError(f"near_duplicates must be one of {', '.join(NEAR_DUPLICATE_MODES)}")
+
+    manifest = IngestManifest(manifest_path)
+    watcher = FolderWatcher(folder, manifest, debounce=debounce, recursive=recursive)
+    totals = {"stored": 0, "linked": 0, "duplicate": 0, "near_duplicate": 0, "failed": 0, "batches": 0}
+
+    while stop_event is None or not stop_event.is_set():
+        ready = watcher.poll()
+        for start in range(0, len(ready), batch_size):
+            batch_stats = ingest_files(
+                ready[start:start + batch_size], manifest, llm=llm, near_duplicates=near_duplicates,
+                workers=workers, llm_workers=llm_workers,
+            )
+            for status, count in batch_stats.items():
+                totals[status] += count
+            totals["batches"] += 1
+            if progress:
+                progress(dict(totals))
+            if stop_event is not None and stop_event.is_set():
+                return totals
+
+        if once and not watcher.has_pending:
+            return totals
+        wait = interval if not once else min(interval, debounce)
+        if stop_event is not None:
+            stop_event.wait(wait)
+        else:
+            time.sleep(wait)
+    return totals
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Watch a folder and ingest new resumes into LanceDB.")
+    parser.add_argument("folder", nargs="?", default=str(DEFAULT_WATCH_DIR), help="directory to watch")
+    parser.add_argument("--manifest", default=str(DEFAULT_MANIFEST), help="processed-files manifest (JSON)")
+    parser.add_argument("--interval", type=float, default=POLL_INTERVAL, help="seconds between scans")
+    parser.add_argument("--debounce", type=float, default=DEBOUNCE_SECONDS,
+                        help="seconds a file must be unchanged before ingest")
+    parser.add_argument("--batch-size", type=int, default=BATCH_SIZE, help="files per batch")
+    parser.add_argument("--recursive", action="store_true", help="watch subdirectories too")
+    parser.add_argument("--once", action="store_true", help="ingest current files, then exit")
+    parser.add_argument("--near-duplicates", choices=NEAR_DUPLICATE_MODES, default="link",
+                        help="keep, link or skip near-duplicate resumes (default: %(default)s)")
+    parser.add_argument("--workers", type=int, help="parser processes (default: CPU count)")
+    parser.add_argument("--llm-workers", type=int, default=LLM_WORKERS, help="concurrent LLM calls")
+    parser.add_argument("--no-signals", action="store_true", help="skip LLM signal extraction")
+    args = parser.parse_args(argv)
+
+    if not Path(args.folder).is_dir():
+        print(f"❌ Not a directory: {args.folder}")
+        return
+
+    llm = None if args.no_signals else _resolve_llm()
+
+    def report(totals):
+        print(f"  📥 {totals['stored']} stored, {totals['linked']} linked, {totals['duplicate']} duplicate, "
+              f"{totals['near_duplicate']} near-duplicate, {totals['failed']} failed")
+
+    print(f"👀 Watching {args.folder} (every {args.interval:g}s, debounce {args.debounce:g}s)")
+    try:
+        watch(
+            args.folder, args.manifest, interval=args.interval, debounce=args.debounce,
+            batch_size=args.batch_size, recursive=args.recursive, once=args.once, llm=llm,
+            near_duplicates=args.near_duplicates, workers=args.workers, llm_workers=args.llm_workers,
+            progress=report,
+        )
+    except KeyboardInterrupt:
+        print("🛑 Stopped.")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,362 @@
+"""
+Pipelined Resume Ingest
+Runs parsing, LLM signal extraction and database writes as overlapping
+stages connected by bounded queues, so the CPU parses the next files while
+the LLM works on earlier ones and the writer stores finished resumes in
+batches:
+
+    parse pool (processes) → dedup + LLM stage (≤ llm_concurrency calls) → batching writer
+
+Throughput approaches the slowest stage (usually the LLM rate limit)
+instead of the sum of all stage latencies. Duplicates are dropped before
+the LLM stage, and linked near-duplicates skip it (they inherit the
+original's signals).
+
+run_ingest_pipeline() is a generator of progress events, consumed in the
+caller's thread, so a Streamlit page can render them directly:
+
+    {"event": "parsed" | "failed" | "duplicate" | "near_duplicate" | "extracted" | "stored" | "done",
+     "index": <input position>, "name": <file name>, "counts": {...running totals...}, ...}
+"""
+
+import os
+import queue
+import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Dict, Iterator
+
+from services.db.lancedb_client import (
+    NEAR_DUPLICATE_MODES,
+    find_near_duplicates,
+    generate_fingerprint,
+    lookup_fingerprints,
+    store_resumes_batch,
+)
+from services.resume_parser import EXTRACTION_TIMEOUT, ParserPool, _as_work_item, _extract_one, _pool_result
+
+LLM_CONCURRENCY = 4       # signal extraction calls in flight
+WRITE_BATCH_SIZE = 25     # resumes per store_resumes_batch() call
+FLUSH_INTERVAL = 2.0      # seconds a partial write batch may wait for more resumes
+QUEUE_SIZE = 32           # items buffered between stages
+
+_DONE = object()           # end-of-stream marker between stages
+_POLL = 0.1                # seconds between stop checks while blocked on a queue
+
+
+def _put(q: queue.Queue, item, stop: threading.Event) -> bool:
+    """Blocking put that gives up once `stop` is set."""
+    while not stop.is_set():
+        try:
+            q.put(item, timeout=_POLL)
+            return True
+        except queue.Full:
+            continue
+    return False
+
+
+def _source_name(source, index: int) -> str:
+    if isinstance(source, (str, os.PathLike)):
+        return Path(source).name
+    return getattr(source, "name", None) or f"file_{index}"
+
+
+class _Counts:
+    """Thread-safe running totals shared by the stages."""
+
+    def __init__(self, total):
+        self._lock = threading.Lock()
+        self.values = {
+            "total": total, "parsed": 0, "failed": 0, "duplicate": 0, "near_duplicate": 0,
+            "extracted": 0, "stored": 0, "linked": 0,
+        }
+
+    def add(self, key: str, n: int = 1) -> dict:
+        with self._lock:
+            self.values[key] += n
+            return dict(self.values)
+
+    def snapshot(self) -> dict:
+        with self._lock:
+            return dict(self.values)
+
+
+# ---------- STAGES ----------
+def _parse_stage(sources, out_q, events, counts, stop, workers, timeout):
+    """Parse files (in order) into out_q as (index, name, result)."""
+    def parsed(index, name, result):
+        if result["error"]:
+            events.put({"event": "failed", "stage": "parse", "index": index, "name": name,
+                        "error": result["error"], "counts": counts.add("failed")})
+            return True
+        events.put({"event": "parsed", "index": index, "name": name, "sha256": result["sha256"],
+                    "counts": counts.add("parsed")})
+        return _put(out_q, (index, name, result), stop)
+
+    def work():
+        # Sources are read one at a time (lazy archive members decompress here);
+        # an unreadable source fails on its own instead of ending the stage.
+        for index, source in enumerate(sources):
+            name = _source_name(source, index)
+            try:
+                item, error = _as_work_item(source), None
+            except Exception as e:
+                item, error = None, f"{type(e).__name__}: {e}"
+            yield index, name, item, error
+
+    try:
+        if workers == 1 and not timeout:
+            for index, name, item, error in work():
+                if not parsed(index, name, {"error": error} if error else _extract_one(item)):
+                    return
+            return
+
+        # Bounded window of submitted files: parsing stays ahead of the LLM
+        # stage without reading the whole upload into the pool at once.
+        # Entries are (index, name, item, result); result is set for sources
+        # that failed to read, the pool answers the others in order.
+        window = deque()
+        with ParserPool(workers, timeout) as pool:
+            def emit(entry):
+                index, name, item, result = entry
+                return parsed(index, name, result or _pool_result(pool, item))
+
+            for index, name, item, error in work():
+                if error:
+                    window.append((index, name, item, {"error": error}))
+                else:
+                    pool.submit(item)
+                    window.append((index, name, item, None))
+                if len(window) >= workers * 2 and not emit(window.popleft()):
+                    return
+            while window:
+                if not emit(window.popleft()):
+                    return
+    except Exception as e:
+        events.put({"event": "error", "stage": "parse", "error": f"{type(e).__name__}: {e}"})
+    finally:
+        _put(out_q, _DONE, stop)
+
+
+def _drain(in_q, limit, stop):
+    """Block for one item, then take whatever else is queued (up to `limit`)."""
+    items = []
+    while not stop.is_set():
+        try:
+            items.append(in_q.get(timeout=_POLL))
+            break
+        except queue.Empty:
+            continue
+    while items and items[-1] is not _DONE and len(items) < limit:
+        try:
+            items.append(in_q.get_nowait())
+        except queue.Empty:
+            break
+    return items
+
+
+def _extract_stage(in_q, out_q, events, counts, stop, llm, near_duplicates, concurrency, probe_size):
+    """Drop duplicates, extract signals with at most `concurrency` LLM calls in flight."""
+    from services.resume_enricher import extract_resume_signals
+
+    seen_fps = set()
+    in_flight = threading.BoundedSemaphore(concurrency * 2)
+
+    def extract(index, name, result):
+        try:
+            signals, error = extract_resume_signals(result["text"], llm=llm, sections=result["sections"]), None
+        except Exception as e:
+            signals, error = None, f"{type(e).__name__}: {e}"
+        event = {"event": "extracted", "index": index, "name": name, "signals": bool(signals), "error": error}
+        event["counts"] = counts.add("extracted") if signals else counts.snapshot()
+        events.put(event)
+        _put(out_q, (index, name, result["text"], signals), stop)
+        in_flight.release()
+
+    pool = ThreadPoolExecutor(max_workers=concurrency, thread_name_prefix="ingest-llm") if llm else None
+    try:
+        finished = False
+        while not finished and not stop.is_set():
+            items = _drain(in_q, probe_size, stop)
+            if items and items[-1] is _DONE:
+                finished = True
+                items.pop()
+            if not items:
+                continue
+
+            # One fingerprint lookup and one LSH probe per drained group
+            fps = [generate_fingerprint(result["text"]) for _, _, result in items]
+            existing = lookup_fingerprints(fps)
+            near_matches = (
+                find_near_duplicates([result["text"] for _, _, result in items])
+                if near_duplicates != "keep" else [None] * len(items)
+            )
+            for (index, name, result), fp, near_match in zip(items, fps, near_matches):
+                if existing.get(fp) is not None or fp in seen_fps:
+                    events.put({"event": "duplicate", "index": index, "name": name,
+                                "counts": counts.add("duplicate")})
+                    continue
+                seen_fps.add(fp)
+                if near_match and near_duplicates == "skip":
+                    events.put({"event": "near_duplicate", "index": index, "name": name,
+                                "original": near_match["filename"], "counts": counts.add("near_duplicate")})
+                    continue
+                if pool is None or near_match:
+                    # Linked near-duplicates inherit the original's signals: no LLM call
+                    _put(out_q, (index, name, result["text"], None), stop)
+                    continue
+                while not in_flight.acquire(timeout=_POLL):
+                    if stop.is_set():
+                        return
+                pool.submit(extract, index, name, result)
+    except Exception as e:
+        events.put({"event": "error", "stage": "extract", "error": f"{type(e).__name__}: {e}"})
+    finally:
+        if pool is not None:
+            pool.shutdown(wait=True)
+        _put(out_q, _DONE, stop)
+
+
+def _write_stage(in_q, events, counts, stop, near_duplicates, batch_size, flush_interval):
+    """Store resumes in batches of `batch_size` (or whatever arrived within `flush_interval`)."""
+    batch = []
+    first_at = None
+
+    def flush():
+        nonlocal batch, first_at
+        if not batch:
+            return
+        pending, batch, first_at = batch, [], None
+        try:
+            statuses = store_resumes_batch(
+                [(name, text, signals) for _, name, text, signals in pending], near_duplicates=near_duplicates,
+            )
+        except Exception as e:
+            for index, name, _, _ in pending:
+                events.put({"event": "failed", "stage": "store", "index": index, "name": name,
+                            "error": f"{type(e).__name__}: {e}", "counts": counts.add("failed")})
+            return
+        for (index, name, _, signals), status in zip(pending, statuses):
+            events.put({"event": "stored", "index": index, "name": name, "status": status,
+                        "signals": bool(signals), "counts": counts.add(status)})
+
+    try:
+        while not stop.is_set():
+            try:
+                item = in_q.get(timeout=_POLL)
+            except queue.Empty:
+                if batch and time.monotonic() - first_at >= flush_interval:
+                    flush()
+                continue
+            if item is _DONE:
+                break
+            if not batch:
+                first_at = time.monotonic()
+            batch.append(item)
+            if len(batch) >= batch_size:
+                flush()
+        flush()
+    except Exception as e:
+        events.put({"event": "error", "stage": "store", "error": f"{type(e).__name__}: {e}"})
+    finally:
+        events.put(_DONE)
+
+
+# ---------- PIPELINE ----------
+def run_ingest_pipeline(
+    sources,
+    llm=None,
+    store: bool = True,
+    near_duplicates: str = "link",
+    parse_workers: int = None,
+    llm_concurrency: int = LLM_CONCURRENCY,
+    write_batch_size: int = WRITE_BATCH_SIZE,
+    timeout: float = EXTRACTION_TIMEOUT,
+    flush_interval: float = FLUSH_INTERVAL,
+    queue_size: int = QUEUE_SIZE,
+) -> Iterator[Dict]:
+    """
+    Parse, dedup, extract signals for and store resumes as a staged pipeline.
+
+    Args:
+        sources: File paths, bytes or binary file-like objects (uploads,
+            services.resume_archive members — read one at a time)
+        llm: Chat model for signal extraction (None = store without signals).
+            Resolve it in the calling thread; stage threads cannot read
+            Streamlit session state.
+        store: False = parse only (no dedup, LLM or database write)
+        near_duplicates: "keep", "link" or "skip" (see store_resumes_batch())
+        parse_workers: Parser processes (default: CPU count; 1 without a
+            timeout parses in a thread)
+        llm_concurrency: Max LLM calls in flight
+        write_batch_size: Resumes per database write
+        timeout: Wall-clock seconds allowed per file parse (None = no limit)
+        flush_interval: Max seconds a partial write batch waits
+        queue_size: Items buffered between stages (bounds memory)
+
+    Yields:
+        Progress event dicts (see module docstring); the last one is
+        {"event": "done", "counts": {...}, "elapsed": seconds}
+
+    Raises:
+        ValueError: If near_duplicates is not a known mode
+    """
+    if near_duplicates not in NEAR_DUPLICATE_MODES:
+        raise ValueError(f"near_duplicates must be one of {', '.join(NEAR_DUPLICATE_MODES)}")
+
+    sources = list(sources)
+    workers = max(1, min(parse_workers or os.cpu_count() or 1, len(sources) or 1))
+    counts = _Counts(len(sources))
+    events = queue.Queue()
+    stop = threading.Event()
+    started = time.perf_counter()
+
+    parse_q = queue.Queue(maxsize=queue_size)
+    if store:
+        write_q = queue.Queue(maxsize=queue_size)
+        threads = [
+            threading.Thread(target=_parse_stage, name="ingest-parse", daemon=True,
+                             args=(sources, parse_q, events, counts, stop, workers, timeout)),
+            threading.Thread(target=_extract_stage, name="ingest-extract", daemon=True,
+                             args=(parse_q, write_q, events, counts, stop, llm, near_duplicates,
+                                   max(1, llm_concurrency), write_batch_size)),
+            threading.Thread(target=_write_stage, name="ingest-write", daemon=True,
+                             args=(write_q, events, counts, stop, near_duplicates, write_batch_size,
+                                   flush_interval)),
+        ]
+    else:
+        def parse_only():
+            _parse_stage(sources, parse_q, events, counts, stop, workers, timeout)
+
+        def discard():
+            # Parse-only run: results are reported through events, nothing goes
+            # downstream. Polls like _drain(): once `stop` is set the parse stage
+            # may give up before delivering _DONE.
+            while True:
+                items = _drain(parse_q, QUEUE_SIZE, stop)
+                if not items or items[-1] is _DONE:
+                    break
+            events.put(_DONE)
+
+        threads = [
+            threading.Thread(target=parse_only, name="ingest-parse", daemon=True),
+            threading.Thread(target=discard, name="ingest-discard", daemon=True),
+        ]
+
+    for thread in threads:
+        thread.start()
+    try:
+        while True:
+            event = events.get()
+            if event is _DONE:
+                break
+            yield event
+    finally:
+        # Consumer finished or abandoned the generator: stop and join every stage
+        if any(thread.is_alive() for thread in threads):
+            stop.set()
+        for thread in threads:
+            thread.join()
+    yield {"event": "done", "counts": counts.snapshot(), "elapsed": round(time.perf_counter() - started, 3)}
@@ -1,9 +1,14 @@
 """
 Shared LLM configuration module.
-Supports multiple providers via Streamlit session_state sidebar UI.
+Supports multiple providers via Streamlit session_state sidebar UI,
+or LLM_PROVIDER / LLM_API_KEY / LLM_MODEL env vars for command-line tools.
 """
 
+import hashlib
+import os
 import re
+import threading
+from collections import OrderedDict
 
 # ---------------------------------------------------------------------------
 # Provider / model registry
@@ -96,7 +101,13 @@ def extract_json(text: str) -> str:
 # ---------------------------------------------------------------------------
 def get_llm(temperature: float = 0, model: str = None):
     """
-    Create a chat model instance using the provider configured in the sidebar.
+    Get a chat model instance using the provider configured in the sidebar.
+    Outside a configured Streamlit session (CLI workers), falls back to the
+    LLM_PROVIDER / LLM_API_KEY / LLM_MODEL environment variables.
+
+    Instances are cached per (provider, model, temperature, API key), so
+    every agent node calling get_llm() reuses one client and its open
+    connections instead of building a new one per call.
     """
     provider = None
     api_key = None
@@ -111,10 +122,13 @@ def get_llm(temperature: float = 0, model: str = None):
     except Exception:
         pass
 
+    if not (provider and api_key):
+        provider = os.environ.get("LLM_PROVIDER")
+        api_key = os.environ.get("LLM_API_KEY")
+        session_model = os.environ.get("LLM_MODEL")
+
     if provider and api_key:
-        return _create_llm_for_provider(
-            provider, api_key, model or session_model, temperature
-        )
+        return _cached_llm(provider, api_key, model or session_model, temperature)
 
     raise ValueError(
         "No LLM configured. Please select a provider and enter your API key "
@@ -122,6 +136,113 @@ def get_llm(temperature: float = 0, model: str = None):
     )
 
 
+# ---------------------------------------------------------------------------
+# Client cache
+# ---------------------------------------------------------------------------
+# Chat models are safe to share across threads and sessions: they hold no
+# per-conversation state, and their HTTP clients are thread-safe.
+LLM_CACHE_SIZE = 32            # distinct (provider, model, temperature, key) clients kept
+
+# Connection pool shared by every OpenAI-compatible / Groq client (httpx
+# pools per host): keep-alive connections skip the TCP + TLS handshake on
+# later calls.
+HTTP_MAX_CONNECTIONS = 50
+HTTP_MAX_KEEPALIVE = 20
+HTTP_KEEPALIVE_EXPIRY = 60.0   # seconds an idle connection stays open
+
+_llm_cache = OrderedDict()
+_build_locks = {}              # cache key -> lock held while that client is built
+_http_client = None
+_cache_lock = threading.Lock()
+_http_lock = threading.Lock()
+_cache_stats = {"hits": 0, "misses": 0}
+
+
+def _cache_key(provider, api_key, model, temperature) -> tuple:
+    # Only a digest of the key is kept, so cache keys never expose it
+    key_hash = hashlib.sha256(api_key.encode("utf-8")).hexdigest()
+    return provider, model or PROVIDER_MODELS.get(provider, {}).get("default_model"), float(temperature), key_hash
+
+
+def _cache_hit(key):
+    """Cached client for `key`, or None (_cache_lock held)."""
+    llm = _llm_cache.get(key)
+    if llm is not None:
+        _llm_cache.move_to_end(key)
+        _cache_stats["hits"] += 1
+    return llm
+
+
+def _cached_llm(provider, api_key, model, temperature):
+    """Return the cached client for these settings, creating it on first use (LRU)."""
+    key = _cache_key(provider, api_key, model, temperature)
+    with _cache_lock:
+        llm = _cache_hit(key)
+        if llm is not None:
+            return llm
+        build_lock = _build_locks.setdefault(key, threading.Lock())
+
+    # Built outside the cache lock (a first provider import takes seconds and
+    # must not stall other sessions' hits); the per-key lock makes concurrent
+    # sessions asking for the same settings share one client.
+    with build_lock:
+        with _cache_lock:
+            llm = _cache_hit(key)
+            if llm is not None:
+                return llm
+        try:
+            llm = _create_llm_for_provider(provider, api_key, model, temperature)
+        except BaseException:
+            with _cache_lock:
+                _build_locks.pop(key, None)
+            raise
+        # Insert and release the build lock together: a request in between
+        # would otherwise miss the cache, take a fresh lock and build again.
+        with _cache_lock:
+            _llm_cache[key] = llm
+            _build_locks.pop(key, None)
+            _cache_stats["misses"] += 1
+            if len(_llm_cache) > LLM_CACHE_SIZE:
+                _llm_cache.popitem(last=False)
+        return llm
+
+
+def _shared_http_client():
+    """Process-wide keep-alive httpx client (created on first use)."""
+    global _http_client
+    import httpx
+
+    with _http_lock:
+        if _http_client is None or _http_client.is_closed:
+            _http_client = httpx.Client(limits=httpx.Limits(
+                max_connections=HTTP_MAX_CONNECTIONS,
+                max_keepalive_connections=HTTP_MAX_KEEPALIVE,
+                keepalive_expiry=HTTP_KEEPALIVE_EXPIRY,
+            ))
+        return _http_client
+
+
+def get_llm_cache_info() -> dict:
+    """Cache hits, misses and current size (for diagnostics)."""
+    with _cache_lock:
+        return {**_cache_stats, "size": len(_llm_cache)}
+
+
+def clear_llm_cache():
+    """
+    Drop cached clients and the shared connection pool.
+
+    The pool is not closed: clients already handed out may be mid-call in
+    another session. Its connections close once nothing references it.
+    """
+    global _http_client
+    with _cache_lock:
+        _llm_cache.clear()
+        _cache_stats.update(hits=0, misses=0)
+    with _http_lock:
+        _http_client = None
+
+
 # ---------------------------------------------------------------------------
 # Provider-specific constructors
 # ---------------------------------------------------------------------------
@@ -138,7 +259,8 @@ def _create_llm_for_provider(provider, api_key, model, temperature):
         from langchain_openai import ChatOpenAI
         return ChatOpenAI(
             model=model, temperature=temperature,
-            api_key=api_key, **extra_kwargs,
+            api_key=api_key, http_client=_shared_http_client(),
+            **extra_kwargs,
         )
 
     if class_name == "ChatAnthropic":
@@ -159,7 +281,8 @@ def _create_llm_for_provider(provider, api_key, model, temperature):
         from langchain_groq import ChatGroq
         return ChatGroq(
             model=model, temperature=temperature,
-            api_key=api_key, **extra_kwargs,
+            api_key=api_key, http_client=_shared_http_client(),
+            **extra_kwargs,
         )
 
     raise ValueError(f"Unsupported LLM class: {class_name}")
@@ -10,7 +10,13 @@ from services.resume_enricher import extract_resume_signals
 from services.risk_detector import detect_risk_flags
 from services.scoring_engine import calculate_total_score
 from services.explainer import generate_full_explanation, generate_recommendation, generate_summary_line
-from services.db.lancedb_client import get_cached_signals
+from services.db.lancedb_client import get_cached_signals_bulk, get_resumes_by_ids
+from services.db.skill_index import find_candidates_by_skills
+
+# Database matching: candidates must cover this many JD must-have skills...
+PREFILTER_MIN_SKILLS = 2
+# ...and at most this many (best coverage first) go on to LLM/scoring.
+PREFILTER_MAX_CANDIDATES = 300
 
 
 def validate_api_key():
@@ -37,6 +43,7 @@ class MatchingState(TypedDict):
     """State for JD-Resume matching workflow"""
     jd_text: str
     resume_texts: List[str]  # List of resume text strings
+    skill_prefilter: Optional[Dict]  # {"min_skills", "max_candidates"}: pick resumes from the DB skill index
     jd_requirements: Optional[Dict]
     candidates: Optional[List[Dict[str, Any]]]  # List of candidate results
     ranked_candidates: Optional[List[Dict[str, Any]]]  # Sorted by score
@@ -54,6 +61,34 @@ def jd_parser_agent(state: MatchingState) -> Dict:
     return {"jd_requirements": jd_requirements}
 
 
+def candidate_prefilter_agent(state: MatchingState) -> Dict:
+    """
+    Agent 1b: Narrow the stored resume pool with the skill inverted index.
+    Only runs for database matching (skill_prefilter set); no LLM calls.
+    """
+    prefilter = state.get("skill_prefilter")
+    if not prefilter:
+        return {}
+
+    must_have = state["jd_requirements"].get("must_have_skills", [])
+    matches = find_candidates_by_skills(
+        must_have,
+        min_match=prefilter["min_skills"],
+        limit=prefilter["max_candidates"]
+    )
+
+    # Linked near-duplicates are the same candidate as their original
+    rows = get_resumes_by_ids([resume_id for resume_id, _ in matches], columns=["id", "text", "duplicate_of"])
+    resume_texts = [
+        rows[resume_id]["text"] for resume_id, _ in matches
+        if resume_id in rows and rows[resume_id]["duplicate_of"] is None
+    ]
+
+    print(f"🔎 Skill prefilter: {len(resume_texts)} stored resumes cover "
+          f">= {prefilter['min_skills']} of {len(must_have)} must-have skills")
+    return {"resume_texts": resume_texts}
+
+
 def resume_batch_processor_agent(state: MatchingState) -> Dict:
     """
     Agent 2: Process all resumes and extract signals.
@@ -67,11 +102,14 @@ def resume_batch_processor_agent(state: MatchingState) -> Dict:
     candidates = []
     cache_hits = 0
 
+    # One projected lookup for every candidate's cached signals
+    cached_signals = get_cached_signals_bulk(resume_texts)
+
     for idx, resume_text in enumerate(resume_texts):
         print(f"  Processing candidate {idx + 1}/{len(resume_texts)}...")
 
         # Check for cached signals first (skip LLM call if available)
-        resume_signals = get_cached_signals(resume_text)
+        resume_signals = cached_signals.get(resume_text)
         if resume_signals:
             cache_hits += 1
             print(f"    ⚡ Using cached signals for candidate {idx + 1}")
@@ -139,8 +177,9 @@ def build_matching_workflow() -> StateGraph:
 
     Workflow steps:
     1. Parse JD (extract requirements)
-    2. Process all resumes (extract signals, detect risks, score)
-    3. Rank candidates by score
+    2. Prefilter stored resumes by must-have skills (database matching only)
+    3. Process all resumes (extract signals, detect risks, score)
+    4. Rank candidates by score
 
     Returns:
         Compiled LangGraph workflow
@@ -150,12 +189,14 @@ def build_matching_workflow() -> StateGraph:
 
     # Add nodes
     graph.add_node("jd_parser", jd_parser_agent)
+    graph.add_node("prefilter", candidate_prefilter_agent)
     graph.add_node("resume_processor", resume_batch_processor_agent)
     graph.add_node("ranker", ranking_agent)
 
     # Define edges
     graph.set_entry_point("jd_parser")
-    graph.add_edge("jd_parser", "resume_processor")
+    graph.add_edge("jd_parser", "prefilter")
+    graph.add_edge("prefilter", "resume_processor")
     graph.add_edge("resume_processor", "ranker")
     graph.add_edge("ranker", END)
 
@@ -163,13 +204,15 @@ def build_matching_workflow() -> StateGraph:
 
 
 # Convenience function for direct usage
-def match_resumes_to_jd(jd_text: str, resume_texts: List[str]) -> Dict:
+def match_resumes_to_jd(jd_text: str, resume_texts: List[str], skill_prefilter: Optional[Dict] = None) -> Dict:
     """
     Run the complete matching workflow.
 
     Args:
         jd_text: Job description text
         resume_texts: List of resume text strings
+        skill_prefilter: {"min_skills", "max_candidates"} to match stored
+            resumes picked by the skill index instead of resume_texts
 
     Returns:
         Dict with ranked_candidates and jd_requirements
@@ -185,7 +228,8 @@ def match_resumes_to_jd(jd_text: str, resume_texts: List[str]) -> Dict:
 
     result = workflow.invoke({
         "jd_text": jd_text,
-        "resume_texts": resume_texts
+        "resume_texts": resume_texts,
+        "skill_prefilter": skill_prefilter
     })
 
     return {
@@ -193,3 +237,25 @@ def match_resumes_to_jd(jd_text: str, resume_texts: List[str]) -> Dict:
         "ranked_candidates": result["ranked_candidates"],
         "total_candidates": len(result["ranked_candidates"])
     }
+
+
+def match_database_to_jd(jd_text: str, min_skills: int = PREFILTER_MIN_SKILLS,
+                         max_candidates: int = PREFILTER_MAX_CANDIDATES) -> Dict:
+    """
+    Match a JD against stored resumes, prefiltered by must-have skills.
+
+    Only resumes with cached signals are in the skill index, so resumes that
+    were never analyzed are not considered (run the signal backfill first).
+
+    Args:
+        jd_text: Job description text
+        min_skills: Must-have skills a resume must cover to be scored
+        max_candidates: Max resumes scored (best skill coverage first)
+
+    Returns:
+        Same dict as match_resumes_to_jd()
+    """
+    return match_resumes_to_jd(
+        jd_text, [],
+        skill_prefilter={"min_skills": min_skills, "max_candidates": max_candidates}
+    )
@@ -0,0 +1,89 @@
+"""
+MinHash Signatures
+Near-duplicate detection for resumes that are not byte-identical (Word vs PDF
+export, one edited bullet, reordered contact line).
+
+Each resume is reduced to word shingles; NUM_PERM min-hashes of those
+shingles estimate the Jaccard similarity of two resumes, and banding the
+signature (LSH) gives bucket keys so only resumes sharing a bucket are ever
+compared.
+"""
+
+import hashlib
+from typing import List
+
+import numpy as np
+
+from services.embedder import tokenize
+
+NUM_PERM = 128
+
+# 16 bands x 8 rows: resumes with Jaccard 0.8 share a bucket ~95% of the
+# time, resumes with Jaccard 0.5 only ~6% of the time.
+LSH_BANDS = 16
+LSH_ROWS = NUM_PERM // LSH_BANDS
+
+# Words per shingle
+SHINGLE_SIZE = 3
+
+_MERSENNE_PRIME = np.uint64((1 << 61) - 1)
+_MAX_HASH = np.uint64(0xFFFFFFFF)
+
+# Fixed seed: signatures are stored, so the permutations must never change.
+_rng = np.random.RandomState(1)
+_PERM_A = _rng.randint(1, 1 << 32, size=NUM_PERM, dtype=np.uint64)
+_PERM_B = _rng.randint(0, 1 << 32, size=NUM_PERM, dtype=np.uint64)
+
+
+def shingles(text: str) -> set:
+    """Set of SHINGLE_SIZE-word shingles over normalized tokens."""
+    tokens = tokenize(text)
+    if len(tokens) < SHINGLE_SIZE:
+        return {" ".join(tokens)} if tokens else set()
+    return {" ".join(tokens[i:i + SHINGLE_SIZE]) for i in range(len(tokens) - SHINGLE_SIZE + 1)}
+
+
+def _hash_shingles(items) -> np.ndarray:
+    """32-bit stable hashes (Python's hash() is salted per process)."""
+    return np.array(
+        [int.from_bytes(hashlib.blake2b(s.encode(), digest_size=4).digest(), "little") for s in items],
+        dtype=np.uint64,
+    )
+
+
+def minhash_signature(text: str) -> List[int]:
+    """
+    NUM_PERM min-hashes of the text's shingles.
+
+    Returns:
+        List of NUM_PERM uint32 values (all 0xFFFFFFFF for empty text)
+    """
+    items = shingles(text)
+    if not items:
+        return [int(_MAX_HASH)] * NUM_PERM
+    hashes = _hash_shingles(items)
+    # a*h < 2^64 since a, h < 2^32, so nothing overflows before the modulo
+    permuted = ((np.outer(hashes, _PERM_A) % _MERSENNE_PRIME + _PERM_B) % _MERSENNE_PRIME) & _MAX_HASH
+    return permuted.min(axis=0).astype(np.uint32).tolist()
+
+
+def lsh_buckets(signature) -> List[str]:
+    """
+    LSH bucket keys ("<band>:<hash>") for a signature.
+
+    Returns:
+        LSH_BANDS keys, or [] for an empty-text signature (never matched)
+    """
+    values = np.asarray(signature, dtype=np.uint32)
+    if (values == np.uint32(_MAX_HASH)).all():
+        return []
+    keys = []
+    for band in range(LSH_BANDS):
+        chunk = values[band * LSH_ROWS:(band + 1) * LSH_ROWS].tobytes()
+        keys.append(f"{band}:{hashlib.blake2b(chunk, digest_size=8).hexdigest()}")
+    return keys
+
+
+def estimate_jaccard(sig_a, sig_b) -> float:
+    """Share of equal min-hashes, an unbiased Jaccard estimate."""
+    return float(np.mean(np.asarray(sig_a) == np.asarray(sig_b)))
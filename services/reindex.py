@@ -0,0 +1,264 @@
+"""
+Bulk Re-index
+Rebuilds the resumes table from the raw files on disk (default
+data/raw_resumes, searched recursively) after a schema or parser change.
+
+Files are parsed in parallel and written in large batches to a staging
+table (`resumes_reindex`); the live table keeps serving searches until the
+very end, when the staging rows are swapped in with one overwrite commit
+and every index is rebuilt. Progress is checkpointed in a JSON manifest
+after each batch, so an interrupted run picks up where it stopped (rerun
+the same command; pass --fresh to start over).
+
+Signals already extracted for unchanged text are carried over by
+fingerprint; anything else is left for `services.signal_backfill`. Pause
+uploads and the ingest daemon while re-indexing: rows added to the live
+table during the run are replaced by the swap.
+
+CLI:
+    python -m services.reindex                   # rebuild from data/raw_resumes
+    python -m services.reindex /archive --workers 8 --batch-size 1000
+    python -m services.reindex --fresh           # discard a previous partial run
+"""
+
+import argparse
+import json
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Callable, Dict, Optional
+
+from services.db import lancedb_client
+from services.db.lancedb_client import (
+    NEAR_DUPLICATE_MODES,
+    SCHEMA_VERSION,
+    _parse_signals,
+    create_staging_table,
+    generate_fingerprint,
+    lookup_fingerprints,
+    store_resumes_batch,
+    swap_in_table,
+)
+from services.ingest_daemon import scan_folder
+from services.resume_parser import EXTRACTION_TIMEOUT, PARSER_VERSION, extract_texts
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+DEFAULT_SOURCE = PROJECT_ROOT / "data" / "raw_resumes"
+DEFAULT_MANIFEST = PROJECT_ROOT / "data" / "reindex_manifest.json"
+
+STAGING_TABLE = "resumes_reindex"
+BATCH_SIZE = 500
+
+
+# ---------- MANIFEST ----------
+def _new_manifest(source: str) -> dict:
+    return {
+        "source": source,
+        "staging_table": STAGING_TABLE,
+        "schema_version": SCHEMA_VERSION,
+        "parser_version": PARSER_VERSION,
+        "started_at": time.time(),
+        "files": {},
+    }
+
+
+def _load_manifest(path: Path, source: str) -> Optional[dict]:
+    """A previous run's manifest if it can be resumed (same source, schema and parser)."""
+    if not path.exists():
+        return None
+    try:
+        manifest = json.loads(path.read_text(encoding="utf-8"))
+    except (json.JSONDecodeError, OSError):
+        return None
+    resumable = (
+        manifest.get("source") == source
+        and manifest.get("schema_version") == SCHEMA_VERSION
+        and manifest.get("parser_version") == PARSER_VERSION
+        and STAGING_TABLE in lancedb_client.db.table_names()
+    )
+    return manifest if resumable else None
+
+
+def _save_manifest(path: Path, manifest: dict):
+    """Checkpoint atomically (temp file + rename)."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_name(path.name + ".tmp")
+    tmp.write_text(json.dumps(manifest), encoding="utf-8")
+    os.replace(tmp, path)
+
+
+# ---------- REINDEX ----------
+def _stored_name(path: str, source_dir: Path) -> str:
+    """
+    Filename stored for a file: its path relative to the source directory.
+
+    Keeps the folders upload-time names carry (e.g. "<archive>/ats/cv.pdf"),
+    so same-named resumes from different folders stay apart. A symlink that
+    resolves outside the source falls back to the bare file name.
+    """
+    try:
+        return Path(path).relative_to(source_dir).as_posix()
+    except ValueError:
+        return Path(path).name
+
+
+def _carried_signals(texts) -> list:
+    """Signals already stored in the live table for identical text (None otherwise)."""
+    fps = [generate_fingerprint(text) for text in texts]
+    existing = lookup_fingerprints(fps)
+    return [_parse_signals((existing.get(fp) or {}).get("signals")) or None for fp in fps]
+
+
+def reindex(
+    source=DEFAULT_SOURCE,
+    manifest_path=DEFAULT_MANIFEST,
+    batch_size: int = BATCH_SIZE,
+    workers: int = None,
+    near_duplicates: str = "link",
+    keep_signals: bool = True,
+    fresh: bool = False,
+    progress: Optional[Callable[[Dict], None]] = None,
+    stop_event: threading.Event = None,
+) -> Dict:
+    """
+    Rebuild the resumes table from the files under `source`.
+
+    Args:
+        source: Directory searched recursively for PDF/DOCX files
+        manifest_path: Checkpoint file for resuming an interrupted run
+        batch_size: Files parsed and written per batch
+        workers: Parser processes (default: CPU count)
+        near_duplicates: "keep", "link" or "skip" (see store_resumes_batch())
+        keep_signals: Carry over signals stored for identical text
+        fresh: Ignore any checkpoint and start over
+        progress: Called with the stats dict after each batch
+        stop_event: Set it to stop after the current batch (resumable, no swap)
+
+    Returns:
+        Stats dict: total, done, resumed (files done by earlier runs), stored,
+        linked, duplicate, near_duplicate, failed, errors (first few),
+        elapsed, files_per_sec, swapped, rows
+
+    Raises:
+        ValueError: If near_duplicates is not a known mode
+        FileNotFoundError: If source is not a directory
+    """
+    if near_duplicates not in NEAR_DUPLICATE_MODES:
+        raise ValueError(f"near_duplicates must be one of {', '.join(NEAR_DUPLICATE_MODES)}")
+    source_dir = Path(source).resolve()
+    if not source_dir.is_dir():
+        raise FileNotFoundError(f"Not a directory: {source}")
+    manifest_path = Path(manifest_path)
+
+    manifest = None if fresh else _load_manifest(manifest_path, str(source_dir))
+    if manifest is None:
+        manifest = _new_manifest(str(source_dir))
+        staging = create_staging_table(STAGING_TABLE)
+        _save_manifest(manifest_path, manifest)
+    else:
+        staging = lancedb_client.db.open_table(STAGING_TABLE)
+
+    files = sorted(scan_folder(source_dir, recursive=True))
+    pending = [path for path in files if path not in manifest["files"]]
+    stats = {
+        "total": len(files), "done": len(files) - len(pending), "resumed": len(files) - len(pending),
+        "stored": 0, "linked": 0, "duplicate": 0, "near_duplicate": 0, "failed": 0, "errors": [],
+        "elapsed": 0.0, "files_per_sec": 0.0, "swapped": False, "rows": 0,
+    }
+    started = time.perf_counter()
+
+    def tick():
+        stats["elapsed"] = round(time.perf_counter() - started, 2)
+        processed = stats["done"] - stats["resumed"]
+        stats["files_per_sec"] = round(processed / stats["elapsed"], 1) if stats["elapsed"] else 0.0
+        if progress:
+            progress(dict(stats))
+
+    for start in range(0, len(pending), batch_size):
+        if stop_event is not None and stop_event.is_set():
+            tick()
+            return stats
+
+        batch = pending[start:start + batch_size]
+        results = extract_texts(batch, workers=workers, timeout=EXTRACTION_TIMEOUT)
+        parsed = []
+        for path, result in zip(batch, results):
+            if result["error"]:
+                manifest["files"][path] = "failed"
+                stats["failed"] += 1
+                if len(stats["errors"]) < 5:
+                    stats["errors"].append(f"{_stored_name(path, source_dir)}: {result['error']}")
+            else:
+                parsed.append((path, result["text"]))
+
+        if parsed:
+            texts = [text for _, text in parsed]
+            signals = _carried_signals(texts) if keep_signals else [None] * len(parsed)
+            statuses = store_resumes_batch(
+                [(_stored_name(path, source_dir), text, sig) for (path, text), sig in zip(parsed, signals)],
+                near_duplicates=near_duplicates, table=staging,
+            )
+            for (path, _), status in zip(parsed, statuses):
+                manifest["files"][path] = status
+                stats[status] += 1
+
+        stats["done"] += len(batch)
+        _save_manifest(manifest_path, manifest)
+        tick()
+
+    if staging.count_rows() == 0:
+        # Never replace the database with nothing (empty or unreadable source)
+        tick()
+        return stats
+
+    stats["rows"] = swap_in_table(staging)
+    stats["swapped"] = True
+    lancedb_client.db.drop_table(STAGING_TABLE)
+    manifest_path.unlink(missing_ok=True)
+    tick()
+    return stats
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Rebuild the LanceDB resumes table from raw resume files.")
+    parser.add_argument("source", nargs="?", default=str(DEFAULT_SOURCE), help="directory tree with PDF/DOCX files")
+    parser.add_argument("--manifest", default=str(DEFAULT_MANIFEST), help="checkpoint file (JSON)")
+    parser.add_argument("--batch-size", type=int, default=BATCH_SIZE, help="files per parse/write batch")
+    parser.add_argument("--workers", type=int, help="parser processes (default: CPU count)")
+    parser.add_argument("--near-duplicates", choices=NEAR_DUPLICATE_MODES, default="link",
+                        help="keep, link or skip near-duplicate resumes (default: %(default)s)")
+    parser.add_argument("--drop-signals", action="store_true", help="do not carry over extracted signals")
+    parser.add_argument("--fresh", action="store_true", help="discard a previous partial run")
+    args = parser.parse_args(argv)
+
+    def report(stats):
+        print(f"  📄 {stats['done']}/{stats['total']} files · {stats['files_per_sec']} files/s · "
+              f"{stats['stored'] + stats['linked']} stored, {stats['duplicate']} duplicate, {stats['failed']} failed")
+
+    print(f"🔁 Re-indexing {args.source}")
+    try:
+        stats = reindex(
+            args.source, args.manifest, batch_size=args.batch_size, workers=args.workers,
+            near_duplicates=args.near_duplicates, keep_signals=not args.drop_signals, fresh=args.fresh,
+            progress=report,
+        )
+    except FileNotFoundError as e:
+        print(f"❌ {e}")
+        return
+    except KeyboardInterrupt:
+        print("🛑 Interrupted — rerun the same command to resume.")
+        return
+
+    if stats["resumed"]:
+        print(f"  ⏩ {stats['resumed']} file(s) were already done by an earlier run")
+    for error in stats["errors"]:
+        print(f"  ❌ {error}")
+    if stats["swapped"]:
+        print(f"✅ Swapped in {stats['rows']} resumes in {stats['elapsed']}s ({stats['files_per_sec']} files/s)")
+    else:
+        print("⚠️ Nothing was stored — the existing table was left untouched.")
+
+
+if __name__ == "__main__":
+    main()
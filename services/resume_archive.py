@@ -0,0 +1,232 @@
+"""
+ZIP Archive Ingest
+Feeds the PDF/DOCX files inside a ZIP export (ATS downloads, email
+attachments) to the ingest pipeline without unpacking it to disk.
+
+Only the archive's central directory is read up front. Each member is a
+lazy, upload-like object that decompresses itself when the pipeline's parse
+stage reads it, so memory holds the few members in flight, not the archive's
+contents. Directories, hidden files and macOS metadata are ignored; nested
+archives, encrypted, oversized and non-resume members are reported as
+skipped.
+
+Members are named by their path inside the archive, under the archive's
+stem ("export.zip" member "ats/resume.pdf" -> "export/ats/resume.pdf"), so
+same-named files from different folders or exports never overwrite each
+other in data/raw_resumes.
+
+CLI (signals use LLM_PROVIDER / LLM_API_KEY / LLM_MODEL, as for the ingest
+daemon):
+    python -m services.resume_archive exports.zip
+    python -m services.resume_archive exports.zip --workers 4 --no-signals
+"""
+
+import argparse
+import zipfile
+from pathlib import Path, PurePosixPath
+from typing import Callable, Dict, List, Optional, Tuple
+
+from services.db.lancedb_client import NEAR_DUPLICATE_MODES
+from services.ingest_daemon import LLM_WORKERS, SUPPORTED_SUFFIXES, _resolve_llm
+from services.ingest_pipeline import run_ingest_pipeline
+from services.resume_parser import EXTRACTION_TIMEOUT
+
+ARCHIVE_SUFFIXES = (".zip",)
+
+# Uncompressed size limit per member: far above any real resume, and a
+# guard against zip bombs (zipfile never reads past the declared size).
+MAX_MEMBER_BYTES = 25 * 1024 * 1024
+
+_COMPRESSION = (zipfile.ZIP_STORED, zipfile.ZIP_DEFLATED, zipfile.ZIP_BZIP2, zipfile.ZIP_LZMA)
+
+
+def is_archive(filename: str) -> bool:
+    return Path(filename).suffix.lower() in ARCHIVE_SUFFIXES
+
+
+class ZipMember:
+    """
+    One resume inside an archive, readable like an uploaded file.
+
+    Nothing is decompressed until the first read(); the member is closed
+    again at end of data. getbuffer() decompresses a fresh copy (used to
+    save stored resumes to data/raw_resumes).
+    """
+
+    def __init__(self, archive: zipfile.ZipFile, info: zipfile.ZipInfo):
+        self.archive = archive
+        self.info = info
+        self.name = member_name(archive, info)
+        self.path = info.filename
+        self.size = info.file_size
+        self._f = None
+        self._done = False
+
+    def read(self, size: int = -1) -> bytes:
+        if self._done:
+            return b""
+        if self._f is None:
+            self._f = self.archive.open(self.info)
+        data = self._f.read(size)
+        if not data or size is None or size < 0:
+            self.close()
+        return data
+
+    def close(self):
+        self._done = True
+        if self._f is not None:
+            self._f.close()
+            self._f = None
+
+    def getbuffer(self) -> bytes:
+        with self.archive.open(self.info) as f:
+            return f.read()
+
+
+def member_name(archive: zipfile.ZipFile, info: zipfile.ZipInfo) -> str:
+    """
+    Collision-safe relative name for a member: "<archive stem>/<path in archive>".
+
+    "..", "." and empty path parts are dropped (and backslashes treated as
+    separators), so the name can be joined under an upload directory safely.
+    """
+    parts = [part for part in info.filename.replace("\\", "/").split("/") if part not in ("", ".", "..")]
+    if archive.filename:
+        stem = Path(archive.filename).stem
+        if stem not in ("", ".", ".."):
+            parts.insert(0, stem)
+    return "/".join(parts)
+
+
+def _skip_reason(info: zipfile.ZipInfo) -> Optional[str]:
+    """Why a member is not ingested ("" = ignore silently, None = ingest it)."""
+    path = PurePosixPath(info.filename)
+    if info.is_dir() or "__MACOSX" in path.parts or path.name.startswith((".", "~$")):
+        return ""
+    suffix = path.suffix.lower()
+    if suffix in ARCHIVE_SUFFIXES:
+        return "nested archive"
+    if suffix not in SUPPORTED_SUFFIXES:
+        return "not a PDF/DOCX file"
+    if info.flag_bits & 0x1:
+        return "encrypted"
+    if info.compress_type not in _COMPRESSION:
+        return "unsupported compression"
+    if info.file_size > MAX_MEMBER_BYTES:
+        return f"larger than {MAX_MEMBER_BYTES // (1024 * 1024)} MB"
+    return None
+
+
+def open_archive(source) -> Tuple[zipfile.ZipFile, List[ZipMember], List[Tuple[str, str]]]:
+    """
+    Open a ZIP archive and list its resumes (central directory only).
+
+    Args:
+        source: Path or seekable binary file-like object (e.g. a Streamlit
+            UploadedFile)
+
+    Returns:
+        (open ZipFile — close it when done, resume members in archive order,
+        skipped members as (path, reason))
+
+    Raises:
+        ValueError: If source is not a readable ZIP archive
+    """
+    if hasattr(source, "seek"):
+        source.seek(0)
+    try:
+        archive = zipfile.ZipFile(source)
+    except (zipfile.BadZipFile, OSError) as e:
+        raise ValueError(f"Not a readable ZIP archive: {e}") from e
+
+    members, skipped = [], []
+    for info in archive.infolist():
+        reason = _skip_reason(info)
+        if reason is None:
+            members.append(ZipMember(archive, info))
+        elif reason:
+            skipped.append((info.filename, reason))
+    return archive, members, skipped
+
+
+def ingest_archive(
+    source,
+    llm=None,
+    near_duplicates: str = "link",
+    workers: int = None,
+    llm_workers: int = LLM_WORKERS,
+    timeout: float = EXTRACTION_TIMEOUT,
+    progress: Optional[Callable[[Dict], None]] = None,
+) -> Dict:
+    """
+    Parse, dedup, extract signals for and store every resume in a ZIP archive.
+
+    Args:
+        source: Archive path or binary file-like object
+        llm: Chat model for signal extraction (None = store without signals)
+        near_duplicates: "keep", "link" or "skip" (see store_resumes_batch())
+        workers: Parser processes (default: CPU count)
+        llm_workers: Concurrent signal extraction calls
+        timeout: Wall-clock seconds allowed per file parse
+        progress: Called with every pipeline event
+
+    Returns:
+        Pipeline counts plus skipped (list of (path, reason)), errors
+        (list of "name: error") and elapsed seconds
+
+    Raises:
+        ValueError: If source is not a ZIP archive or near_duplicates is unknown
+    """
+    archive, members, skipped = open_archive(source)
+    errors = []
+    with archive:
+        for event in run_ingest_pipeline(
+            members, llm=llm, near_duplicates=near_duplicates, parse_workers=workers,
+            llm_concurrency=llm_workers, timeout=timeout,
+        ):
+            if event["event"] == "failed":
+                errors.append(f"{members[event['index']].path}: {event['error']}")
+            elif event["event"] == "error":
+                errors.append(f"{event['stage']} stage: {event['error']}")
+            if progress:
+                progress(event)
+    return {**event["counts"], "skipped": skipped, "errors": errors, "elapsed": event["elapsed"]}
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Ingest the resumes inside a ZIP archive into LanceDB.")
+    parser.add_argument("archive", help="ZIP file with PDF/DOCX resumes")
+    parser.add_argument("--near-duplicates", choices=NEAR_DUPLICATE_MODES, default="link",
+                        help="keep, link or skip near-duplicate resumes (default: %(default)s)")
+    parser.add_argument("--workers", type=int, help="parser processes (default: CPU count)")
+    parser.add_argument("--llm-workers", type=int, default=LLM_WORKERS, help="concurrent LLM calls")
+    parser.add_argument("--no-signals", action="store_true", help="skip LLM signal extraction")
+    args = parser.parse_args(argv)
+
+    if not Path(args.archive).is_file():
+        print(f"❌ File not found: {args.archive}")
+        return
+    llm = None if args.no_signals else _resolve_llm()
+
+    print(f"📦 Ingesting {args.archive}")
+    try:
+        stats = ingest_archive(
+            args.archive, llm=llm, near_duplicates=args.near_duplicates, workers=args.workers,
+            llm_workers=args.llm_workers,
+        )
+    except ValueError as e:
+        print(f"❌ {e}")
+        return
+
+    for path, reason in stats["skipped"]:
+        print(f"  ⏭️ {path}: {reason}")
+    for error in stats["errors"]:
+        print(f"  ❌ {error}")
+    rate = round(stats["total"] / stats["elapsed"], 1) if stats["elapsed"] else 0.0
+    print(f"✅ {stats['stored']} stored, {stats['linked']} linked, {stats['duplicate']} duplicate, "
+          f"{stats['near_duplicate']} near-duplicate, {stats['failed']} failed "
+          f"in {stats['elapsed']}s ({rate} files/s)")
+
+
+if __name__ == "__main__":
+    main()
@@ -6,10 +6,17 @@ Extracts structured signals from resumes for evidence-based scoring.
 from typing import TypedDict, List, Optional, Dict
 from langchain_core.prompts import PromptTemplate
 from services.llm_config import get_llm, extract_json
+from services.resume_sections import (
+    SUMMARY, EXPERIENCE, SKILLS, EDUCATION, PROJECTS, CERTIFICATIONS, AWARDS, section_text,
+)
 from datetime import datetime
 import json
 CURRENT_YEAR = datetime.now().year
 
+# Sections signal extraction reads (contact header, hobbies, references etc. are left out;
+# awards stay in, they often hold the measurable outcomes)
+SIGNAL_SECTIONS = (SUMMARY, EXPERIENCE, SKILLS, EDUCATION, PROJECTS, CERTIFICATIONS, AWARDS)
+
 
 class ResumeSignals(TypedDict):
     """Structured resume signals for scoring"""
@@ -23,12 +30,19 @@ class ResumeSignals(TypedDict):
     certifications: List[str]
 
 
-def extract_resume_signals(resume_text: str) -> ResumeSignals:
+def extract_resume_signals(resume_text: str, llm=None, sections=None) -> ResumeSignals:
     """
     Extract all structured signals from resume for evidence-based scoring.
 
+    Only the SIGNAL_SECTIONS of the resume are sent to the LLM (the full text
+    if no section headings are found).
+
     Args:
         resume_text: Raw resume text
+        llm: Chat model to use (default: get_llm(temperature=0)). Pass one in
+            when calling from worker threads, which cannot read session state.
+        sections: Stored segment_sections() output for resume_text (list or
+            JSON); segmented here if None
 
     Returns:
         ResumeSignals dict with all extracted fields
@@ -107,9 +121,9 @@ Return ONLY valid JSON (no markdown, no explanation):
 """
     )
 
-    llm = get_llm(temperature=0)
+    llm = llm or get_llm(temperature=0)
     response = llm.invoke(prompt.format(
-        resume=resume_text,
+        resume=section_text(resume_text, sections, SIGNAL_SECTIONS),
         current_year=CURRENT_YEAR,
         current_year_minus1=CURRENT_YEAR - 1
     ))
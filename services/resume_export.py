@@ -0,0 +1,103 @@
+"""
+Streaming Resume Export
+Writes the resumes table to CSV, Parquet or JSONL one record batch at a
+time, so memory stays flat no matter how many resumes are stored.
+"""
+
+import json
+import os
+import tempfile
+from pathlib import Path
+
+import pyarrow as pa
+import pyarrow.csv as pa_csv
+import pyarrow.parquet as pq
+
+from services.db.lancedb_client import SIGNAL_COLUMNS, _parse_signals, iter_resume_batches
+
+EXPORT_FORMATS = {
+    "CSV": {"suffix": ".csv", "mime": "text/csv"},
+    "Parquet": {"suffix": ".parquet", "mime": "application/vnd.apache.parquet"},
+    "JSONL": {"suffix": ".jsonl", "mime": "application/x-ndjson"},
+}
+
+EXPORT_BATCH_SIZE = 1000
+
+_LIST_COLUMNS = ("skills", "domains")
+
+
+def _export_columns(include_text: bool):
+    return ["id", "filename", *(["text"] if include_text else []), "signals", *SIGNAL_COLUMNS]
+
+
+def _flatten_lists(batch: pa.RecordBatch) -> pa.Table:
+    """CSV cannot hold list columns: join skills/domains with '; '."""
+    table = pa.Table.from_batches([batch])
+    for name in _LIST_COLUMNS:
+        index = table.schema.get_field_index(name)
+        joined = ["; ".join(values) if values else "" for values in table.column(name).to_pylist()]
+        table = table.set_column(index, name, pa.array(joined, type=pa.string()))
+    return table
+
+
+def _write_csv(batches, path):
+    writer = None
+    try:
+        for batch in batches:
+            flat = _flatten_lists(batch)
+            if writer is None:
+                writer = pa_csv.CSVWriter(path, flat.schema)
+            writer.write_table(flat)
+    finally:
+        if writer is not None:
+            writer.close()
+    if writer is None:
+        Path(path).write_text("")
+
+
+def _write_parquet(batches, path, schema):
+    with pq.ParquetWriter(path, schema) as writer:
+        for batch in batches:
+            writer.write_batch(batch)
+
+
+def _write_jsonl(batches, path):
+    with open(path, "w", encoding="utf-8") as f:
+        for batch in batches:
+            for row in batch.to_pylist():
+                row["signals"] = _parse_signals(row["signals"])
+                f.write(json.dumps(row, ensure_ascii=False) + "\n")
+
+
+def export_resumes(fmt: str = "CSV", path: str = None, include_text: bool = True,
+                   batch_size: int = EXPORT_BATCH_SIZE) -> Path:
+    """
+    Export every stored resume, streaming record batches to disk.
+
+    Args:
+        fmt: "CSV", "Parquet" or "JSONL"
+        path: Output file (default: a new temp file)
+        include_text: Export full resume text (not just a preview)
+        batch_size: Rows held in memory at a time
+
+    Returns:
+        Path of the written file
+
+    Raises:
+        ValueError: If the format is not supported
+    """
+    if fmt not in EXPORT_FORMATS:
+        raise ValueError(f"Unsupported export format: {fmt}. Choose from {', '.join(EXPORT_FORMATS)}.")
+
+    if path is None:
+        fd, path = tempfile.mkstemp(prefix="resumes_export_", suffix=EXPORT_FORMATS[fmt]["suffix"])
+        os.close(fd)
+
+    reader = iter_resume_batches(_export_columns(include_text), batch_size=batch_size)
+    if fmt == "CSV":
+        _write_csv(reader, path)
+    elif fmt == "Parquet":
+        _write_parquet(reader, path, reader.schema)
+    else:
+        _write_jsonl(reader, path)
+    return Path(path)
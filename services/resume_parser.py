@@ -1,14 +1,277 @@
 from pypdf import PdfReader
 import docx
+import hashlib
+import io
+import multiprocessing
 import os
+import signal
+import threading
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures import TimeoutError as FutureTimeout
+from concurrent.futures.process import BrokenProcessPool
+from contextlib import contextmanager
+from functools import partial
+from typing import Callable, Dict, Iterator, List, Optional, Tuple
+from xml.etree.ElementTree import ParseError
 
+from services.docx_text import docx_text
+from services.extraction_cache import get_cached_text, put_cached_text
+from services.resume_sections import segment_sections
 
-def extract_text(file_path: str) -> str:
+# Bump whenever extraction output changes so cached text is not reused.
+PARSER_VERSION = "3"
+
+# Below this many files a process pool costs more than it saves.
+PARALLEL_MIN_FILES = 4
+
+# Bytes read (and hashed) per read() call.
+READ_CHUNK_SIZE = 1 << 20
+
+# Extraction budgets: resumes rarely need more than a few pages, and long
+# portfolios or scanned books should not stall ingest or bloat prompts.
+PDF_MAX_PAGES = 10
+MAX_TEXT_CHARS = 60_000
+
+# Wall-clock seconds per file for bulk extraction (pages pass this along).
+EXTRACTION_TIMEOUT = 30
+
+# Extra seconds a worker process gets (process start-up) before the parent
+# stops waiting for it and kills it.
+TIMEOUT_GRACE = 5
+
+# Signal the parent kills unresponsive workers with
+_KILL_SIGNAL = getattr(signal, "SIGKILL", signal.SIGTERM)
+
+
+def _read_hashed(f) -> Tuple[bytes, str]:
+    digest = hashlib.sha256()
+    chunks = []
+    while True:
+        chunk = f.read(READ_CHUNK_SIZE)
+        if not chunk:
+            break
+        digest.update(chunk)
+        chunks.append(chunk)
+    return b"".join(chunks), digest.hexdigest()
+
+
+def read_source(source) -> Tuple[bytes, str, Optional[str]]:
+    """
+    Read a resume source once, hashing it while reading.
+
+    Args:
+        source: File path, bytes, or binary file-like object (e.g. a
+            Streamlit UploadedFile; read from the start)
+
+    Returns:
+        (raw bytes, SHA-256 hex digest, file name or None)
+
+    Raises:
+        FileNotFoundError: If a path does not exist
+    """
+    if isinstance(source, (bytes, bytearray, memoryview)):
+        data = bytes(source)
+        return data, hashlib.sha256(data).hexdigest(), None
+
+    if isinstance(source, (str, os.PathLike)):
+        path = os.fspath(source)
+        if not os.path.exists(path):
+            raise FileNotFoundError(f"File not found: {path}")
+        with open(path, "rb") as f:
+            data, digest = _read_hashed(f)
+        return data, digest, path
+
+    if hasattr(source, "seek"):
+        source.seek(0)
+    data, digest = _read_hashed(source)
+    return data, digest, getattr(source, "name", None)
+
+
+def _file_type(filename: Optional[str], data: bytes) -> str:
+    """Extension from the file name, or sniffed from the content if there is no name."""
+    if filename:
+        return os.path.splitext(filename)[1].lower()
+    if data.startswith(b"%PDF"):
+        return ".pdf"
+    if data.startswith(b"PK\x03\x04"):
+        return ".docx"
+    return ""
+
+
+class ExtractionTimeout(TimeoutError):
+    """Parsing a file took longer than its wall-clock budget."""
+
+
+def iter_pdf_pages(data: bytes, max_pages: int = PDF_MAX_PAGES) -> Iterator[str]:
+    """
+    Yield PDF page text one page at a time.
+
+    Pages are parsed lazily, so stopping early (budgets, timeouts) skips the
+    work for the remaining pages.
+
+    Args:
+        data: Raw PDF bytes
+        max_pages: Stop after this many pages (None = all)
+    """
+    reader = PdfReader(io.BytesIO(data))
+    for index, page in enumerate(reader.pages):
+        if max_pages is not None and index >= max_pages:
+            return
+        yield page.extract_text() or ""
+
+
+def _pdf_text(data: bytes, max_pages: int, max_chars: int) -> str:
+    parts = []
+    size = 0
+    for page_text in iter_pdf_pages(data, max_pages):
+        parts.append(page_text)
+        size += len(page_text) + 1
+        if max_chars is not None and size >= max_chars:
+            break
+    text = "\n".join(parts)
+    return text[:max_chars] if max_chars is not None else text
+
+
+def parse_bytes(data: bytes, filename: str = None, max_pages: int = PDF_MAX_PAGES,
+                max_chars: int = MAX_TEXT_CHARS) -> str:
+    """
+    Extract text from in-memory PDF or DOCX content.
+
+    Args:
+        data: Raw file bytes
+        filename: Original name (its extension picks the parser; content is
+            sniffed when omitted)
+        max_pages: PDF page budget (None = all pages)
+        max_chars: Character budget (None = unlimited)
+
+    Returns:
+        Extracted text content
+
+    Raises:
+        ValueError: If file type is not supported
+    """
+    file_type = _file_type(filename, data)
+
+    if file_type == ".pdf":
+        return _pdf_text(data, max_pages, max_chars).strip()
+
+    if file_type == ".docx":
+        try:
+            # Streams the XML parts; also keeps table, header and text-box text
+            text = docx_text(data)
+        except (KeyError, ParseError):
+            # Unusual package layout: let python-docx resolve it (paragraphs only)
+            doc = docx.Document(io.BytesIO(data))
+            text = "\n".join(p.text for p in doc.paragraphs)
+        return (text[:max_chars] if max_chars is not None else text).strip()
+
+    raise ValueError(f"Unsupported file type: {file_type or 'unknown'}. Only .pdf and .docx are supported.")
+
+
+# ---------- TIME LIMITS ----------
+def _can_time_limit() -> bool:
+    """SIGALRM timers only work on Unix, in a process's main thread."""
+    return hasattr(signal, "setitimer") and threading.current_thread() is threading.main_thread()
+
+
+@contextmanager
+def _time_limit(seconds: float):
+    """Raise ExtractionTimeout in the block after `seconds` (no-op if None or unavailable)."""
+    if not seconds or not _can_time_limit():
+        yield
+        return
+
+    def _expired(signum, frame):
+        raise ExtractionTimeout(f"Extraction took longer than {seconds}s")
+
+    previous = signal.signal(signal.SIGALRM, _expired)
+    signal.setitimer(signal.ITIMER_REAL, seconds)
+    try:
+        yield
+    finally:
+        signal.setitimer(signal.ITIMER_REAL, 0)
+        signal.signal(signal.SIGALRM, previous)
+
+
+def _parse_limited(data: bytes, filename: str, max_pages: int, max_chars: int, timeout: float = None) -> str:
+    with _time_limit(timeout):
+        return parse_bytes(data, filename, max_pages, max_chars)
+
+
+def _parse_with_timeout(data: bytes, filename: str, max_pages: int, max_chars: int, timeout: float) -> str:
+    """
+    parse_bytes() under a wall-clock limit.
+
+    In a main thread the limit is a SIGALRM timer; elsewhere (e.g. a
+    Streamlit script thread) the file is parsed in an isolated worker
+    process that enforces the timer itself.
+    """
+    if _can_time_limit():
+        return _parse_limited(data, filename, max_pages, max_chars, timeout)
+    with ParserPool(1, timeout, task=_parse_limited) as pool:
+        pool.submit(data, filename, max_pages, max_chars)
+        return pool.next_result()
+
+
+# ---------- EXTRACTION ----------
+def cache_version(max_pages: int = PDF_MAX_PAGES, max_chars: int = MAX_TEXT_CHARS) -> str:
+    """Extraction cache version: PARSER_VERSION plus the budgets the text was cut to."""
+    return f"{PARSER_VERSION}/pages={max_pages}/chars={max_chars}"
+
+
+def extract_text_hashed(source, filename: str = None, timeout: float = None, max_pages: int = PDF_MAX_PAGES,
+                        max_chars: int = MAX_TEXT_CHARS) -> Tuple[str, str]:
+    """
+    Extract text and the SHA-256 of the raw file from a single read.
+
+    The digest is looked up in the extraction cache first; only unseen
+    content (or content parsed by an older PARSER_VERSION or under other
+    budgets) is parsed.
+
+    Args:
+        source: File path, bytes, or binary file-like object
+        filename: Name used to pick the parser (default: the path or the
+            object's `name`)
+        timeout: Wall-clock seconds allowed for parsing (None = no limit)
+        max_pages: PDF page budget (None = all pages)
+        max_chars: Character budget (None = unlimited)
+
+    Returns:
+        (extracted text, SHA-256 hex digest of the raw bytes)
+
+    Raises:
+        ExtractionTimeout: If parsing exceeded `timeout`
+    """
+    data, digest, name = read_source(source)
+    version = cache_version(max_pages, max_chars)
+    text = get_cached_text(digest, version)
+    if text is None:
+        if timeout:
+            text = _parse_with_timeout(data, filename or name, max_pages, max_chars, timeout)
+        else:
+            text = parse_bytes(data, filename or name, max_pages, max_chars)
+        put_cached_text(digest, version, text)
+    return text, digest
+
+
+def extract_text(source, filename: str = None, timeout: float = None, max_pages: int = PDF_MAX_PAGES,
+                 max_chars: int = MAX_TEXT_CHARS) -> str:
     """
     Extract text from PDF or DOCX files.
 
+    PDFs are read page by page and stop at `max_pages` pages (default
+    PDF_MAX_PAGES); text is capped at `max_chars` characters (default
+    MAX_TEXT_CHARS).
+
     Args:
-        file_path: Path to the resume file
+        source: Path to the resume file, its bytes, or a binary file-like
+            object (no temp file needed for uploads)
+        filename: Name used to pick the parser for bytes/file objects
+        timeout: Wall-clock seconds allowed for parsing (None = no limit)
+        max_pages: PDF page budget (None = all pages)
+        max_chars: Character budget (None = unlimited)
 
     Returns:
         Extracted text content
@@ -16,18 +279,252 @@ def extract_text(file_path: str) -> str:
     Raises:
         FileNotFoundError: If file does not exist
         ValueError: If file type is not supported
+        ExtractionTimeout: If parsing exceeded `timeout`
     """
-    if not os.path.exists(file_path):
-        raise FileNotFoundError(f"File not found: {file_path}")
+    return extract_text_hashed(source, filename, timeout, max_pages, max_chars)[0]
+
+
+def _extract_one(item, max_pages: int = PDF_MAX_PAGES, max_chars: int = MAX_TEXT_CHARS,
+                 timeout: float = None) -> Dict:
+    """Worker: extract one file (path or (name, bytes)), capturing any error instead of raising."""
+    if isinstance(item, tuple):
+        name, source = item
+    else:
+        name, source = item, item
+    try:
+        text, digest = extract_text_hashed(source, name, timeout, max_pages, max_chars)
+        return {"source": name, "text": text, "sha256": digest, "sections": segment_sections(text), "error": None}
+    except Exception as e:
+        return _failed(item, e)
+
+
+def _failed(item, error: Exception) -> Dict:
+    """_extract_one()'s result for a file that could not be extracted."""
+    name = item[0] if isinstance(item, tuple) else item
+    return {"source": name, "text": None, "sha256": None, "sections": None,
+            "error": f"{type(error).__name__}: {error}"}
+
+
+# ---------- WORKER POOL ----------
+def _register_worker(pids):
+    """Pool initializer: report this worker's PID so the parent can kill it."""
+    pids.put(os.getpid())
+
+
+class ParserPool:
+    """
+    Process pool whose per-file deadlines are enforced by the parent.
+
+    Tasks are collected in submission order. Each worker runs its own
+    SIGALRM timer, but a parse stuck in C code (e.g. a decompression bomb)
+    never sees it: once the oldest task has been at the head of the queue
+    for timeout + TIMEOUT_GRACE seconds, the pool's workers (whose PIDs the
+    pool records itself) are killed, that task fails with ExtractionTimeout
+    and the unfinished tasks behind it are resubmitted to a fresh pool.
+    Workers are started with spawn, not fork: the parent may hold LanceDB
+    handles, which are not fork-safe.
+
+    The timer starts when a task reaches the head, not when it is
+    submitted: workers take tasks in order, so by then it is running.
+    """
+
+    def __init__(self, workers: int, timeout: float = None, task: Callable = None):
+        self.workers = workers
+        self.timeout = timeout
+        self.task = task or _extract_one
+        self._context = multiprocessing.get_context("spawn")
+        self._pool = None
+        self._pids = None
+        self._window = deque()  # [args, future] in submission order
+        self._head_since = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def __len__(self) -> int:
+        return len(self._window)
+
+    def _submit(self, args):
+        if self._pool is None:
+            self._pids = self._context.SimpleQueue()
+            self._pool = ProcessPoolExecutor(
+                max_workers=self.workers, mp_context=self._context,
+                initializer=_register_worker, initargs=(self._pids,),
+            )
+        return self._pool.submit(self.task, *args, timeout=self.timeout)
+
+    def submit(self, *args):
+        """Queue task(*args, timeout=timeout)."""
+        if not self._window:
+            self._head_since = time.monotonic()
+        self._window.append([args, self._submit(args)])
+
+    def next_result(self):
+        """
+        Result of the oldest pending task.
+
+        Raises:
+            ExtractionTimeout: If the task missed its deadline (its worker is killed)
+            BrokenProcessPool: If its worker died
+            Exception: Whatever the task itself raised
+        """
+        _, future = self._window[0]
+        try:
+            if not self.timeout:
+                return future.result()
+            deadline = self._head_since + self.timeout + TIMEOUT_GRACE
+            try:
+                return future.result(timeout=max(0.0, deadline - time.monotonic()))
+            except FutureTimeout:
+                self._kill()
+                raise ExtractionTimeout(f"Extraction took longer than {self.timeout}s") from None
+        except BrokenProcessPool:
+            self._kill()
+            raise
+        finally:
+            self._window.popleft()
+            self._head_since = time.monotonic()
+            if self._pool is None:
+                self._resubmit()
+
+    def _kill(self):
+        """Kill every worker of the current pool (running tasks are lost)."""
+        while not self._pids.empty():
+            try:
+                os.kill(self._pids.get(), _KILL_SIGNAL)
+            except ProcessLookupError:
+                pass
+        self._pool.shutdown(wait=False, cancel_futures=True)
+        self._pool = None
+
+    def _resubmit(self):
+        """Hand the unfinished tasks of a killed pool to a fresh one."""
+        for entry in self._window:
+            future = entry[1]
+            if not future.done() or future.cancelled() or isinstance(future.exception(), BrokenProcessPool):
+                entry[1] = self._submit(entry[0])
+
+    def close(self):
+        """Shut down; workers still busy with abandoned tasks are killed."""
+        if self._pool is None:
+            return
+        if self._window:
+            self._kill()
+            self._window.clear()
+        else:
+            self._pool.shutdown(wait=True)
+            self._pool = None
+
+
+def _pool_result(pool: ParserPool, item) -> Dict:
+    """Next _extract_one() result from `pool`, or a failure for `item` if its worker was lost."""
+    try:
+        return pool.next_result()
+    except Exception as e:
+        return _failed(item, e)
+
+
+def _hash_file(path: str) -> str:
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(partial(f.read, READ_CHUNK_SIZE), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _cached_result(item, version: str) -> Optional[Dict]:
+    """_extract_one()'s result for an already-extracted file, from the cache (None on a miss)."""
+    if isinstance(item, tuple):
+        name, data = item
+        digest = hashlib.sha256(data).hexdigest()
+    else:
+        name = item
+        try:
+            digest = _hash_file(item)
+        except OSError:
+            return None  # the worker reports the error
+    text = get_cached_text(digest, version)
+    if text is None:
+        return None
+    return {"source": name, "text": text, "sha256": digest, "sections": segment_sections(text), "error": None}
+
+
+def _as_work_item(source):
+    """Paths go to workers as-is; in-memory sources are read here into (name, bytes)."""
+    if isinstance(source, (str, os.PathLike)):
+        return os.fspath(source)
+    if isinstance(source, (bytes, bytearray, memoryview)):
+        return None, bytes(source)
+    data, _, name = read_source(source)
+    return name, data
+
+
+def extract_texts(
+    sources,
+    workers: int = None,
+    progress: Optional[Callable[[int, int], None]] = None,
+    timeout: float = None,
+    max_pages: int = PDF_MAX_PAGES,
+    max_chars: int = MAX_TEXT_CHARS,
+) -> List[Dict]:
+    """
+    Extract text from many PDF/DOCX files in parallel.
+
+    Files are dispatched to a ParserPool of worker processes (pypdf and
+    python-docx are pure Python, so threads would share one core). Paths are
+    read by the workers; bytes and file-like objects (uploads) are read once
+    here and shipped as bytes. Files already in the extraction cache are
+    answered here without starting a pool. A failing or timed-out file never
+    stops the others, even one whose worker has to be killed.
+
+    Args:
+        sources: Iterable of file paths, bytes or binary file-like objects
+        workers: Worker processes (default: CPU count; 1 = run in-process)
+        progress: Called with (done, total) as results come in
+        timeout: Wall-clock seconds allowed per file (None = no limit). When
+            this thread cannot set timers, files always go to worker processes.
+        max_pages: PDF page budget per file (None = all pages)
+        max_chars: Character budget per file (None = unlimited)
+
+    Returns:
+        List of {"source", "text", "sha256", "sections", "error"} dicts in
+        input order (source is the path or file name; sections is the
+        resume_sections.segment_sections() split of text); text is None and
+        error holds the message for files that failed
+    """
+    items = [_as_work_item(source) for source in sources]
+    total = len(items)
+
+    # Cache hits are answered here: only unseen files are worth a worker process
+    version = cache_version(max_pages, max_chars)
+    results = [_cached_result(item, version) for item in items]
+    misses = [i for i, result in enumerate(results) if result is None]
+    done = total - len(misses)
+    if progress and done:
+        progress(done, total)
+    if not misses:
+        return results
+
+    workers = max(1, min(workers or os.cpu_count() or 1, len(misses) or 1))
+    isolate = bool(timeout) and not _can_time_limit()
 
-    if file_path.endswith(".pdf"):
-        reader = PdfReader(file_path)
-        text = "\n".join(p.extract_text() or "" for p in reader.pages)
-        return text.strip()
+    def collect(extracted):
+        nonlocal done
+        for i, result in zip(misses, extracted):
+            results[i] = result
+            done += 1
+            if progress:
+                progress(done, total)
 
-    if file_path.endswith(".docx"):
-        doc = docx.Document(file_path)
-        text = "\n".join(p.text for p in doc.paragraphs)
-        return text.strip()
+    if (workers == 1 or len(misses) < PARALLEL_MIN_FILES) and not isolate:
+        collect(_extract_one(items[i], max_pages, max_chars, timeout) for i in misses)
+        return results
 
-    raise ValueError(f"Unsupported file type: {os.path.splitext(file_path)[1]}. Only .pdf and .docx are supported.")
+    with ParserPool(workers, timeout) as pool:
+        for i in misses:
+            pool.submit(items[i], max_pages, max_chars)
+        collect(_pool_result(pool, items[i]) for i in misses)
+    return results
@@ -44,6 +44,7 @@ Return ONLY valid JSON:
 )
 
     llm = get_llm(temperature=0)
+    # Whole text, not sections: format and completeness are scored too
     response = llm.invoke(
         prompt.format(resume=state["parsed"])
     )
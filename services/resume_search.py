@@ -0,0 +1,86 @@
+"""
+Hybrid Resume Retrieval
+Fuses BM25 keyword hits and vector hits with reciprocal-rank fusion (RRF) so
+only a small, fixed number of candidates needs LLM review.
+"""
+
+from typing import Dict, List
+
+from services.db.lancedb_client import get_resumes_by_ids, keyword_search, search_resumes
+
+# Standard RRF damping constant (Cormack et al.): larger = flatter fusion.
+RRF_K = 60
+
+# How many hits to pull from each retriever before fusing.
+RETRIEVER_DEPTH = 50
+
+
+def reciprocal_rank_fusion(ranked_lists: List[List[str]], rrf_k: int = RRF_K) -> List[tuple]:
+    """
+    Fuse several ranked id lists.
+
+    Each id scores sum(1 / (rrf_k + rank)) over the lists it appears in
+    (rank starts at 1), so items ranked well by several retrievers win.
+
+    Args:
+        ranked_lists: Lists of ids, best first
+        rrf_k: Damping constant
+
+    Returns:
+        List of (id, fused_score), best first
+    """
+    scores: Dict[str, float] = {}
+    for ranked in ranked_lists:
+        for rank, item_id in enumerate(ranked, start=1):
+            scores[item_id] = scores.get(item_id, 0.0) + 1.0 / (rrf_k + rank)
+    return sorted(scores.items(), key=lambda item: item[1], reverse=True)
+
+
+def hybrid_search(query: str, top_n: int = 10, filters: str = None,
+                  depth: int = RETRIEVER_DEPTH, include_near_duplicates: bool = False) -> List[Dict]:
+    """
+    Retrieve the top_n resumes for a query across the whole database.
+
+    Args:
+        query: Recruiter query (keywords or natural language)
+        top_n: Number of fused candidates to return
+        filters: Optional SQL `where` clause applied to both retrievers
+        depth: Hits taken from each retriever before fusion
+        include_near_duplicates: Also return resumes linked to an original
+            (duplicate_of set), which would otherwise rank the same candidate twice
+
+    Returns:
+        List of {"id", "filename", "text", "rrf_score", "keyword_rank",
+        "vector_rank"} dicts, best first. Ranks are None when the retriever
+        did not return the resume.
+    """
+    depth = max(depth, top_n)
+    if not include_near_duplicates:
+        filters = f"({filters}) AND duplicate_of IS NULL" if filters else "duplicate_of IS NULL"
+    keyword_hits = keyword_search(query, k=depth, filters=filters)
+    vector_hits = search_resumes(query, k=depth, filters=filters)
+
+    keyword_ids = [hit["id"] for hit in keyword_hits]
+    vector_ids = [hit["id"] for hit in vector_hits]
+    fused = reciprocal_rank_fusion([keyword_ids, vector_ids])[:top_n]
+    if not fused:
+        return []
+
+    rows = get_resumes_by_ids([item_id for item_id, _ in fused], columns=["id", "filename", "text"])
+    keyword_rank = {item_id: rank for rank, item_id in enumerate(keyword_ids, start=1)}
+    vector_rank = {item_id: rank for rank, item_id in enumerate(vector_ids, start=1)}
+
+    results = []
+    for item_id, score in fused:
+        row = rows.get(item_id)
+        if row is None:
+            continue
+        results.append({
+            "id": item_id,
+            "filename": row["filename"],
+            "text": row["text"],
+            "rrf_score": score,
+            "keyword_rank": keyword_rank.get(item_id),
+            "vector_rank": vector_rank.get(item_id),
+        })
+    return results
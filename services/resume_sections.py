@@ -0,0 +1,174 @@
+"""
+Resume Section Segmenter
+Splits extracted resume text into Summary / Experience / Skills / Education /
+Projects (plus Certifications and Awards) sections by their heading lines, so LLM
+prompts can send only the sections a task needs instead of the whole resume.
+
+Deterministic and rule-based: a line is a heading if, after stripping
+bullets, markdown and a trailing colon, it is one of the known heading
+phrases below ("Skills: Python, SQL" also opens a section once a standalone
+heading has been seen). Text before the first heading (name, contact details) is the
+"header" section; recognised headings outside these sections (Languages,
+Hobbies, References, ...) start an "other" section.
+
+Sections are stored as offsets into the text:
+    [{"name": "skills", "heading": "Technical Skills", "start": 120, "end": 410}, ...]
+text[start:end] is the section including its heading line.
+"""
+
+import json
+import re
+from typing import Dict, Iterable, List
+
+SUMMARY, EXPERIENCE, SKILLS, EDUCATION, PROJECTS = "summary", "experience", "skills", "education", "projects"
+CERTIFICATIONS, AWARDS, HEADER, OTHER = "certifications", "awards", "header", "other"
+
+SECTION_NAMES = (SUMMARY, EXPERIENCE, SKILLS, EDUCATION, PROJECTS, CERTIFICATIONS, AWARDS)
+
+# Normalized heading phrase -> section name
+SECTION_HEADINGS = {
+    SUMMARY: (
+        "summary", "professional summary", "career summary", "executive summary", "profile",
+        "professional profile", "career profile", "profile summary", "objective", "career objective",
+        "professional objective", "about me", "about", "overview",
+    ),
+    EXPERIENCE: (
+        "experience", "work experience", "professional experience", "relevant experience",
+        "employment", "employment history", "work history", "career history", "professional background",
+        "internships", "internship", "internship experience",
+    ),
+    SKILLS: (
+        "skills", "technical skills", "key skills", "core skills", "professional skills", "skill set",
+        "skillset", "core competencies", "competencies", "technologies", "tech stack",
+        "technical expertise", "areas of expertise", "expertise", "skills and tools", "tools and technologies",
+    ),
+    EDUCATION: (
+        "education", "academic background", "academics", "academic qualifications", "qualifications",
+        "educational qualifications", "education and training", "academic details",
+    ),
+    PROJECTS: (
+        "projects", "project", "key projects", "personal projects", "academic projects", "selected projects",
+        "notable projects", "project experience", "side projects",
+    ),
+    CERTIFICATIONS: (
+        "certifications", "certification", "certificates", "licenses and certifications",
+        "certifications and training", "courses", "training",
+    ),
+    AWARDS: (
+        "awards", "achievements", "key achievements", "accomplishments", "awards and achievements",
+        "achievements and awards", "honors", "honors and awards", "awards and honors",
+    ),
+    OTHER: (
+        "publications", "languages", "interests", "hobbies", "hobbies and interests", "references", "volunteer experience",
+        "volunteering", "activities", "extracurricular activities", "declaration", "personal details",
+        "personal information", "contact", "contact information",
+    ),
+}
+
+_HEADING_LOOKUP = {phrase: name for name, phrases in SECTION_HEADINGS.items() for phrase in phrases}
+
+# Headings are short; longer lines are content even if they start like one.
+MAX_HEADING_CHARS = 48
+
+_LINE_RE = re.compile(r"[^\n]*(?:\n|$)")
+_LEAD_RE = re.compile(r"^[\s#*•▪►■●\-–—=_|:]+")
+_NON_WORD_RE = re.compile(r"[^a-z ]+")
+
+
+def _normalize_heading(line: str) -> str:
+    line = _LEAD_RE.sub("", line.strip()).rstrip(" :*#-–—=_|")
+    line = line.lower().replace("&", " and ").replace("/", " and ")
+    return " ".join(_NON_WORD_RE.sub(" ", line).split())
+
+
+def _heading(line: str):
+    """(section name, heading text, has inline content) if the line is a heading, else None."""
+    stripped = line.strip()
+    if not stripped:
+        return None
+    candidate, _, inline = stripped.partition(":")
+    if len(candidate) > MAX_HEADING_CHARS:
+        return None
+    name = _HEADING_LOOKUP.get(_normalize_heading(candidate))
+    if name is None:
+        return None
+    return name, candidate.strip(), bool(inline.strip())
+
+
+def segment_sections(text: str) -> List[Dict]:
+    """
+    Split resume text into sections by heading lines.
+
+    Args:
+        text: Extracted resume text
+
+    Returns:
+        Sections in document order, each {"name", "heading", "start", "end"}
+        with character offsets into `text`. Empty if no heading was found.
+    """
+    text = text or ""
+    headings = []
+    offset = 0
+    for match in _LINE_RE.finditer(text):
+        line = match.group()
+        if not line:
+            break
+        found = _heading(line)
+        if found:
+            name, heading, inline = found
+            # "Skills: Python, SQL" starts a section, but only after a standalone
+            # heading: in the contact block "Experience: 3 Years" is a field, and
+            # "Languages: English" is content wherever it appears.
+            if not inline or (headings and name != OTHER):
+                headings.append((offset, name, heading))
+        offset += len(line)
+
+    if not headings:
+        return []
+
+    sections = []
+    if text[:headings[0][0]].strip():
+        sections.append({"name": HEADER, "heading": "", "start": 0, "end": headings[0][0]})
+    for i, (start, name, heading) in enumerate(headings):
+        end = headings[i + 1][0] if i + 1 < len(headings) else len(text)
+        sections.append({"name": name, "heading": heading, "start": start, "end": end})
+    return sections
+
+
+def section_text(text: str, sections, names: Iterable[str]) -> str:
+    """
+    Only the wanted sections of a resume, in document order.
+
+    Args:
+        text: Resume text the sections were computed on
+        sections: segment_sections() output (or its JSON); None to segment now
+        names: Section names to keep
+
+    Returns:
+        The kept sections joined by blank lines, or the full text when none
+        of the wanted sections was found (unstructured resumes lose nothing)
+    """
+    text = text or ""
+    if isinstance(sections, str):
+        sections = load_sections(sections)
+    if sections is None:
+        sections = segment_sections(text)
+    wanted = set(names)
+    parts = [text[s["start"]:s["end"]].strip() for s in sections if s["name"] in wanted]
+    parts = [part for part in parts if part]
+    return "\n\n".join(parts) if parts else text
+
+
+def dump_sections(sections: List[Dict]) -> str:
+    """Compact JSON for the `sections` column."""
+    return json.dumps(sections, separators=(",", ":"))
+
+
+def load_sections(sections_json):
+    """Sections from the `sections` column (None if missing or unparseable)."""
+    if not sections_json:
+        return None
+    try:
+        return json.loads(sections_json)
+    except (json.JSONDecodeError, TypeError):
+        return None
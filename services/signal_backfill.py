@@ -0,0 +1,157 @@
+"""
+Signal Backfill Worker
+Extracts structured signals for stored resumes that were uploaded without an
+LLM configured, so matching runs hit the signal cache instead of calling the
+LLM mid-run.
+
+CLI (uses LLM_PROVIDER / LLM_API_KEY / LLM_MODEL env vars):
+    python -m services.signal_backfill --workers 4
+"""
+
+import argparse
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, Optional
+
+from services.db.lancedb_client import (
+    count_missing_signals,
+    get_ids_missing_signals,
+    get_resumes_by_ids,
+    update_signals,
+)
+from services.resume_enricher import extract_resume_signals
+
+DEFAULT_WORKERS = 4
+
+# Resumes extracted before their results are written back in one merge.
+WRITE_BATCH_SIZE = 20
+
+
+def backfill_signals(
+    llm=None,
+    max_workers: int = DEFAULT_WORKERS,
+    limit: int = None,
+    progress: Optional[Callable[[Dict], None]] = None,
+    stop_event: threading.Event = None,
+) -> Dict:
+    """
+    Extract and store signals for every resume that has none.
+
+    Args:
+        llm: Chat model shared by all worker threads (default: get_llm(0)
+            resolved here, in the calling thread)
+        max_workers: Concurrent LLM calls
+        limit: Max resumes to process (default: all)
+        progress: Called with the stats dict after each written batch
+        stop_event: Set it to stop after the current batch
+
+    Returns:
+        Stats dict: total, done, failed, errors (first few messages)
+    """
+    if llm is None:
+        from services.llm_config import get_llm
+        llm = get_llm(temperature=0)
+
+    ids = get_ids_missing_signals(limit)
+    stats = {"total": len(ids), "done": 0, "failed": 0, "errors": []}
+    if progress:
+        progress(stats)
+
+    def extract(item):
+        row_id, text, sections = item
+        try:
+            return row_id, extract_resume_signals(text, llm=llm, sections=sections), None
+        except Exception as e:
+            return row_id, None, e
+
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        for start in range(0, len(ids), WRITE_BATCH_SIZE):
+            if stop_event is not None and stop_event.is_set():
+                break
+
+            rows = get_resumes_by_ids(ids[start:start + WRITE_BATCH_SIZE], columns=["id", "text", "sections"])
+            results = {}
+            for row_id, signals, error in pool.map(extract, [(r["id"], r["text"], r["sections"]) for r in rows.values()]):
+                if error is None and signals:
+                    results[row_id] = signals
+                else:
+                    stats["failed"] += 1
+                    if error is not None and len(stats["errors"]) < 5:
+                        stats["errors"].append(f"{row_id}: {error}")
+
+            update_signals(results)
+            stats["done"] += len(results)
+            if progress:
+                progress(stats)
+
+    return stats
+
+
+class BackfillWorker(threading.Thread):
+    """Runs backfill_signals() in a daemon thread and exposes live stats."""
+
+    def __init__(self, llm, max_workers: int = DEFAULT_WORKERS, limit: int = None):
+        super().__init__(name="signal-backfill", daemon=True)
+        self.llm = llm
+        self.max_workers = max_workers
+        self.limit = limit
+        self.stop_event = threading.Event()
+        self.stats = {"total": 0, "done": 0, "failed": 0, "errors": []}
+        self.error = None
+
+    def _on_progress(self, stats):
+        self.stats = dict(stats)
+
+    def run(self):
+        try:
+            backfill_signals(
+                llm=self.llm, max_workers=self.max_workers, limit=self.limit,
+                progress=self._on_progress, stop_event=self.stop_event,
+            )
+        except Exception as e:
+            self.error = e
+
+    def stop(self):
+        self.stop_event.set()
+
+
+_worker: Optional[BackfillWorker] = None
+_worker_lock = threading.Lock()
+
+
+def start_background_backfill(llm, max_workers: int = DEFAULT_WORKERS) -> BackfillWorker:
+    """Start the process-wide backfill worker, or return the one already running."""
+    global _worker
+    with _worker_lock:
+        if _worker is None or not _worker.is_alive():
+            _worker = BackfillWorker(llm, max_workers=max_workers)
+            _worker.start()
+        return _worker
+
+
+def get_background_backfill() -> Optional[BackfillWorker]:
+    """Most recently started worker (running or finished), if any."""
+    return _worker
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Extract signals for stored resumes that have none.")
+    parser.add_argument("--workers", type=int, default=DEFAULT_WORKERS, help="concurrent LLM calls")
+    parser.add_argument("--limit", type=int, help="max resumes to process")
+    args = parser.parse_args(argv)
+
+    missing = count_missing_signals()
+    print(f"📄 {missing} resume(s) without signals")
+    if not missing:
+        return
+
+    def report(stats):
+        print(f"  ⚡ {stats['done']}/{stats['total']} extracted, {stats['failed']} failed")
+
+    stats = backfill_signals(max_workers=args.workers, limit=args.limit, progress=report)
+    for error in stats["errors"]:
+        print(f"  ❌ {error}")
+
+
+if __name__ == "__main__":
+    main()
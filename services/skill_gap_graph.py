@@ -3,10 +3,15 @@ from typing import TypedDict, List, Optional
 from langchain_core.prompts import PromptTemplate
 from langgraph.graph import StateGraph, END
 from services.llm_config import get_llm, extract_json
+from services.resume_sections import SUMMARY, EXPERIENCE, SKILLS, PROJECTS, section_text
 import json
 
+# Resume sections skills are read from
+SKILL_SECTIONS = (SUMMARY, SKILLS, EXPERIENCE, PROJECTS)
+
 class SkillGapState(TypedDict):
     resume_text: str
+    resume_sections: Optional[list]  # segment_sections() output, if already computed
     jd_text: str
     resume_skills: Optional[List[str]]
     jd_skills: Optional[List[str]]
@@ -31,7 +36,8 @@ Return ONLY valid JSON:
     )
 
     llm = get_llm(temperature=0)
-    response = llm.invoke(prompt.format(resume=state["resume_text"]))
+    resume = section_text(state["resume_text"], state.get("resume_sections"), SKILL_SECTIONS)
+    response = llm.invoke(prompt.format(resume=resume))
     try:
         skills = json.loads(extract_json(response.content))["skills"]
     except (json.JSONDecodeError, KeyError):
@@ -8,6 +8,10 @@ Usage:
 
 import sys
 import os
+import io
+import json
+import threading
+import time
 import types
 from pathlib import Path
 import pytest
@@ -84,6 +88,26 @@ def edge_cases_dir():
     return PROJECT_ROOT / "data" / "test_resumes" / "edge_cases"
 
 
+@pytest.fixture
+def temp_db(tmp_path, monkeypatch):
+    """Point services.db.lancedb_client at an empty LanceDB directory."""
+    import lancedb
+    from services.db import lancedb_client
+
+    monkeypatch.setattr(lancedb_client, "db", lancedb.connect(tmp_path / "lancedb"))
+    lancedb_client._reset_table_state()
+    yield tmp_path / "lancedb"
+    lancedb_client._reset_table_state()
+
+
+@pytest.fixture(autouse=True)
+def extraction_cache(tmp_path, monkeypatch):
+    """Keep the parser's extraction cache out of data/ (workers inherit the env var)."""
+    path = tmp_path / "extraction_cache.sqlite"
+    monkeypatch.setenv("EXTRACTION_CACHE_PATH", str(path))
+    return path
+
+
 # ---------------------------------------------------------------------------
 # Common mock data factories
 # ---------------------------------------------------------------------------
@@ -166,3 +190,82 @@ def devops_jd(make_jd_requirements):
         domain_keywords=["saas", "cloud infrastructure", "microservices"],
         role_seniority="Senior",
     )
+
+
+# ---------------------------------------------------------------------------
+# Resume files and fake LLM factories
+# ---------------------------------------------------------------------------
+@pytest.fixture
+def docx_bytes():
+    """Factory for .docx file contents, one paragraph per argument."""
+    import docx
+
+    def _make(*paragraphs) -> bytes:
+        document = docx.Document()
+        for paragraph in paragraphs:
+            document.add_paragraph(paragraph)
+        buffer = io.BytesIO()
+        document.save(buffer)
+        return buffer.getvalue()
+    return _make
+
+
+@pytest.fixture
+def make_docx(docx_bytes):
+    """Factory writing a .docx (parent folders created); returns its path as str.
+
+    age: move the file's mtime this many seconds into the past (None = now).
+    """
+    def _make(path, *paragraphs, age=None):
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_bytes(docx_bytes(*paragraphs))
+        if age is not None:
+            past = time.time() - age
+            os.utime(path, (past, past))
+        return str(path)
+    return _make
+
+
+class FakeLLM:
+    """Chat model stand-in: records prompts and answers every call with `content`."""
+
+    def __init__(self, content, delay=0.0, fail_on=None):
+        self.content = content
+        self.delay = delay
+        self.fail_on = fail_on
+        self.prompts = []
+        self.calls = 0
+        self.active = 0
+        self.max_active = 0
+        self.lock = threading.Lock()
+
+    def invoke(self, prompt):
+        with self.lock:
+            self.calls += 1
+            self.prompts.append(prompt)
+            self.active += 1
+            self.max_active = max(self.max_active, self.active)
+        try:
+            time.sleep(self.delay)
+            if self.fail_on and self.fail_on in prompt:
+                raise RuntimeError("rate limited")
+            return types.SimpleNamespace(content=self.content)
+        finally:
+            with self.lock:
+                self.active -= 1
+
+
+@pytest.fixture
+def make_fake_llm(make_resume_signals):
+    """Factory for FakeLLM models (no API key or network).
+
+    content: Raw reply text (default: JSON of make_resume_signals(**signals))
+    delay: Seconds each call takes (max_active counts overlapping calls)
+    fail_on: Calls whose prompt contains this text raise RuntimeError
+    """
+    def _make(content=None, delay=0.0, fail_on=None, **signals):
+        if content is None:
+            content = json.dumps(make_resume_signals(**signals))
+        return FakeLLM(content, delay=delay, fail_on=fail_on)
+    return _make
@@ -0,0 +1,112 @@
+"""
+Unit tests for services/docx_text.py — NO LLM required.
+
+Run: python3 -m pytest tests/test_docx_text.py -v
+"""
+
+import io
+import sys
+import zipfile
+from pathlib import Path
+
+import docx
+
+# Ensure project root is on path
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from services.docx_text import benchmark, docx_lines, docx_text
+from services.resume_parser import parse_bytes
+
+W = 'xmlns:w="http://schemas.openxmlformats.org/wordprocessingml/2006/main"'
+MC = 'xmlns:mc="http://schemas.openxmlformats.org/markup-compatibility/2006"'
+
+
+def document_bytes(document) -> bytes:
+    buffer = io.BytesIO()
+    document.save(buffer)
+    return buffer.getvalue()
+
+
+def raw_docx(body_xml: str, **parts) -> bytes:
+    """Bare zip with word/document.xml (+ extra parts), enough for docx_text()."""
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, "w") as archive:
+        archive.writestr("word/document.xml", f"<w:document {W} {MC}><w:body>{body_xml}</w:body></w:document>")
+        for name, xml in parts.items():
+            archive.writestr(f"word/{name}.xml", xml)
+    return buffer.getvalue()
+
+
+def p(text: str) -> str:
+    return f"<w:p><w:r><w:t>{text}</w:t></w:r></w:p>"
+
+
+class TestDocxText:
+
+    def test_matches_python_docx_for_paragraphs(self):
+        document = docx.Document()
+        document.add_paragraph("Jane Doe")
+        document.add_paragraph("")
+        run = document.add_paragraph("Skills:").add_run()
+        run.add_tab()
+        run.add_text("Go")
+        data = document_bytes(document)
+        expected = "\n".join(par.text for par in docx.Document(io.BytesIO(data)).paragraphs)
+        assert docx_text(data) == expected
+
+    def test_tables_in_order(self):
+        document = docx.Document()
+        document.add_paragraph("Summary")
+        table = document.add_table(rows=2, cols=2)
+        table.cell(0, 0).text = "Languages"
+        table.cell(0, 1).text = "Python, Go"
+        table.cell(1, 0).text = "Cloud"
+        table.cell(1, 1).text = "AWS"
+        document.add_paragraph("Experience")
+        assert docx_lines(document_bytes(document)) == [
+            "Summary", "Languages | Python, Go", "Cloud | AWS", "Experience"]
+
+    def test_headers_and_footers(self):
+        header = f"<w:hdr {W}>{p('jane@example.com')}</w:hdr>"
+        footer = f"<w:ftr {W}>{p('Page')}</w:ftr>"
+        data = raw_docx(p("Body"), header1=header, header2=header, footer1=footer)
+        assert docx_lines(data) == ["jane@example.com", "Body", "Page"]
+
+    def test_text_box_fallback_not_duplicated(self):
+        box = (
+            "<w:p><w:r><mc:AlternateContent>"
+            f"<mc:Choice Requires=\"wps\"><w:txbxContent>{p('Skills: Rust')}</w:txbxContent></mc:Choice>"
+            f"<mc:Fallback><w:txbxContent>{p('Skills: Rust')}</w:txbxContent></mc:Fallback>"
+            "</mc:AlternateContent></w:r><w:r><w:t>Anchor</w:t></w:r></w:p>"
+        )
+        assert docx_lines(raw_docx(box)) == ["Skills: Rust", "Anchor"]
+
+    def test_paragraph_tab_stops_are_not_text(self):
+        xml = "<w:p><w:pPr><w:tabs><w:tab w:val=\"left\" w:pos=\"720\"/></w:tabs></w:pPr><w:r><w:t>Go</w:t></w:r></w:p>"
+        assert docx_text(raw_docx(xml)) == "Go"
+
+    def test_parse_bytes_falls_back_without_document_part(self, monkeypatch):
+        document = docx.Document()
+        document.add_paragraph("Jane Doe")
+        data = document_bytes(document)
+
+        def missing_part(_):
+            raise KeyError("word/document.xml")
+
+        monkeypatch.setattr("services.resume_parser.docx_text", missing_part)
+        assert parse_bytes(data, "cv.docx") == "Jane Doe"
+
+
+class TestBenchmark:
+
+    def test_benchmark(self, tmp_path):
+        document = docx.Document()
+        document.add_paragraph("Jane Doe")
+        document.add_table(rows=1, cols=1).cell(0, 0).text = "Python"
+        document.save(str(tmp_path / "a.docx"))
+        result = benchmark(tmp_path, repeat=1)
+        assert result["files"] == 1
+        assert result["extra_chars"] == len("Python") + 1
+
+    def test_benchmark_empty_folder(self, tmp_path):
+        assert benchmark(tmp_path) == {"files": 0}
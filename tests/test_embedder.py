@@ -0,0 +1,75 @@
+"""
+Unit tests for services/embedder.py — NO LLM or network required.
+
+Run: python3 -m pytest tests/test_embedder.py -v
+"""
+
+import sys
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+# Ensure project root is on path
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from services.embedder import (
+    EMBEDDING_DIM,
+    Embedder,
+    HashingEmbedder,
+    embed_texts,
+    get_embedder,
+    set_embedder,
+    tokenize,
+)
+
+
+class TestTokenize:
+
+    def test_keeps_tech_tokens(self):
+        assert tokenize("C++, C#, Node.js and CI/CD.") == ["c++", "c#", "node.js", "and", "ci/cd"]
+
+
+class TestHashingEmbedder:
+
+    def test_shape_and_norm(self):
+        vectors = HashingEmbedder().embed(["Python developer", "Kubernetes on AWS"])
+        assert len(vectors) == 2
+        assert all(len(v) == EMBEDDING_DIM for v in vectors)
+        assert np.allclose(np.linalg.norm(vectors, axis=1), 1.0, atol=1e-5)
+
+    def test_deterministic(self):
+        assert HashingEmbedder().embed(["Terraform EKS"]) == HashingEmbedder().embed(["Terraform EKS"])
+
+    def test_empty_text_is_zero_vector(self):
+        assert not any(HashingEmbedder().embed([""])[0])
+
+    def test_overlap_ranks_higher(self):
+        query, devops, frontend = np.array(HashingEmbedder().embed([
+            "kubernetes terraform aws",
+            "DevOps engineer: Kubernetes clusters, Terraform modules on AWS",
+            "Frontend engineer: React, TypeScript, CSS",
+        ]))
+        assert query @ devops > query @ frontend
+
+
+class TestEmbedderRegistry:
+
+    def test_default_is_hashing(self):
+        assert isinstance(get_embedder(), HashingEmbedder)
+
+    def test_rejects_wrong_dim(self):
+        with pytest.raises(ValueError):
+            set_embedder(HashingEmbedder(dim=EMBEDDING_DIM * 2))
+
+    def test_custom_embedder_used(self):
+        class Constant(Embedder):
+            def embed(self, texts):
+                return [[1.0] + [0.0] * (EMBEDDING_DIM - 1) for _ in texts]
+
+        previous = get_embedder()
+        set_embedder(Constant())
+        try:
+            assert embed_texts(["anything"])[0][0] == 1.0
+        finally:
+            set_embedder(previous)
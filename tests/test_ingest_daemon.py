@@ -0,0 +1,130 @@
+"""
+Unit tests for services/ingest_daemon.py — uses a fake LLM, no API key.
+
+Run: python3 -m pytest tests/test_ingest_daemon.py -v
+"""
+
+import json
+import os
+import sys
+import threading
+import time
+from pathlib import Path
+
+import pytest
+
+# Ensure project root is on path
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from services import ingest_daemon
+from services.db.lancedb_client import get_or_create_table
+from services.ingest_daemon import FolderWatcher, IngestManifest, scan_folder, watch
+
+pytestmark = pytest.mark.usefixtures("temp_db")
+
+
+@pytest.fixture
+def inbox(tmp_path, make_docx):
+    folder = tmp_path / "inbox"
+    # Written an hour ago, so they have settled
+    make_docx(folder / "alice.docx", "Alice", "Skills", "Go, Kubernetes", age=3600)
+    make_docx(folder / "bob.docx", "Bob", "Skills", "Python, SQL", age=3600)
+    (folder / "notes.txt").write_text("not a resume")
+    return folder
+
+
+def _run_once(inbox, tmp_path, **kwargs):
+    kwargs.setdefault("workers", 1)
+    return watch(inbox, tmp_path / "manifest.json", once=True, debounce=0, interval=0, **kwargs)
+
+
+class TestFolderWatcher:
+
+    def test_scan_filters_types(self, inbox):
+        assert sorted(Path(p).name for p in scan_folder(inbox)) == ["alice.docx", "bob.docx"]
+
+    def test_recent_file_waits_for_debounce(self, inbox, tmp_path, make_docx):
+        fresh = make_docx(inbox / "carol.docx", "Carol", age=0)
+        watcher = FolderWatcher(inbox, IngestManifest(tmp_path / "m.json"), debounce=10)
+        now = time.time()
+        first = [Path(p).name for p, _ in watcher.poll(now)]
+        assert "carol.docx" not in first and len(first) == 2
+        assert watcher.has_pending
+        assert str(Path(fresh).resolve()) in [p for p, _ in watcher.poll(now + 11)]
+        assert not watcher.has_pending
+
+    def test_changing_file_resets_debounce(self, inbox, tmp_path, make_docx):
+        path = inbox / "carol.docx"
+        make_docx(path, "Carol", age=0)
+        watcher = FolderWatcher(inbox, IngestManifest(tmp_path / "m.json"), debounce=10)
+        now = time.time()
+        watcher.poll(now)
+        make_docx(path, "Carol", "More text", age=-8)  # rewritten 8s later
+        assert all(Path(p).name != "carol.docx" for p, _ in watcher.poll(now + 11))
+        assert any(Path(p).name == "carol.docx" for p, _ in watcher.poll(now + 19))
+
+
+class TestWatch:
+
+    def test_ingests_with_signals(self, inbox, tmp_path, make_fake_llm):
+        llm = make_fake_llm(total_years=4)
+        totals = _run_once(inbox, tmp_path, llm=llm)
+        assert totals["stored"] == 2 and totals["failed"] == 0
+        assert llm.calls == 2
+        rows = get_or_create_table().search().select(["filename", "total_years"]).to_list()
+        assert sorted(r["filename"] for r in rows) == ["alice.docx", "bob.docx"]
+        assert all(r["total_years"] == 4 for r in rows)
+
+    def test_manifest_makes_restart_resume(self, inbox, tmp_path, make_docx):
+        _run_once(inbox, tmp_path)
+        manifest = json.loads((tmp_path / "manifest.json").read_text())["files"]
+        assert {entry["status"] for entry in manifest.values()} == {"stored"}
+        assert all(entry["sha256"] for entry in manifest.values())
+
+        make_docx(inbox / "carol.docx", "Carol", "Skills", "Rust")
+        totals = _run_once(inbox, tmp_path)
+        assert totals["stored"] == 1
+        assert get_or_create_table().count_rows() == 3
+
+    def test_duplicates_skip_llm(self, inbox, tmp_path, make_docx, make_fake_llm):
+        _run_once(inbox, tmp_path)
+        make_docx(inbox / "alice_copy.docx", "Alice", "Skills", "Go, Kubernetes")
+        llm = make_fake_llm(total_years=4)
+        totals = _run_once(inbox, tmp_path, llm=llm)
+        assert totals["duplicate"] == 1
+        assert llm.calls == 0
+
+    def test_failures_recorded_not_retried(self, inbox, tmp_path):
+        (inbox / "broken.docx").write_bytes(b"not a zip")
+        past = time.time() - 3600
+        os.utime(inbox / "broken.docx", (past, past))
+        assert _run_once(inbox, tmp_path)["failed"] == 1
+        manifest = json.loads((tmp_path / "manifest.json").read_text())["files"]
+        assert manifest[str((inbox / "broken.docx").resolve())]["error"]
+        assert _run_once(inbox, tmp_path)["failed"] == 0
+
+    def test_batches_and_progress(self, inbox, tmp_path):
+        seen = []
+        totals = _run_once(inbox, tmp_path, batch_size=1, progress=seen.append)
+        assert totals["batches"] == 2
+        assert [t["stored"] for t in seen] == [1, 2]
+
+    def test_stop_event(self, inbox, tmp_path):
+        stop = threading.Event()
+        stop.set()
+        assert watch(inbox, tmp_path / "manifest.json", stop_event=stop)["batches"] == 0
+
+    def test_unknown_mode(self, inbox, tmp_path):
+        with pytest.raises(ValueError):
+            _run_once(inbox, tmp_path, near_duplicates="merge")
+
+    def test_unreadable_manifest_starts_fresh(self, inbox, tmp_path):
+        (tmp_path / "manifest.json").write_text("{oops")
+        assert _run_once(inbox, tmp_path)["stored"] == 2
+
+
+def test_cli_once(inbox, tmp_path, capsys, monkeypatch):
+    monkeypatch.setattr(ingest_daemon, "_resolve_llm", lambda: None)
+    ingest_daemon.main([str(inbox), "--manifest", str(tmp_path / "m.json"), "--once",
+                        "--debounce", "0", "--workers", "1"])
+    assert "2 stored" in capsys.readouterr().out
@@ -0,0 +1,152 @@
+"""
+Unit tests for services/ingest_pipeline.py — uses a fake LLM, no API key.
+
+Run: python3 -m pytest tests/test_ingest_pipeline.py -v
+"""
+
+import io
+import sys
+import threading
+import time
+from pathlib import Path
+
+import pytest
+
+# Ensure project root is on path
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from services import ingest_pipeline
+from services.db.lancedb_client import get_or_create_table, store_resume
+from services.ingest_pipeline import run_ingest_pipeline
+
+pytestmark = pytest.mark.usefixtures("temp_db")
+
+
+@pytest.fixture
+def upload(docx_bytes):
+    """Factory for stand-ins of a Streamlit UploadedFile."""
+    def _make(name, *paragraphs):
+        f = io.BytesIO(docx_bytes(*paragraphs))
+        f.name = name
+        return f
+    return _make
+
+
+@pytest.fixture
+def uploads(upload):
+    return [upload(f"cand_{i}.docx", f"Candidate {i}", "Skills", f"Skill{i}, Go") for i in range(6)]
+
+
+def run(sources, **kwargs):
+    kwargs.setdefault("parse_workers", 1)
+    kwargs.setdefault("timeout", None)
+    return list(run_ingest_pipeline(sources, **kwargs))
+
+
+def by_kind(events, kind):
+    return [e for e in events if e["event"] == kind]
+
+
+class TestPipeline:
+
+    def test_stores_everything_with_signals(self, uploads, make_fake_llm):
+        llm = make_fake_llm(total_years=2, delay=0.05)
+        events = run(uploads, llm=llm)
+        done = events[-1]
+        assert done["event"] == "done"
+        assert done["counts"]["stored"] == 6
+        assert done["counts"]["extracted"] == 6
+        assert sorted(e["index"] for e in by_kind(events, "stored")) == list(range(6))
+        assert all(e["signals"] for e in by_kind(events, "stored"))
+        assert get_or_create_table().count_rows() == 6
+
+    def test_llm_concurrency_is_bounded(self, uploads, make_fake_llm):
+        llm = make_fake_llm(total_years=2, delay=0.1)
+        run(uploads, llm=llm, llm_concurrency=2)
+        assert llm.calls == 6
+        assert llm.max_active == 2
+
+    def test_stages_overlap(self, uploads, make_fake_llm):
+        llm = make_fake_llm(total_years=2, delay=0.2)
+        start = time.perf_counter()
+        run(uploads, llm=llm, llm_concurrency=6)
+        # Sequential calls would take 6 x 0.2s
+        assert time.perf_counter() - start < 0.9
+
+    def test_duplicates_dropped_before_llm(self, uploads, upload, make_fake_llm):
+        store_resume("old.docx", "Candidate 0\nSkills\nSkill0, Go")
+        repeat = upload("again.docx", "Candidate 1", "Skills", "Skill1, Go")
+        llm = make_fake_llm(total_years=2, delay=0.05)
+        events = run([*uploads, repeat], llm=llm)
+        assert sorted(e["index"] for e in by_kind(events, "duplicate")) == [0, 6]
+        assert llm.calls == 5
+        assert events[-1]["counts"]["stored"] == 5
+
+    def test_writes_are_batched(self, uploads, monkeypatch):
+        calls = []
+        real = ingest_pipeline.store_resumes_batch
+
+        def spy(items, **kwargs):
+            calls.append(len(items))
+            return real(items, **kwargs)
+
+        monkeypatch.setattr(ingest_pipeline, "store_resumes_batch", spy)
+        run(uploads, write_batch_size=4)
+        assert sum(calls) == 6
+        assert max(calls) <= 4
+        assert len(calls) < 6
+
+    def test_failures_reported(self, uploads, make_fake_llm):
+        broken = io.BytesIO(b"not a zip")
+        broken.name = "broken.docx"
+        llm = make_fake_llm(total_years=2, delay=0.05, fail_on="Skill2")
+        events = run([broken, *uploads[:3]], llm=llm)
+        failed = by_kind(events, "failed")
+        assert [(e["index"], e["stage"]) for e in failed] == [(0, "parse")]
+        extracted = {e["index"]: e for e in by_kind(events, "extracted")}
+        assert "rate limited" in extracted[3]["error"]
+        # LLM failure still stores the resume (signals come later via backfill)
+        assert events[-1]["counts"]["stored"] == 3
+
+    def test_parse_only(self, uploads):
+        events = run(uploads, store=False)
+        assert len(by_kind(events, "parsed")) == 6
+        assert not by_kind(events, "stored")
+        assert get_or_create_table().count_rows() == 0
+
+    def test_paths_in_process_pool(self, tmp_path, docx_bytes):
+        paths = []
+        for i in range(4):
+            path = tmp_path / f"r{i}.docx"
+            path.write_bytes(docx_bytes(f"Resume {i}"))
+            paths.append(str(path))
+        events = run(paths, parse_workers=2, timeout=30)
+        assert events[-1]["counts"]["stored"] == 4
+        assert all(e["sha256"] for e in by_kind(events, "parsed"))
+
+    def test_abandoned_generator_stops_stages(self, uploads, make_fake_llm):
+        llm = make_fake_llm(total_years=2, delay=0.05)
+        before = threading.active_count()
+        events = run_ingest_pipeline(uploads, llm=llm, parse_workers=1, timeout=None, llm_concurrency=1)
+        next(events)
+        events.close()
+        assert threading.active_count() <= before
+
+    @pytest.mark.parametrize("parse_workers", [1, 2])
+    def test_abandoned_parse_only_generator_stops(self, uploads, parse_workers):
+        events = run_ingest_pipeline(uploads, store=False, parse_workers=parse_workers,
+                                     timeout=None, queue_size=1)
+        next(events)
+        closer = threading.Thread(target=events.close, daemon=True)
+        closer.start()
+        closer.join(timeout=30)
+        assert not closer.is_alive()
+
+    def test_unknown_mode(self, uploads):
+        with pytest.raises(ValueError):
+            run(uploads, near_duplicates="merge")
+
+    def test_empty(self):
+        events = run([])
+        assert [e["event"] for e in events] == ["done"]
+        assert events[0]["counts"]["total"] == 0
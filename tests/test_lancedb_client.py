@@ -0,0 +1,442 @@
+"""
+Unit tests for services/db/lancedb_client.py — NO LLM required.
+Each test runs against a throwaway LanceDB directory.
+
+Run: python3 -m pytest tests/test_lancedb_client.py -v
+"""
+
+import sys
+import threading
+import time
+from pathlib import Path
+
+import pytest
+
+# Ensure project root is on path
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from services.db import lancedb_client, maintenance
+from services.db.lancedb_client import (
+    build_signal_filter,
+    find_candidate_ids,
+    find_near_duplicates,
+    generate_fingerprint,
+    get_cached_signals,
+    get_cached_signals_bulk,
+    get_or_create_table,
+    get_table_handle,
+    is_duplicate,
+    keyword_search,
+    lookup_fingerprint,
+    maintain_text_index,
+    near_duplicate_clusters,
+    parse_keyword_query,
+    search_resumes,
+    signal_columns,
+    store_resume,
+    store_resumes_batch,
+    vector_index_due,
+)
+
+
+pytestmark = pytest.mark.usefixtures("temp_db")
+
+
+# ===================================================================
+# Fingerprint lookups
+# ===================================================================
+class TestFingerprintLookup:
+
+    def test_store_then_duplicate(self):
+        assert store_resume("a.docx", "Jane Doe\nPython engineer") == "stored"
+        assert store_resume("b.docx", "jane   doe python ENGINEER") == "duplicate"
+        assert get_or_create_table().count_rows() == 1
+
+    def test_is_duplicate(self):
+        assert not is_duplicate("Jane Doe")
+        store_resume("a.docx", "Jane Doe")
+        assert is_duplicate("Jane Doe")
+
+    def test_fingerprint_index_created(self):
+        store_resume("a.docx", "Jane Doe")
+        table = get_or_create_table()
+        lookup_fingerprint(generate_fingerprint("Jane Doe"), table)
+        assert any("fingerprint" in idx.columns for idx in table.list_indices())
+
+    def test_cached_signals_roundtrip(self):
+        signals = {"skills": [{"skill": "Python", "context": "APIs"}]}
+        store_resume("a.docx", "Jane Doe", signals=signals)
+        assert get_cached_signals("Jane Doe") == signals
+
+    def test_cached_signals_missing(self):
+        store_resume("a.docx", "Jane Doe")
+        assert get_cached_signals("Jane Doe") is None
+        assert get_cached_signals("John Roe") is None
+
+    def test_cache_invalidated_by_external_write(self):
+        # Prime a negative cache entry, then write behind the client's back
+        fp = generate_fingerprint("John Roe")
+        assert lookup_fingerprint(fp) is None
+        get_or_create_table().add([{
+            "id": "ext", "filename": "x.docx", "text": "John Roe",
+            "fingerprint": fp, "signals": "",
+        }])
+        assert lookup_fingerprint(fp) == {"id": "ext", "signals": ""}
+
+    def test_cached_signals_bulk(self):
+        store_resumes_batch([
+            ("a.docx", "Alice", {"skills": [{"skill": "Go"}]}),
+            ("b.docx", "Bob", None),
+            ("c.docx", "Carol", {"skills": []}),
+        ])
+        # Stored-without-signals and unknown texts are left out
+        cached = get_cached_signals_bulk(["Alice", "Bob", "Carol", "Dave"])
+        assert cached == {
+            "Alice": {"skills": [{"skill": "Go"}]},
+            "Carol": {"skills": []},
+        }
+
+    def test_cached_signals_bulk_single_query(self, monkeypatch):
+        store_resumes_batch([(f"{i}.docx", f"Resume {i}", {"n": i}) for i in range(30)])
+        lancedb_client._reset_table_state()
+        table = get_or_create_table()
+        lancedb_client.ensure_fingerprint_index(table)
+        calls = []
+        original = type(table).search
+        monkeypatch.setattr(type(table), "search", lambda self, *a, **k: calls.append(1) or original(self, *a, **k))
+        cached = get_cached_signals_bulk([f"Resume {i}" for i in range(30)])
+        assert len(cached) == 30
+        assert len(calls) == 1
+
+    def test_cache_is_bounded_lru(self, monkeypatch):
+        monkeypatch.setattr(lancedb_client, "FINGERPRINT_CACHE_SIZE", 3)
+        store_resumes_batch([(f"{i}.docx", f"Resume {i}", None) for i in range(5)])
+        fps = [generate_fingerprint(f"Resume {i}") for i in range(5)]
+        lancedb_client.lookup_fingerprints(fps[:3] + ["unknown"])
+        lookup_fingerprint(fps[0])  # refresh: fps[0] is now the newest
+        lancedb_client.lookup_fingerprints(fps[3:])
+        cache = lancedb_client._fingerprint_cache
+        assert len(cache) == 3
+        assert list(cache) == [fps[0], fps[3], fps[4]]
+        # Evicted entries are simply looked up again
+        assert lookup_fingerprint(fps[1]) is not None
+
+    def test_quotes_in_fingerprint_query(self):
+        assert lookup_fingerprint("it's") is None
+
+
+# ===================================================================
+# Table handle cache
+# ===================================================================
+class TestTableHandle:
+
+    def test_handle_reused(self):
+        assert get_or_create_table() is get_or_create_table()
+
+    def test_no_reopen_per_call(self, monkeypatch):
+        get_or_create_table()
+        calls = []
+        monkeypatch.setattr(lancedb_client, "_open_or_create_table", lambda: calls.append(1))
+        for _ in range(5):
+            get_or_create_table()
+        assert calls == []
+
+    def test_refresh_sees_other_writers(self, temp_db, monkeypatch):
+        import lancedb
+
+        monkeypatch.setattr(lancedb_client, "TABLE_REFRESH_INTERVAL", 0)
+        store_resume("a.docx", "Alice")
+        other = lancedb.connect(temp_db).open_table("resumes")
+        other.add(lancedb_client.pa.Table.from_pylist(
+            [{"id": "ext", "filename": "b.docx", "text": "Bob", "fingerprint": generate_fingerprint("Bob")}],
+            schema=lancedb_client.resume_schema,
+        ))
+        assert get_or_create_table().count_rows() == 2
+        assert is_duplicate("Bob")
+
+    def test_invalidate(self):
+        table = get_or_create_table()
+        get_table_handle().invalidate()
+        assert get_or_create_table() is not table
+
+
+# ===================================================================
+# Batch ingest
+# ===================================================================
+class TestBatchIngest:
+
+    def test_batch_dedups_against_table_and_batch(self):
+        store_resume("old.docx", "Existing Resume")
+        statuses = store_resumes_batch([
+            ("a.docx", "Alice", {"skills": []}),
+            ("b.docx", "existing   resume", None),
+            ("c.docx", "Bob", None),
+            ("d.docx", "ALICE", None),
+        ])
+        assert statuses == ["stored", "duplicate", "stored", "duplicate"]
+        assert get_or_create_table().count_rows() == 3
+
+    def test_batch_is_single_write(self):
+        store_resume("seed.docx", "Seed")  # creates the fingerprint index
+        before = get_or_create_table().version
+        store_resumes_batch([(f"{i}.docx", f"Resume {i}", None) for i in range(20)])
+        assert get_or_create_table().version == before + 1
+
+    def test_batch_signals_cached(self):
+        store_resumes_batch([("a.docx", "Alice", {"skills": [{"skill": "Go"}]})])
+        assert get_cached_signals("Alice") == {"skills": [{"skill": "Go"}]}
+
+    def test_empty_batch(self):
+        assert store_resumes_batch([]) == []
+
+
+# ===================================================================
+# Semantic search
+# ===================================================================
+class TestSemanticSearch:
+
+    def test_embedding_stored(self):
+        store_resume("a.docx", "Jane Doe")
+        row = get_or_create_table().to_arrow().to_pylist()[0]
+        assert len(row["embedding"]) == lancedb_client.EMBEDDING_DIM
+
+    def test_search_ranks_relevant_first(self):
+        store_resumes_batch([
+            ("devops.docx", "DevOps engineer running Kubernetes and Terraform on AWS", None),
+            ("frontend.docx", "Frontend engineer building React and TypeScript apps", None),
+            ("data.docx", "Data engineer with Spark, Airflow and Snowflake", None),
+        ])
+        results = search_resumes("kubernetes terraform", k=2)
+        assert [r["filename"] for r in results][0] == "devops.docx"
+        assert len(results) == 2
+        assert results[0]["distance"] <= results[1]["distance"]
+
+    def test_search_with_filter(self):
+        store_resumes_batch([
+            ("devops.docx", "DevOps engineer running Kubernetes", None),
+            ("devops.pdf", "DevOps engineer running Kubernetes on GKE", None),
+        ])
+        results = search_resumes("kubernetes", k=5, filters="filename LIKE '%.pdf'")
+        assert [r["filename"] for r in results] == ["devops.pdf"]
+
+    def test_vector_index_built_past_threshold(self, monkeypatch):
+        monkeypatch.setattr(lancedb_client, "VECTOR_INDEX_MIN_ROWS", 300)
+        store_resumes_batch([(f"{i}.docx", f"Engineer {i} skill{i} tool{i % 7}", None) for i in range(299)])
+        table = get_or_create_table()
+        assert not vector_index_due(table)
+
+        store_resume("last.docx", "Kubernetes Terraform AWS engineer")
+        maintenance.wait_for_vector_index(timeout=60)
+        table = get_or_create_table()
+        assert lancedb_client._vector_index_name(table) is not None
+        assert not maintenance.rebuild_vector_index(table)  # nothing new to index
+        assert search_resumes("kubernetes terraform aws", k=1)[0]["filename"] == "last.docx"
+
+    def test_retrain_does_not_block_writes(self, monkeypatch):
+        monkeypatch.setattr(lancedb_client, "VECTOR_INDEX_MIN_ROWS", 1)
+        release = threading.Event()
+        started = []
+        monkeypatch.setattr(maintenance, "rebuild_vector_index",
+                            lambda table: started.append(1) or release.wait(5))
+        start = time.perf_counter()
+        store_resume("a.docx", "Alice")
+        store_resume("b.docx", "Bob")  # retrain still running: not scheduled twice
+        assert time.perf_counter() - start < 4
+        release.set()
+        maintenance.wait_for_vector_index(timeout=5)
+        assert started == [1]
+
+
+# ===================================================================
+# Keyword search
+# ===================================================================
+@pytest.fixture
+def keyword_pool():
+    store_resumes_batch([
+        ("devops.docx", "Senior DevOps engineer. Terraform modules, EKS clusters on AWS.", None),
+        ("platform.docx", "Platform engineer with Terraform and GKE, site reliability on-call.", None),
+        ("java.docx", "Backend Java developer, Spring Boot, some AWS.", None),
+    ])
+
+
+class TestKeywordSearch:
+
+    def _names(self, query, **kwargs):
+        return sorted(r["filename"] for r in keyword_search(query, **kwargs))
+
+    def test_single_term(self, keyword_pool):
+        assert self._names("terraform") == ["devops.docx", "platform.docx"]
+
+    def test_or_ranks_both_terms_first(self, keyword_pool):
+        results = keyword_search("terraform eks")
+        assert results[0]["filename"] == "devops.docx"
+        assert len(results) == 2
+
+    def test_and(self, keyword_pool):
+        assert self._names("terraform AND gke") == ["platform.docx"]
+
+    def test_not_and_minus(self, keyword_pool):
+        assert self._names("aws NOT java") == ["devops.docx"]
+        assert self._names("aws -java") == ["devops.docx"]
+
+    def test_phrase(self, keyword_pool):
+        assert self._names('"site reliability"') == ["platform.docx"]
+        assert self._names('"reliability site"') == []
+
+    def test_only_negative_terms(self, keyword_pool):
+        assert keyword_search("-java") == []
+
+    def test_filters(self, keyword_pool):
+        assert self._names("aws", filters="filename = 'java.docx'") == ["java.docx"]
+
+    def test_new_rows_found_before_reindex(self, keyword_pool):
+        store_resume("late.docx", "Ansible and Terraform automation")
+        assert "late.docx" in self._names("terraform")
+
+    def test_index_folded_in_past_threshold(self, keyword_pool, monkeypatch):
+        monkeypatch.setattr(lancedb_client, "FTS_OPTIMIZE_MIN_UNINDEXED", 2)
+        store_resumes_batch([("x.docx", "Pulumi", None), ("y.docx", "Chef", None)])
+        table = get_or_create_table()
+        stats = table.index_stats(lancedb_client._text_index_name(table))
+        assert stats.num_unindexed_rows == 0
+        assert not maintain_text_index(table)
+
+    def test_parse_keyword_query(self):
+        assert parse_keyword_query("") is None
+        assert parse_keyword_query("NOT java") is None
+        assert parse_keyword_query("terraform") is not None
+
+
+# ===================================================================
+# Structured signal columns
+# ===================================================================
+@pytest.fixture
+def signal_pool(make_resume_signals):
+    def skills(*names):
+        return [{"skill": name, "context": "Used at work"} for name in names]
+
+    statuses = store_resumes_batch([
+        ("senior.docx", "Senior SRE", make_resume_signals(
+            skills=skills("Kubernetes", "AWS"), total_years=7, most_recent_role_year=2025,
+            domain_experience=["Fintech"], measurable_outcomes=["Cut cost 30%"])),
+        ("junior.docx", "Junior dev", make_resume_signals(
+            skills=skills("kubernetes"), total_years=1, most_recent_role_year=2025)),
+        ("stale.docx", "Old SRE", make_resume_signals(
+            skills=skills("Kubernetes"), total_years=9, most_recent_role_year=2019)),
+        ("nosignals.docx", "No signals yet", None),
+    ])
+    assert statuses == ["stored"] * 4
+    ids = {row["filename"]: row["id"] for row in get_or_create_table().search().select(["id", "filename"]).to_list()}
+    return ids
+
+
+class TestSignalColumns:
+
+    def test_signal_columns(self, make_resume_signals):
+        columns = signal_columns(make_resume_signals(
+            skills=[{"skill": " Python "}, {"skill": "python"}, {"skill": ""}],
+            total_years=4, domain_experience=["FinTech"],
+            projects=[{"name": "x"}], measurable_outcomes=["a", "b"],
+        ))
+        assert columns == {
+            "total_years": 4.0, "most_recent_role_year": 2025, "skills": ["python"],
+            "domains": ["fintech"], "outcome_count": 2, "project_count": 1,
+        }
+
+    def test_signal_columns_without_signals(self):
+        assert set(signal_columns(None).values()) == {None}
+
+    def test_signal_columns_tolerates_bad_values(self):
+        columns = signal_columns({"experience_duration": {"total_years": "n/a"}})
+        assert columns["total_years"] is None
+        assert columns["skills"] == []
+
+    def test_columns_stored(self, signal_pool):
+        row = get_or_create_table().search().where("filename = 'senior.docx'").to_list()[0]
+        assert row["skills"] == ["kubernetes", "aws"]
+        assert row["total_years"] == 7
+
+    def test_find_candidate_ids(self, signal_pool):
+        ids = find_candidate_ids(min_years=5, skills_all=["Kubernetes"], recent_since=2025)
+        assert ids == [signal_pool["senior.docx"]]
+
+    def test_find_candidate_ids_any(self, signal_pool):
+        ids = find_candidate_ids(skills_any=["aws", "KUBERNETES"])
+        assert sorted(ids) == sorted(signal_pool[f] for f in ["senior.docx", "junior.docx", "stale.docx"])
+        assert find_candidate_ids(domains_any=["fintech"], min_outcomes=1) == [signal_pool["senior.docx"]]
+
+    def test_find_candidate_ids_no_criteria_returns_all(self, signal_pool):
+        assert len(find_candidate_ids()) == 4
+        assert len(find_candidate_ids(limit=2)) == 2
+
+    def test_build_signal_filter_quotes(self):
+        assert build_signal_filter(skills_any=["o'reilly"]) == "array_has_any(skills, ['o''reilly'])"
+        assert build_signal_filter() == ""
+
+
+NEAR_DUP_BASE = (
+    "Priya Sharma, data engineer. Built streaming pipelines with Spark and Kafka "
+    "processing 5TB daily. Migrated the warehouse from Redshift to Snowflake and "
+    "cut query costs by 40%. Wrote dbt models for finance reporting and owned "
+    "Airflow orchestration across three teams. MSc Statistics, 2016."
+)
+NEAR_DUP_EDIT = NEAR_DUP_BASE.replace("three teams", "four teams")
+UNRELATED = "Carlos Ruiz, UX designer. Figma prototypes, user interviews and usability testing."
+
+
+class TestNearDuplicates:
+
+    def test_find_near_duplicates(self):
+        store_resume("base.pdf", NEAR_DUP_BASE)
+        matches = find_near_duplicates([NEAR_DUP_EDIT, UNRELATED])
+        assert matches[0]["filename"] == "base.pdf"
+        assert matches[0]["similarity"] >= lancedb_client.NEAR_DUPLICATE_THRESHOLD
+        assert matches[1] is None
+
+    def test_keep_is_default(self):
+        assert store_resumes_batch([("a.pdf", NEAR_DUP_BASE, None), ("b.docx", NEAR_DUP_EDIT, None)]) == [
+            "stored", "stored"]
+
+    def test_skip(self):
+        store_resume("base.pdf", NEAR_DUP_BASE)
+        assert store_resume("edit.docx", NEAR_DUP_EDIT, near_duplicates="skip") == "near_duplicate"
+        assert get_or_create_table().count_rows() == 1
+
+    def test_link_inherits_signals(self, make_resume_signals):
+        signals = make_resume_signals(skills=[{"skill": "Spark"}], total_years=6)
+        store_resume("base.pdf", NEAR_DUP_BASE, signals)
+        statuses = store_resumes_batch(
+            [("edit.docx", NEAR_DUP_EDIT, None), ("ux.pdf", UNRELATED, None)], near_duplicates="link")
+        assert statuses == ["linked", "stored"]
+
+        rows = {r["filename"]: r for r in get_or_create_table().to_arrow().to_pylist()}
+        assert rows["edit.docx"]["duplicate_of"] == rows["base.pdf"]["id"]
+        assert rows["edit.docx"]["skills"] == ["spark"]
+        assert get_cached_signals(NEAR_DUP_EDIT)["experience_duration"]["total_years"] == 6
+        assert rows["ux.pdf"]["duplicate_of"] is None
+
+    def test_link_within_batch(self):
+        statuses = store_resumes_batch(
+            [("a.pdf", NEAR_DUP_BASE, None), ("b.docx", NEAR_DUP_EDIT, None)], near_duplicates="skip")
+        assert statuses == ["stored", "near_duplicate"]
+
+    def test_exact_duplicate_wins(self):
+        store_resume("base.pdf", NEAR_DUP_BASE)
+        assert store_resume("copy.pdf", NEAR_DUP_BASE, near_duplicates="link") == "duplicate"
+
+    def test_unknown_mode(self):
+        with pytest.raises(ValueError):
+            store_resume("a.pdf", NEAR_DUP_BASE, near_duplicates="merge")
+
+    def test_clusters(self):
+        store_resumes_batch([
+            ("base.pdf", NEAR_DUP_BASE, None),
+            ("edit.docx", NEAR_DUP_EDIT, None),
+            ("ux.pdf", UNRELATED, None),
+        ])
+        clusters = near_duplicate_clusters()
+        assert len(clusters) == 1
+        assert sorted(r["filename"] for r in clusters[0]) == ["base.pdf", "edit.docx"]
+
+    def test_clusters_empty_table(self):
+        assert near_duplicate_clusters() == []
@@ -0,0 +1,159 @@
+"""
+Unit tests for services/llm_config.py client caching — NO network or real
+API key required (clients are constructed, never invoked).
+
+Run: python3 -m pytest tests/test_llm_config.py -v
+"""
+
+import sys
+import threading
+import time
+from pathlib import Path
+
+import pytest
+
+# Ensure project root is on path
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from services import llm_config
+from services.llm_config import clear_llm_cache, get_llm, get_llm_cache_info
+
+
+@pytest.fixture(autouse=True)
+def fresh_cache(monkeypatch):
+    for var in ("LLM_PROVIDER", "LLM_API_KEY", "LLM_MODEL"):
+        monkeypatch.delenv(var, raising=False)
+    clear_llm_cache()
+    yield
+    clear_llm_cache()
+
+
+@pytest.fixture
+def openai_env(monkeypatch):
+    monkeypatch.setenv("LLM_PROVIDER", "OpenAI")
+    monkeypatch.setenv("LLM_API_KEY", "sk-test-one")
+
+
+class TestCache:
+
+    def test_same_settings_reuse_client(self, openai_env):
+        first = get_llm(temperature=0)
+        assert get_llm(temperature=0) is first
+        assert get_llm(temperature=0.0, model="gpt-4o-mini") is first  # default model, same key
+        assert get_llm_cache_info() == {"hits": 2, "misses": 1, "size": 1}
+
+    def test_settings_are_part_of_the_key(self, openai_env, monkeypatch):
+        base = get_llm(temperature=0)
+        assert get_llm(temperature=0.3) is not base
+        assert get_llm(temperature=0, model="gpt-4o") is not base
+        monkeypatch.setenv("LLM_API_KEY", "sk-test-two")
+        assert get_llm(temperature=0) is not base
+        assert get_llm_cache_info()["size"] == 4
+
+    def test_key_is_not_stored(self, openai_env):
+        get_llm()
+        assert not any("sk-test-one" in str(part) for key in llm_config._llm_cache for part in key)
+
+    def test_lru_eviction(self, openai_env, monkeypatch):
+        monkeypatch.setattr(llm_config, "LLM_CACHE_SIZE", 2)
+        first = get_llm(temperature=0)
+        get_llm(temperature=0.1)
+        get_llm(temperature=0)          # refresh: 0.1 becomes the oldest
+        get_llm(temperature=0.2)
+        assert get_llm_cache_info()["size"] == 2
+        assert get_llm(temperature=0) is first
+
+    def test_concurrent_sessions_build_once(self, monkeypatch):
+        built = []
+
+        def slow_create(provider, api_key, model, temperature):
+            time.sleep(0.05)
+            built.append(provider)
+            return object()
+
+        monkeypatch.setattr(llm_config, "_create_llm_for_provider", slow_create)
+        results = []
+        threads = [
+            threading.Thread(target=lambda: results.append(llm_config._cached_llm("Groq", "k", None, 0)))
+            for _ in range(8)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        assert len(built) == 1
+        assert len({id(r) for r in results}) == 1
+
+    def test_slow_build_does_not_block_hits(self, monkeypatch):
+        cached = llm_config._cached_llm("OpenAI", "k", None, 0)
+        release = threading.Event()
+        real_create = llm_config._create_llm_for_provider
+
+        def slow_create(provider, api_key, model, temperature):
+            if provider == "Groq":
+                release.wait(5)
+            return real_create(provider, api_key, model, temperature)
+
+        monkeypatch.setattr(llm_config, "_create_llm_for_provider", slow_create)
+        builder = threading.Thread(target=llm_config._cached_llm, args=("Groq", "k", None, 0))
+        builder.start()
+        time.sleep(0.05)
+        start = time.perf_counter()
+        assert llm_config._cached_llm("OpenAI", "k", None, 0) is cached
+        assert time.perf_counter() - start < 1
+        release.set()
+        builder.join()
+        assert not llm_config._build_locks
+
+    def test_build_lock_released_with_the_insert(self, monkeypatch):
+        # A request between lock release and insert would build a second client
+        class CheckedLocks(dict):
+            def pop(self, key, default=None):
+                assert key in llm_config._llm_cache
+                return super().pop(key, default)
+
+        monkeypatch.setattr(llm_config, "_build_locks", CheckedLocks())
+        monkeypatch.setattr(llm_config, "_create_llm_for_provider", lambda *args: object())
+        llm_config._cached_llm("Groq", "k", None, 0)
+        assert not llm_config._build_locks
+
+    def test_failed_build_releases_lock(self, monkeypatch):
+        def broken(*args):
+            raise RuntimeError("provider down")
+
+        monkeypatch.setattr(llm_config, "_create_llm_for_provider", broken)
+        with pytest.raises(RuntimeError):
+            llm_config._cached_llm("Groq", "k", None, 0)
+        assert not llm_config._build_locks
+
+    def test_not_configured(self):
+        with pytest.raises(ValueError):
+            get_llm()
+
+    def test_unknown_provider_not_cached(self):
+        with pytest.raises(ValueError):
+            llm_config._cached_llm("Nope", "k", None, 0)
+        assert get_llm_cache_info()["size"] == 0
+
+
+class TestHttpPool:
+
+    def test_openai_compatible_and_groq_share_one_pool(self):
+        openai = llm_config._cached_llm("OpenAI", "k1", None, 0)
+        openrouter = llm_config._cached_llm("OpenRouter", "k2", None, 0.3)
+        groq = llm_config._cached_llm("Groq", "k3", None, 0)
+        shared = llm_config._http_client
+        assert shared is not None
+        assert openai.http_client is shared
+        assert openrouter.http_client is shared
+        assert groq.http_client is shared
+
+    def test_clear_keeps_handed_out_clients_usable(self):
+        llm = llm_config._cached_llm("OpenAI", "k", None, 0)
+        client = llm_config._http_client
+        clear_llm_cache()
+        assert not client.is_closed  # another session may still be mid-call
+        assert llm.http_client is client
+        assert llm_config._cached_llm("OpenAI", "k", None, 0) is not llm
+        assert llm_config._http_client is not client
+        assert get_llm_cache_info() == {"hits": 0, "misses": 1, "size": 1}
@@ -0,0 +1,129 @@
+"""
+Unit tests for services/db/maintenance.py — NO LLM required.
+
+Run: python3 -m pytest tests/test_maintenance.py -v
+"""
+
+import sys
+from datetime import timedelta
+from pathlib import Path
+
+import pytest
+
+# Ensure project root is on path
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from services import extraction_cache
+from services.db import lancedb_client, maintenance
+from services.db.lancedb_client import (
+    get_or_create_table, is_duplicate, keyword_search, store_resume, store_resumes_batch,
+)
+from services.db.maintenance import needs_maintenance, run_all_maintenance, run_maintenance, table_health
+from services.db.skill_index import find_candidates_by_skills, get_skills_table
+
+pytestmark = pytest.mark.usefixtures("temp_db")
+
+
+@pytest.fixture
+def fragmented_table():
+    for i in range(12):
+        store_resume(f"{i}.docx", f"Resume {i} with Terraform")
+    return get_or_create_table()
+
+
+class TestMaintenance:
+
+    def test_health(self, fragmented_table):
+        health = table_health(fragmented_table)
+        assert health["num_rows"] == 12
+        assert health["num_fragments"] >= 12
+        assert health["num_versions"] > 12
+        assert health["scan_ms"] >= 0
+
+    def test_thresholds(self, fragmented_table, monkeypatch):
+        assert needs_maintenance(table_health(fragmented_table)) == []
+        monkeypatch.setattr(maintenance, "MAX_FRAGMENTS", 4)
+        assert needs_maintenance(table_health(fragmented_table))
+
+    def test_skips_healthy_table(self, fragmented_table):
+        result = run_maintenance(fragmented_table)
+        assert not result["ran"]
+        assert result["after"] is None
+
+    def test_compacts_and_prunes(self, fragmented_table, monkeypatch):
+        monkeypatch.setattr(maintenance, "MAX_FRAGMENTS", 4)
+        result = run_maintenance(fragmented_table, retention=timedelta(0))
+        assert result["ran"]
+        assert result["after"]["num_fragments"] < result["before"]["num_fragments"]
+        assert result["after"]["num_versions"] < result["before"]["num_versions"]
+        assert not any(result["after"]["unindexed_rows"].values())
+
+        # Data and lookups still intact
+        assert result["after"]["num_rows"] == 12
+        assert is_duplicate("Resume 7 with Terraform")
+        assert len(keyword_search("terraform", k=20)) == 12
+
+    def test_force(self, fragmented_table):
+        assert run_maintenance(fragmented_table, force=True)["reasons"] == ["forced"]
+
+    def test_cli_status(self, fragmented_table, capsys):
+        maintenance.main(["--status"])
+        assert "12 rows" in capsys.readouterr().out
+
+    def test_retrains_vector_index_when_due(self, monkeypatch):
+        monkeypatch.setattr(maintenance, "schedule_vector_index_rebuild", lambda table: False)
+        monkeypatch.setattr(lancedb_client, "VECTOR_INDEX_MIN_ROWS", 300)
+        store_resumes_batch([(f"{i}.docx", f"Engineer {i} skill{i} tool{i % 7}", None) for i in range(300)])
+        table = get_or_create_table()
+        assert needs_maintenance(table_health(table)) == ["no vector index at 300 rows"]
+
+        result = run_maintenance(table)
+        assert result["ran"] and result["vector_index_rebuilt"]
+        assert result["after"]["vector_index_due"] == ""
+
+    def test_run_purges_stale_extractions(self, fragmented_table, capsys):
+        from services.resume_parser import PARSER_VERSION
+
+        extraction_cache.put_cached_text("a" * 64, "old", "Jane Doe")
+        extraction_cache.put_cached_text("b" * 64, PARSER_VERSION, "John Doe")
+        maintenance.main([])
+        assert "removed 1 entries" in capsys.readouterr().out
+        assert extraction_cache.get_cached_text("a" * 64, "old") is None
+        assert extraction_cache.get_cached_text("b" * 64, PARSER_VERSION) == "John Doe"
+
+
+class TestSkillIndexMaintenance:
+
+    @pytest.fixture
+    def fragmented_postings(self, make_resume_signals):
+        for i in range(8):
+            signals = make_resume_signals(skills=[{"skill": "Terraform", "context": "iac"},
+                                                  {"skill": f"Skill {i}", "context": "x"}])
+            store_resume(f"{i}.docx", f"Resume {i} with Terraform", signals)
+            if i == 0:
+                find_candidates_by_skills(["terraform"])  # creates the `skill` index
+        return get_skills_table()
+
+    def test_health(self, fragmented_postings):
+        health = table_health(fragmented_postings)
+        assert health["num_rows"] > 8
+        assert health["num_fragments"] >= 8
+        assert health["scan_ms"] >= 0
+
+    def test_all_tables_compacted(self, fragmented_postings, monkeypatch):
+        monkeypatch.setattr(maintenance, "MAX_FRAGMENTS", 4)
+        results = run_all_maintenance(retention=timedelta(0))
+        assert set(results) == {"resumes", "resume_skills"}
+        postings = results["resume_skills"]
+        assert postings["ran"]
+        assert any(postings["before"]["unindexed_rows"].values())
+        assert postings["after"]["num_fragments"] < postings["before"]["num_fragments"]
+        assert postings["after"]["num_versions"] < postings["before"]["num_versions"]
+        assert postings["after"]["unindexed_rows"]
+        assert not any(postings["after"]["unindexed_rows"].values())
+        assert len(find_candidates_by_skills(["terraform"])) == 8
+
+    def test_cli_status_covers_both_tables(self, fragmented_postings, capsys):
+        maintenance.main(["--status"])
+        out = capsys.readouterr().out
+        assert "📦 resumes" in out and "📦 resume_skills" in out
@@ -0,0 +1,139 @@
+"""
+Unit tests for services/db/migrations.py — NO LLM required.
+
+Run: python3 -m pytest tests/test_migrations.py -v
+"""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+# Ensure project root is on path
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from services.db import lancedb_client, migrations
+from services.db.lancedb_client import (
+    generate_fingerprint,
+    get_cached_signals,
+    get_or_create_table,
+    is_duplicate,
+    resume_schema,
+)
+from services.db.migrations import SCHEMA_VERSION, get_schema_version, migrate_table
+
+pytestmark = pytest.mark.usefixtures("temp_db")
+
+
+def _create_v1_table(rows=5):
+    """Original table layout: id, filename, text only."""
+    return lancedb_client.db.create_table("resumes", data=[
+        {"id": f"id-{i}", "filename": f"{i}.docx", "text": f"Resume number {i}"}
+        for i in range(rows)
+    ])
+
+
+class TestMigrations:
+
+    def test_new_table_is_current(self):
+        assert get_schema_version(get_or_create_table()) == SCHEMA_VERSION
+
+    def test_v1_table_upgraded_in_place(self):
+        _create_v1_table()
+        table = get_or_create_table()
+
+        assert table.schema.names == resume_schema.names
+        assert get_schema_version(table) == SCHEMA_VERSION
+        rows = {row["id"]: row for row in table.to_arrow().to_pylist()}
+        assert len(rows) == 5
+        assert rows["id-3"]["fingerprint"] == generate_fingerprint("Resume number 3")
+        assert len(rows["id-3"]["embedding"]) == lancedb_client.EMBEDDING_DIM
+        assert rows["id-3"]["signals"] is None
+        assert is_duplicate("resume NUMBER 3")
+        assert get_cached_signals("Resume number 3") is None
+
+    def test_backfill_is_batched(self):
+        table = _create_v1_table(rows=5)
+        migrations.add_missing_column(table, resume_schema.field("fingerprint"))
+        sizes = []
+
+        def compute(rows):
+            sizes.append(len(rows))
+            return [generate_fingerprint(row["text"]) for row in rows]
+
+        assert migrations.backfill_column(table, "fingerprint", ["text"], compute, batch_size=2) == 5
+        assert sizes == [2, 2, 1]
+        assert table.count_rows("fingerprint IS NULL") == 0
+
+    def test_interrupted_migration_resumes(self, monkeypatch):
+        _create_v1_table(rows=5)
+        table = lancedb_client.db.open_table("resumes")
+        monkeypatch.setattr(migrations, "BACKFILL_BATCH_SIZE", 2)
+
+        calls = []
+        real_fingerprint = lancedb_client.generate_fingerprint
+
+        def flaky(text):
+            calls.append(text)
+            if len(calls) > 2:
+                raise RuntimeError("crash")
+            return real_fingerprint(text)
+
+        monkeypatch.setattr(lancedb_client, "generate_fingerprint", flaky)
+        with pytest.raises(RuntimeError):
+            migrate_table(table, resume_schema)
+        assert get_schema_version(table) == 1
+        assert table.count_rows("fingerprint IS NOT NULL") == 2
+
+        monkeypatch.setattr(lancedb_client, "generate_fingerprint", real_fingerprint)
+        migrate_table(table, resume_schema)
+        assert get_schema_version(table) == SCHEMA_VERSION
+        assert table.count_rows("fingerprint IS NULL") == 0
+        assert table.count_rows() == 5
+
+    def test_unversioned_current_table_is_noop(self):
+        table = lancedb_client.db.create_table("resumes", schema=resume_schema)
+        assert get_schema_version(table) == 1
+        migrate_table(table, resume_schema)
+        assert get_schema_version(table) == SCHEMA_VERSION
+        assert table.schema.names == resume_schema.names
+
+    def test_signal_columns_backfilled(self, make_resume_signals):
+        import json
+
+        v3_fields = [
+            f for f in resume_schema
+            if f.name not in lancedb_client.SIGNAL_COLUMNS + ["minhash", "lsh_buckets", "duplicate_of", "sections"]
+        ]
+        signals = make_resume_signals(skills=[{"skill": "Go", "context": "services"}], total_years=3)
+        table = lancedb_client.db.create_table("resumes", data=[
+            {"id": "a", "filename": "a.docx", "text": "A", "fingerprint": "fa",
+             "signals": json.dumps(signals), "embedding": [0.0] * lancedb_client.EMBEDDING_DIM},
+            {"id": "b", "filename": "b.docx", "text": "B", "fingerprint": "fb",
+             "signals": "", "embedding": [0.0] * lancedb_client.EMBEDDING_DIM},
+            {"id": "c", "filename": "c.docx", "text": "C", "fingerprint": "fc",
+             "signals": "{not json", "embedding": [0.0] * lancedb_client.EMBEDDING_DIM},
+        ], schema=lancedb_client.pa.schema(v3_fields))
+        migrations.set_schema_version(table, 3)
+
+        migrate_table(table, resume_schema)
+        rows = {row["id"]: row for row in table.to_arrow().to_pylist()}
+        assert rows["a"]["skills"] == ["go"]
+        assert rows["a"]["total_years"] == 3.0
+        assert rows["b"]["skills"] is None
+        assert rows["c"]["skills"] == []
+        assert get_schema_version(table) == SCHEMA_VERSION
+
+    def test_minhash_backfilled(self):
+        table = _create_v1_table()
+        migrate_table(table, resume_schema)
+        rows = table.to_arrow().to_pylist()
+        assert all(len(row["minhash"]) == lancedb_client.NUM_PERM for row in rows)
+        assert all(row["lsh_buckets"] for row in rows)
+        assert all(row["duplicate_of"] is None for row in rows)
+
+    def test_sections_backfilled(self):
+        table = _create_v1_table()
+        migrate_table(table, resume_schema)
+        rows = table.to_arrow().to_pylist()
+        assert all(row["sections"] is not None for row in rows)
@@ -0,0 +1,59 @@
+"""
+Unit tests for services/minhash.py — NO LLM or network required.
+
+Run: python3 -m pytest tests/test_minhash.py -v
+"""
+
+import sys
+from pathlib import Path
+
+# Ensure project root is on path
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from services.minhash import (
+    LSH_BANDS,
+    NUM_PERM,
+    estimate_jaccard,
+    lsh_buckets,
+    minhash_signature,
+    shingles,
+)
+
+RESUME = (
+    "Jane Doe\nSenior Backend Engineer\n"
+    "Built payment APIs in Go and Python serving 2M requests per day. "
+    "Led migration of 40 services to Kubernetes on AWS, cutting infra cost by 30%. "
+    "Mentored five engineers and owned the on-call rotation for the billing platform. "
+    "Designed event-driven ledger with Kafka and PostgreSQL. "
+    "Education: BSc Computer Science, University of Toronto, 2014."
+)
+
+
+class TestMinHash:
+
+    def test_signature_shape_and_determinism(self):
+        sig = minhash_signature(RESUME)
+        assert len(sig) == NUM_PERM
+        assert sig == minhash_signature(RESUME)
+
+    def test_formatting_changes_are_identical(self):
+        reexported = RESUME.replace("\n", "  ").upper()
+        assert estimate_jaccard(minhash_signature(RESUME), minhash_signature(reexported)) == 1.0
+
+    def test_edited_bullet_is_similar(self):
+        edited = RESUME.replace("Mentored five engineers", "Mentored seven engineers")
+        sig_a, sig_b = minhash_signature(RESUME), minhash_signature(edited)
+        assert estimate_jaccard(sig_a, sig_b) >= 0.7
+        assert set(lsh_buckets(sig_a)) & set(lsh_buckets(sig_b))
+
+    def test_different_resumes_are_not_similar(self):
+        other = "John Smith, registered nurse. Ten years of ICU care, patient triage and ward management."
+        assert estimate_jaccard(minhash_signature(RESUME), minhash_signature(other)) < 0.2
+
+    def test_buckets(self):
+        assert len(lsh_buckets(minhash_signature(RESUME))) == LSH_BANDS
+        assert lsh_buckets(minhash_signature("")) == []
+
+    def test_short_text_shingles(self):
+        assert shingles("Go dev") == {"go dev"}
+        assert shingles("") == set()
@@ -0,0 +1,144 @@
+"""
+Unit tests for services/reindex.py — NO LLM or network required.
+
+Run: python3 -m pytest tests/test_reindex.py -v
+"""
+
+import json
+import sys
+import threading
+from pathlib import Path
+
+import pytest
+
+# Ensure project root is on path
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from services import reindex as reindex_module
+from services.db import lancedb_client
+from services.db.lancedb_client import get_cached_signals, get_or_create_table, store_resume
+from services.db.skill_index import find_candidates_by_skills
+from services.reindex import STAGING_TABLE, reindex
+
+pytestmark = pytest.mark.usefixtures("temp_db")
+
+
+@pytest.fixture
+def raw(tmp_path, make_docx):
+    folder = tmp_path / "raw"
+    make_docx(folder / "alice.docx", "Alice", "Skills", "Go, Kubernetes")
+    make_docx(folder / "nested" / "bob.docx", "Bob", "Skills", "Python")
+    make_docx(folder / "carol.docx", "Carol", "Skills", "Rust")
+    return folder
+
+
+def run(raw, tmp_path, **kwargs):
+    kwargs.setdefault("workers", 1)
+    return reindex(raw, tmp_path / "reindex.json", **kwargs)
+
+
+def filenames():
+    return sorted(row["filename"] for row in get_or_create_table().search().select(["filename"]).to_list())
+
+
+class TestReindex:
+
+    def test_rebuilds_from_files(self, raw, tmp_path):
+        store_resume("stale.docx", "Stale resume from an old parser")
+        stats = run(raw, tmp_path)
+        assert stats["swapped"] and stats["rows"] == 3
+        assert stats["stored"] == 3 and stats["failed"] == 0
+        assert stats["files_per_sec"] > 0
+        assert filenames() == ["alice.docx", "carol.docx", "nested/bob.docx"]
+        assert STAGING_TABLE not in lancedb_client.db.table_names()
+        assert not (tmp_path / "reindex.json").exists()
+
+    def test_indices_rebuilt_after_swap(self, raw, tmp_path):
+        run(raw, tmp_path)
+        table = get_or_create_table()
+        indexed = {column for index in table.list_indices() for column in index.columns}
+        assert {"fingerprint", "lsh_buckets"} <= indexed
+        assert all(row["sections"] for row in table.search().select(["sections"]).to_list())
+
+    def test_signals_carried_over(self, raw, tmp_path, make_resume_signals):
+        alice = "Alice\nSkills\nGo, Kubernetes"
+        store_resume("old_alice.docx", alice, make_resume_signals(skills=[{"skill": "Kubernetes", "context": "ops"}]))
+        run(raw, tmp_path)
+        assert get_cached_signals(alice) is not None
+        ids = [resume_id for resume_id, _ in find_candidates_by_skills(["kubernetes"])]
+        rows = lancedb_client.get_resumes_by_ids(ids, columns=["id", "filename"])
+        assert [row["filename"] for row in rows.values()] == ["alice.docx"]
+
+    def test_drop_signals(self, raw, tmp_path, make_resume_signals):
+        alice = "Alice\nSkills\nGo, Kubernetes"
+        store_resume("old_alice.docx", alice, make_resume_signals())
+        run(raw, tmp_path, keep_signals=False)
+        assert get_cached_signals(alice) is None
+
+    def test_interrupted_run_resumes(self, raw, tmp_path):
+        store_resume("stale.docx", "Stale resume")
+        stop = threading.Event()
+        stats = run(raw, tmp_path, batch_size=1, progress=lambda s: stop.set(), stop_event=stop)
+        assert not stats["swapped"] and stats["done"] == 1
+        # Live table untouched until the swap
+        assert filenames() == ["stale.docx"]
+        manifest = json.loads((tmp_path / "reindex.json").read_text())
+        assert len(manifest["files"]) == 1
+
+        stats = run(raw, tmp_path, batch_size=1)
+        assert stats["resumed"] == 1
+        assert stats["stored"] == 2
+        assert stats["swapped"] and stats["rows"] == 3
+
+    def test_fresh_discards_checkpoint(self, raw, tmp_path):
+        stop = threading.Event()
+        run(raw, tmp_path, batch_size=1, progress=lambda s: stop.set(), stop_event=stop)
+        stats = run(raw, tmp_path, fresh=True)
+        assert stats["resumed"] == 0 and stats["rows"] == 3
+
+    def test_crash_after_write_is_deduplicated(self, raw, tmp_path, monkeypatch):
+        # Staging write succeeded but the checkpoint after it was lost
+        real_save = reindex_module._save_manifest
+        calls = []
+
+        def flaky_save(path, manifest):
+            calls.append(1)
+            if len(calls) == 2:
+                raise RuntimeError("crash")
+            real_save(path, manifest)
+
+        monkeypatch.setattr(reindex_module, "_save_manifest", flaky_save)
+        with pytest.raises(RuntimeError):
+            run(raw, tmp_path, batch_size=1)
+        monkeypatch.setattr(reindex_module, "_save_manifest", real_save)
+
+        stats = run(raw, tmp_path, batch_size=1)
+        assert stats["duplicate"] == 1
+        assert stats["rows"] == 3
+
+    def test_failures_reported(self, raw, tmp_path):
+        (raw / "broken.docx").write_bytes(b"not a zip")
+        stats = run(raw, tmp_path)
+        assert stats["failed"] == 1
+        assert "broken.docx" in stats["errors"][0]
+        assert stats["rows"] == 3
+
+    def test_empty_source_keeps_table(self, tmp_path):
+        store_resume("keep.docx", "Keep me")
+        (tmp_path / "empty").mkdir()
+        stats = run(tmp_path / "empty", tmp_path)
+        assert not stats["swapped"]
+        assert filenames() == ["keep.docx"]
+
+    def test_bad_arguments(self, raw, tmp_path):
+        with pytest.raises(FileNotFoundError):
+            run(tmp_path / "missing", tmp_path)
+        with pytest.raises(ValueError):
+            run(raw, tmp_path, near_duplicates="merge")
+
+
+def test_cli(raw, tmp_path, capsys):
+    reindex_module.main([str(raw), "--manifest", str(tmp_path / "m.json"), "--workers", "1"])
+    out = capsys.readouterr().out
+    assert "files/s" in out
+    assert "Swapped in 3 resumes" in out
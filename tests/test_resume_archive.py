@@ -0,0 +1,155 @@
+"""
+Unit tests for services/resume_archive.py — NO LLM or network required.
+
+Run: python3 -m pytest tests/test_resume_archive.py -v
+"""
+
+import io
+import sys
+import zipfile
+from pathlib import Path
+
+import pytest
+
+# Ensure project root is on path
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from services import resume_archive
+from services.db.lancedb_client import get_or_create_table
+from services.ingest_pipeline import run_ingest_pipeline
+from services.resume_archive import ingest_archive, is_archive, open_archive
+
+pytestmark = pytest.mark.usefixtures("temp_db")
+
+
+def make_zip(members, compression=zipfile.ZIP_DEFLATED) -> io.BytesIO:
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, "w", compression) as zf:
+        for name, data in members.items():
+            zf.writestr(name, data)
+    buffer.seek(0)
+    buffer.name = "export.zip"
+    return buffer
+
+
+@pytest.fixture
+def export(docx_bytes):
+    return make_zip({
+        "ats/alice.docx": docx_bytes("Alice", "Skills", "Go, Kubernetes"),
+        "ats/bob.docx": docx_bytes("Bob", "Skills", "Python"),
+        "carol.docx": docx_bytes("Carol", "Skills", "Rust"),
+        "ats/": b"",
+        "__MACOSX/ats/._alice.docx": b"metadata",
+        ".DS_Store": b"junk",
+        "cover_letters.zip": b"PK nested",
+        "notes.txt": b"not a resume",
+    })
+
+
+class TestOpenArchive:
+
+    def test_lists_resumes_and_skips(self, export):
+        archive, members, skipped = open_archive(export)
+        assert [m.path for m in members] == ["ats/alice.docx", "ats/bob.docx", "carol.docx"]
+        assert [m.name for m in members] == ["export/ats/alice.docx", "export/ats/bob.docx", "export/carol.docx"]
+        assert dict(skipped) == {"cover_letters.zip": "nested archive", "notes.txt": "not a PDF/DOCX file"}
+        archive.close()
+
+    def test_listing_decompresses_nothing(self, export, monkeypatch):
+        opened = []
+        real_open = zipfile.ZipFile.open
+        monkeypatch.setattr(zipfile.ZipFile, "open", lambda self, *a, **k: opened.append(1) or real_open(self, *a, **k))
+        archive, members, _ = open_archive(export)
+        assert opened == []
+        members[0].read()
+        assert len(opened) == 1
+        archive.close()
+
+    def test_oversized_member_skipped(self, export, monkeypatch):
+        monkeypatch.setattr(resume_archive, "MAX_MEMBER_BYTES", 100)
+        _, members, skipped = open_archive(export)
+        assert members == []
+        assert any(reason.startswith("larger than") for _, reason in skipped)
+
+    def test_same_file_name_in_different_folders(self, docx_bytes):
+        archive, members, _ = open_archive(make_zip({
+            "a/resume.docx": docx_bytes("Alice"),
+            "b/resume.docx": docx_bytes("Bob"),
+            "../../etc/resume.docx": docx_bytes("Mallory"),
+        }))
+        assert [m.name for m in members] == ["export/a/resume.docx", "export/b/resume.docx",
+                                             "export/etc/resume.docx"]
+        archive.close()
+
+    def test_not_a_zip(self):
+        with pytest.raises(ValueError):
+            open_archive(io.BytesIO(b"plain bytes"))
+
+    def test_is_archive(self):
+        assert is_archive("Export.ZIP") and not is_archive("cv.pdf")
+
+
+class TestZipMember:
+
+    def test_reads_in_chunks_then_closes(self, export):
+        archive, members, _ = open_archive(export)
+        member = members[2]
+        chunks = []
+        while True:
+            chunk = member.read(1024)
+            if not chunk:
+                break
+            chunks.append(chunk)
+        assert len(chunks) > 1
+        assert b"".join(chunks) == member.getbuffer()
+        assert member._f is None
+        archive.close()
+
+
+class TestIngest:
+
+    def test_pipeline_stores_members(self, export):
+        archive, members, _ = open_archive(export)
+        with archive:
+            events = list(run_ingest_pipeline(members, parse_workers=1, timeout=None))
+        assert events[-1]["counts"]["stored"] == 3
+        rows = get_or_create_table().search().select(["filename"]).to_list()
+        assert sorted(r["filename"] for r in rows) == [
+            "export/ats/alice.docx", "export/ats/bob.docx", "export/carol.docx",
+        ]
+
+    def test_corrupt_member_fails_alone(self, docx_bytes):
+        good = docx_bytes("Dana", "Skills", "Scala")
+        buffer = make_zip({"bad.docx": docx_bytes("Eve"), "good.docx": good}, compression=zipfile.ZIP_STORED)
+        raw = bytearray(buffer.getvalue())
+        offset = raw.index(b"bad.docx") + len("bad.docx") + 200
+        raw[offset] ^= 0xFF  # breaks the CRC of the first member
+        corrupt = io.BytesIO(bytes(raw))
+
+        stats = ingest_archive(corrupt, workers=1, timeout=None)
+        assert stats["failed"] == 1 and stats["stored"] == 1
+        assert stats["errors"][0].startswith("bad.docx: BadZipFile")
+
+    def test_ingest_archive_from_path(self, export, tmp_path):
+        path = tmp_path / "export.zip"
+        path.write_bytes(export.getvalue())
+        seen = []
+        stats = ingest_archive(path, workers=2, progress=seen.append)
+        assert stats["stored"] == 3 and stats["failed"] == 0
+        assert len(stats["skipped"]) == 2
+        assert seen[-1]["event"] == "done"
+
+    def test_duplicate_archive_is_deduplicated(self, export):
+        ingest_archive(export, workers=1, timeout=None)
+        stats = ingest_archive(export, workers=1, timeout=None)
+        assert stats["duplicate"] == 3 and stats["stored"] == 0
+
+
+def test_cli(export, tmp_path, capsys):
+    path = tmp_path / "export.zip"
+    path.write_bytes(export.getvalue())
+    resume_archive.main([str(path), "--no-signals", "--workers", "1"])
+    out = capsys.readouterr().out
+    assert "3 stored" in out
+    assert "notes.txt: not a PDF/DOCX file" in out
+
@@ -0,0 +1,71 @@
+"""
+Unit tests for services/resume_export.py — NO LLM required.
+
+Run: python3 -m pytest tests/test_resume_export.py -v
+"""
+
+import csv
+import json
+import sys
+from pathlib import Path
+
+import pyarrow.parquet as pq
+import pytest
+
+# Ensure project root is on path
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from services.db.lancedb_client import store_resumes_batch
+from services.resume_export import export_resumes
+
+pytestmark = pytest.mark.usefixtures("temp_db")
+
+
+@pytest.fixture
+def pool(make_resume_signals):
+    store_resumes_batch(
+        [(f"{i}.docx", f"Resume {i}\n" + "x" * 1000, None) for i in range(7)]
+        + [("sig.docx", "Signals resume", make_resume_signals(
+            skills=[{"skill": "Go"}, {"skill": "AWS"}], total_years=4))]
+    )
+
+
+class TestResumeExport:
+
+    def test_csv(self, pool, tmp_path):
+        path = export_resumes("CSV", tmp_path / "out.csv", batch_size=3)
+        rows = list(csv.DictReader(open(path, encoding="utf-8")))
+        assert len(rows) == 8
+        full = next(r for r in rows if r["filename"] == "0.docx")
+        assert len(full["text"]) > 1000  # full text, not a preview
+        sig = next(r for r in rows if r["filename"] == "sig.docx")
+        assert sig["skills"] == "go; aws"
+        assert float(sig["total_years"]) == 4
+
+    def test_parquet(self, pool, tmp_path):
+        table = pq.read_table(export_resumes("Parquet", tmp_path / "out.parquet", batch_size=3))
+        assert table.num_rows == 8
+        assert "go" in [s for row in table.column("skills").to_pylist() if row for s in row]
+
+    def test_jsonl_parses_signals(self, pool, tmp_path):
+        lines = open(export_resumes("JSONL", tmp_path / "out.jsonl"), encoding="utf-8").read().splitlines()
+        rows = [json.loads(line) for line in lines]
+        assert len(rows) == 8
+        sig = next(r for r in rows if r["filename"] == "sig.docx")
+        assert sig["signals"]["experience_duration"]["total_years"] == 4
+        assert next(r for r in rows if r["filename"] == "0.docx")["signals"] is None
+
+    def test_without_text_and_temp_file(self, pool):
+        path = export_resumes("CSV", include_text=False)
+        try:
+            assert "text" not in next(csv.DictReader(open(path, encoding="utf-8")))
+        finally:
+            path.unlink()
+
+    def test_empty_table(self, tmp_path):
+        assert export_resumes("JSONL", tmp_path / "e.jsonl").read_text() == ""
+        assert export_resumes("CSV", tmp_path / "e.csv").read_text() == ""
+
+    def test_unknown_format(self):
+        with pytest.raises(ValueError):
+            export_resumes("XLSX")
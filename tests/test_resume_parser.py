@@ -0,0 +1,322 @@
+"""
+Unit tests for services/resume_parser.py — NO LLM required.
+
+Run: python3 -m pytest tests/test_resume_parser.py -v
+"""
+
+import hashlib
+import io
+import multiprocessing
+import signal
+import sys
+import threading
+import time
+from pathlib import Path
+
+import pytest
+
+# Ensure project root is on path
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from services import extraction_cache, resume_parser
+from services.resume_parser import (
+    ExtractionTimeout,
+    ParserPool,
+    cache_version,
+    extract_text,
+    extract_text_hashed,
+    extract_texts,
+    iter_pdf_pages,
+    parse_bytes,
+    read_source,
+)
+
+
+def no_children_left(wait: float = 5) -> bool:
+    """True once every worker process has exited (killed ones are reaped asynchronously)."""
+    deadline = time.time() + wait
+    while multiprocessing.active_children() and time.time() < deadline:
+        time.sleep(0.05)
+    return not multiprocessing.active_children()
+
+
+def _ignore_alarm_and_sleep(seconds, timeout):
+    """ParserPool task that, like a parse stuck in C code, never sees its SIGALRM."""
+    signal.pthread_sigmask(signal.SIG_BLOCK, {signal.SIGALRM})
+    time.sleep(seconds)
+    return seconds
+
+
+def make_pdf(*pages) -> bytes:
+    """Minimal PDF with one line of Helvetica text per page."""
+    objects = ["<< /Type /Catalog /Pages 2 0 R >>", None,
+               "<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>"]
+    kids = []
+    for text in pages:
+        stream = f"BT /F1 12 Tf 72 720 Td ({text}) Tj ET"
+        objects.append(f"<< /Length {len(stream)} >>\nstream\n{stream}\nendstream")
+        objects.append(f"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 612 792] "
+                       f"/Resources << /Font << /F1 3 0 R >> >> /Contents {len(objects)} 0 R >>")
+        kids.append(f"{len(objects)} 0 R")
+    objects[1] = f"<< /Type /Pages /Kids [{' '.join(kids)}] /Count {len(kids)} >>"
+
+    out = b"%PDF-1.4\n"
+    offsets = []
+    for number, body in enumerate(objects, start=1):
+        offsets.append(len(out))
+        out += f"{number} 0 obj\n{body}\nendobj\n".encode()
+    xref = len(out)
+    out += f"xref\n0 {len(objects) + 1}\n0000000000 65535 f \n".encode()
+    out += "".join(f"{offset:010d} 00000 n \n" for offset in offsets).encode()
+    out += f"trailer\n<< /Size {len(objects) + 1} /Root 1 0 R >>\nstartxref\n{xref}\n%%EOF\n".encode()
+    return out
+
+
+@pytest.fixture
+def docx_files(tmp_path, make_docx):
+    return [make_docx(tmp_path / f"resume_{i}.docx", f"Candidate {i}", "Python developer") for i in range(6)]
+
+
+class TestExtractText:
+
+    def test_docx(self, tmp_path, make_docx):
+        assert extract_text(make_docx(tmp_path / "a.docx", "Jane Doe", "Go engineer")) == "Jane Doe\nGo engineer"
+
+    def test_missing_file(self, tmp_path):
+        with pytest.raises(FileNotFoundError):
+            extract_text(str(tmp_path / "missing.docx"))
+
+    def test_unsupported_type(self, tmp_path):
+        path = tmp_path / "notes.txt"
+        path.write_text("hello")
+        with pytest.raises(ValueError):
+            extract_text(str(path))
+
+
+class TestPdfBudgets:
+
+    def test_pdf_pages_stream(self):
+        assert list(iter_pdf_pages(make_pdf("Page one", "Page two"))) == ["Page one", "Page two"]
+
+    def test_page_budget(self):
+        data = make_pdf(*[f"Page {i}" for i in range(15)])
+        assert list(iter_pdf_pages(data, max_pages=3)) == ["Page 0", "Page 1", "Page 2"]
+        assert parse_bytes(data, "cv.pdf").splitlines()[-1] == f"Page {resume_parser.PDF_MAX_PAGES - 1}"
+        assert len(parse_bytes(data, "cv.pdf", max_pages=None).splitlines()) == 15
+
+    def test_char_budget(self):
+        data = make_pdf("A" * 50, "B" * 50, "C" * 50)
+        assert parse_bytes(data, "cv.pdf", max_chars=60) == "A" * 50 + "\n" + "B" * 9
+
+    def test_pdf_from_bytes(self):
+        assert extract_text(make_pdf("Jane Doe")) == "Jane Doe"
+
+
+class TestTimeouts:
+
+    @pytest.fixture
+    def slow_parse(self, monkeypatch):
+        def slow(*args, **kwargs):
+            time.sleep(5)
+
+        monkeypatch.setattr(resume_parser, "parse_bytes", slow)
+
+    def test_timeout_in_main_thread(self, slow_parse):
+        start = time.perf_counter()
+        with pytest.raises(ExtractionTimeout):
+            extract_text(make_pdf("Jane Doe"), timeout=0.2)
+        assert time.perf_counter() - start < 2
+
+    def test_timeout_captured_per_file(self, slow_parse):
+        results = extract_texts([make_pdf("A"), make_pdf("B")], workers=1, timeout=0.2)
+        assert all(r["error"].startswith("ExtractionTimeout") for r in results)
+
+    def test_isolated_worker_off_main_thread(self):
+        result = {}
+        thread = threading.Thread(target=lambda: result.update(
+            single=extract_text(make_pdf("Jane Doe"), timeout=10),
+            batch=extract_texts([make_pdf("A"), make_pdf("B")], timeout=10),
+        ))
+        thread.start()
+        thread.join()
+        assert result["single"] == "Jane Doe"
+        assert [r["text"] for r in result["batch"]] == ["A", "B"]
+
+    def test_unresponsive_worker_is_killed(self, monkeypatch):
+        # No grace and a tiny limit: the parent stops waiting before the
+        # spawned worker could ever answer, as with a parse stuck in C code
+        monkeypatch.setattr(resume_parser, "TIMEOUT_GRACE", 0)
+        errors = []
+
+        def parse():
+            try:
+                extract_text(make_pdf("Slow"), filename="slow.pdf", timeout=0.01)
+            except Exception as e:
+                errors.append(e)
+
+        start = time.perf_counter()
+        thread = threading.Thread(target=parse)
+        thread.start()
+        thread.join()
+        assert isinstance(errors[0], ExtractionTimeout)
+        assert time.perf_counter() - start < 5
+        assert no_children_left()
+
+    def test_stuck_worker_does_not_hang_the_batch(self, monkeypatch):
+        monkeypatch.setattr(resume_parser, "TIMEOUT_GRACE", 3)
+        start = time.perf_counter()
+        with ParserPool(2, timeout=0.2, task=_ignore_alarm_and_sleep) as pool:
+            for seconds in (0, 60, 0, 0):
+                pool.submit(seconds)
+            results = []
+            for _ in range(4):
+                try:
+                    results.append(pool.next_result())
+                except ExtractionTimeout as e:
+                    results.append(e)
+        assert results[0] == 0 and results[2:] == [0, 0]
+        assert isinstance(results[1], ExtractionTimeout)
+        assert time.perf_counter() - start < 20
+        assert no_children_left()
+
+
+class TestInMemorySources:
+
+    def test_bytes_and_file_objects(self, tmp_path, make_docx):
+        path = make_docx(tmp_path / "a.docx", "Jane Doe")
+        data = Path(path).read_bytes()
+        assert extract_text(data) == "Jane Doe"  # type sniffed from content
+        assert extract_text(io.BytesIO(data), filename="a.docx") == "Jane Doe"
+
+    def test_file_object_name_and_rewind(self, tmp_path, make_docx):
+        path = make_docx(tmp_path / "a.docx", "Jane Doe")
+        upload = io.BytesIO(Path(path).read_bytes())
+        upload.name = "a.docx"
+        upload.read()  # already consumed once
+        assert extract_text(upload) == "Jane Doe"
+
+    def test_hash_matches_raw_bytes(self, tmp_path, make_docx):
+        path = make_docx(tmp_path / "a.docx", "Jane Doe")
+        expected = hashlib.sha256(Path(path).read_bytes()).hexdigest()
+        assert extract_text_hashed(path)[1] == expected
+        assert read_source(io.BytesIO(Path(path).read_bytes()))[1] == expected
+
+    def test_unknown_bytes(self):
+        with pytest.raises(ValueError):
+            extract_text(b"plain text")
+
+
+class TestExtractTexts:
+
+    def test_parallel_results_in_order(self, docx_files):
+        results = extract_texts(docx_files, workers=2)
+        assert [r["source"] for r in results] == docx_files
+        assert [r["text"].splitlines()[0] for r in results] == [f"Candidate {i}" for i in range(6)]
+        assert all(r["error"] is None for r in results)
+
+    def test_errors_are_captured(self, docx_files, tmp_path):
+        broken = tmp_path / "broken.docx"
+        broken.write_bytes(b"not a zip")
+        results = extract_texts([docx_files[0], str(broken), str(tmp_path / "gone.pdf"), *docx_files[1:]], workers=2)
+        assert len(results) == 8
+        assert results[0]["text"].startswith("Candidate 0")
+        assert results[1]["text"] is None and results[1]["error"]
+        assert results[2]["error"].startswith("FileNotFoundError")
+        assert results[3]["text"].startswith("Candidate 1")
+
+    def test_small_batches_run_in_process(self, docx_files, monkeypatch):
+        def no_pool(*args, **kwargs):
+            raise AssertionError("process pool should not be used")
+
+        monkeypatch.setattr(resume_parser, "ProcessPoolExecutor", no_pool)
+        assert len(extract_texts(docx_files[:2])) == 2
+        assert len(extract_texts(docx_files, workers=1)) == 6
+
+    def test_progress(self, docx_files):
+        calls = []
+        extract_texts(docx_files, workers=2, progress=lambda done, total: calls.append((done, total)))
+        assert calls[-1] == (6, 6)
+        assert len(calls) == 6
+
+    def test_empty(self):
+        assert extract_texts([]) == []
+
+    def test_sections_segmented_at_parse_time(self, tmp_path, make_docx):
+        path = make_docx(tmp_path / "a.docx", "Jane Doe", "Skills", "Go, Python", "Education", "BSc")
+        result = extract_texts([path])[0]
+        assert [s["name"] for s in result["sections"]] == ["header", "skills", "education"]
+        assert extract_texts([str(tmp_path / "gone.pdf")])[0]["sections"] is None
+
+    def test_mixed_sources(self, docx_files):
+        upload = io.BytesIO(Path(docx_files[1]).read_bytes())
+        upload.name = "upload.docx"
+        results = extract_texts([docx_files[0], upload, Path(docx_files[2]).read_bytes()], workers=2)
+        assert [r["source"] for r in results] == [docx_files[0], "upload.docx", None]
+        assert [r["text"].splitlines()[0] for r in results] == ["Candidate 0", "Candidate 1", "Candidate 2"]
+        assert all(len(r["sha256"]) == 64 for r in results)
+
+
+class TestExtractionCache:
+
+    def test_second_parse_is_a_cache_hit(self, tmp_path, monkeypatch, make_docx):
+        path = make_docx(tmp_path / "a.docx", "Jane Doe")
+        assert extract_text(path) == "Jane Doe"
+
+        def no_parse(*args, **kwargs):
+            raise AssertionError("cached content should not be parsed")
+
+        monkeypatch.setattr(resume_parser, "parse_bytes", no_parse)
+        assert extract_text(path) == "Jane Doe"
+        assert extract_text(Path(path).read_bytes()) == "Jane Doe"  # same content, any source
+
+    def test_parser_version_invalidates(self, tmp_path, monkeypatch, make_docx):
+        path = make_docx(tmp_path / "a.docx", "Jane Doe")
+        digest = extract_text_hashed(path)[1]
+        monkeypatch.setattr(resume_parser, "PARSER_VERSION", "test-next")
+        assert extraction_cache.get_cached_text(digest, cache_version()) is None
+        extract_text(path)
+        assert extraction_cache.get_cached_text(digest, cache_version()) == "Jane Doe"
+        extract_text(path, max_chars=4)
+        assert extraction_cache.purge_stale("test-next") == 1  # both budgets of this version kept
+
+    def test_budgets_per_call_are_cached_apart(self):
+        data = make_pdf(*[f"Page {i}" for i in range(15)])
+        assert len(extract_text(data).splitlines()) == resume_parser.PDF_MAX_PAGES
+        assert len(extract_text(data, max_pages=None).splitlines()) == 15
+        assert extract_text(data, max_pages=2) == "Page 0\nPage 1"
+        assert extract_text(data, max_pages=None, max_chars=6) == "Page 0"
+        assert [r["text"] for r in extract_texts([data, data], workers=1, max_pages=1)] == ["Page 0"] * 2
+        assert len(extract_text(data).splitlines()) == resume_parser.PDF_MAX_PAGES
+
+    def test_cache_hits_skip_the_pool(self, docx_files, monkeypatch):
+        extract_texts(docx_files, workers=2)
+
+        def no_pool(*args, **kwargs):
+            raise AssertionError("cached files should not start a process pool")
+
+        monkeypatch.setattr(resume_parser, "ProcessPoolExecutor", no_pool)
+        results = {}
+        # Off the main thread with a timeout: misses would go to isolated workers
+        thread = threading.Thread(target=lambda: results.update(
+            out=extract_texts(docx_files, workers=2, timeout=30)))
+        thread.start()
+        thread.join()
+        assert [r["text"].splitlines()[0] for r in results["out"]] == [f"Candidate {i}" for i in range(6)]
+        assert all(r["sections"] is not None and r["source"] == p for r, p in zip(results["out"], docx_files))
+
+    def test_workers_share_cache(self, docx_files):
+        results = extract_texts(docx_files, workers=2)
+        assert all(extraction_cache.get_cached_text(r["sha256"], cache_version()) for r in results)
+
+    def test_failures_not_cached(self, tmp_path):
+        broken = tmp_path / "broken.docx"
+        broken.write_bytes(b"not a zip")
+        assert extract_texts([str(broken)])[0]["error"]
+        assert extraction_cache.get_cached_text(
+            hashlib.sha256(b"not a zip").hexdigest(), cache_version()) is None
+
+    def test_disabled(self, tmp_path, monkeypatch, make_docx):
+        monkeypatch.setenv("EXTRACTION_CACHE_PATH", "")
+        assert extraction_cache.cache_path() is None
+        assert extract_text(make_docx(tmp_path / "a.docx", "Jane Doe")) == "Jane Doe"
+        assert extraction_cache.get_cached_text("x", "1") is None
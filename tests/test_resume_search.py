@@ -0,0 +1,64 @@
+"""
+Unit tests for services/resume_search.py — NO LLM required.
+
+Run: python3 -m pytest tests/test_resume_search.py -v
+"""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+# Ensure project root is on path
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from services.db.lancedb_client import store_resumes_batch
+from services.resume_search import hybrid_search, reciprocal_rank_fusion, RRF_K
+
+
+pytestmark = pytest.mark.usefixtures("temp_db")
+
+
+class TestReciprocalRankFusion:
+
+    def test_shared_items_win(self):
+        fused = reciprocal_rank_fusion([["a", "b", "c"], ["c", "d", "a"]])
+        assert [item for item, _ in fused][:2] == ["a", "c"]
+
+    def test_scores(self):
+        fused = dict(reciprocal_rank_fusion([["a"], ["b", "a"]]))
+        assert fused["a"] == pytest.approx(1 / (RRF_K + 1) + 1 / (RRF_K + 2))
+        assert fused["b"] == pytest.approx(1 / (RRF_K + 1))
+
+    def test_empty(self):
+        assert reciprocal_rank_fusion([[], []]) == []
+
+
+class TestHybridSearch:
+
+    def test_top_n_with_text(self):
+        store_resumes_batch([
+            ("devops.docx", "DevOps engineer running Kubernetes and Terraform on AWS EKS", None),
+            ("frontend.docx", "Frontend engineer building React and TypeScript apps", None),
+            ("data.docx", "Data engineer with Spark, Airflow and Snowflake", None),
+        ])
+        results = hybrid_search("Terraform EKS", top_n=2)
+        assert len(results) == 2
+        assert results[0]["filename"] == "devops.docx"
+        assert results[0]["keyword_rank"] == 1
+        assert "Kubernetes" in results[0]["text"]
+
+    def test_empty_database(self):
+        assert hybrid_search("python") == []
+
+    def test_linked_near_duplicates_collapsed(self):
+        base = ("Site reliability engineer automating Terraform and Kubernetes on AWS EKS, "
+                "on-call lead for payments, built Prometheus alerting and Grafana dashboards, "
+                "reduced incident response time by half and migrated forty services to Helm charts")
+        statuses = store_resumes_batch([
+            ("sre.pdf", base, None),
+            ("sre.docx", base.replace("Helm charts", "Helm"), None),
+        ], near_duplicates="link")
+        assert statuses == ["stored", "linked"]
+        assert [r["filename"] for r in hybrid_search("Terraform EKS")] == ["sre.pdf"]
+        assert len(hybrid_search("Terraform EKS", include_near_duplicates=True)) == 2
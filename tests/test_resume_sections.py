@@ -0,0 +1,148 @@
+"""
+Unit tests for services/resume_sections.py and the section-scoped prompts
+of the resume agents — NO LLM or network required.
+
+Run: python3 -m pytest tests/test_resume_sections.py -v
+"""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+# Ensure project root is on path
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from services import resume_quality_graph, skill_gap_graph
+from services.resume_enricher import extract_resume_signals
+from services.resume_sections import (
+    dump_sections,
+    load_sections,
+    section_text,
+    segment_sections,
+)
+
+RESUME = """Name: Jane Doe
+Email: jane@example.com
+Experience: 6 Years
+
+PROFESSIONAL SUMMARY
+Backend engineer building payment platforms.
+
+Technical Skills:
+- Go, Python
+- Kubernetes, AWS
+
+Work Experience
+Senior Engineer – PayCo (2020 – Present)
+Cut API latency by 40%
+
+Education
+BSc Computer Science – University of Toronto
+
+Hobbies
+Chess, climbing
+"""
+
+
+def _names(sections):
+    return [s["name"] for s in sections]
+
+
+class TestSegmentSections:
+
+    def test_core_sections_in_order(self):
+        sections = segment_sections(RESUME)
+        assert _names(sections) == ["header", "summary", "skills", "experience", "education", "other"]
+        assert [s["heading"] for s in sections][1:3] == ["PROFESSIONAL SUMMARY", "Technical Skills"]
+
+    def test_offsets_cover_text(self):
+        sections = segment_sections(RESUME)
+        assert sections[0]["start"] == 0
+        assert sections[-1]["end"] == len(RESUME)
+        assert all(a["end"] == b["start"] for a, b in zip(sections, sections[1:]))
+        skills = next(s for s in sections if s["name"] == "skills")
+        assert RESUME[skills["start"]:skills["end"]].startswith("Technical Skills:")
+        assert "Kubernetes" in RESUME[skills["start"]:skills["end"]]
+
+    def test_contact_field_is_not_a_heading(self):
+        header = segment_sections(RESUME)[0]
+        assert "Experience: 6 Years" in RESUME[header["start"]:header["end"]]
+
+    def test_inline_heading_after_first_section(self):
+        text = "Summary\nData engineer.\nSkills: SQL, Spark\nLanguages: English, Hindi\n"
+        sections = segment_sections(text)
+        assert _names(sections) == ["summary", "skills"]
+        assert "Languages: English" in text[sections[1]["start"]:sections[1]["end"]]
+
+    def test_bullets_and_case_ignored(self):
+        assert _names(segment_sections("## projects\nLedger\n• EDUCATION •\nBSc\n")) == ["projects", "education"]
+
+    def test_unstructured_text_has_no_sections(self):
+        assert segment_sections("Jane Doe, engineer who likes Go and Kubernetes.") == []
+        assert segment_sections("") == []
+
+    def test_long_line_is_not_a_heading(self):
+        line = "Experience building distributed systems across many teams and regions"
+        assert segment_sections(line + "\n") == []
+
+
+class TestSectionText:
+
+    def test_keeps_wanted_sections_only(self):
+        text = section_text(RESUME, None, ["skills", "experience"])
+        assert "Kubernetes" in text and "PayCo" in text
+        assert "jane@example.com" not in text
+        assert "Chess" not in text
+        assert "University of Toronto" not in text
+
+    def test_falls_back_to_full_text(self):
+        text = "Jane Doe, engineer who likes Go."
+        assert section_text(text, None, ["skills"]) == text
+        assert section_text(RESUME, None, ["projects"]) == RESUME
+
+    def test_accepts_stored_json(self):
+        stored = dump_sections(segment_sections(RESUME))
+        assert load_sections(stored) == segment_sections(RESUME)
+        assert section_text(RESUME, stored, ["education"]).startswith("Education")
+        assert load_sections("") is None
+        assert load_sections("{broken") is None
+
+
+class TestSectionScopedPrompts:
+
+    def test_signal_extraction_skips_contact_and_hobbies(self, make_fake_llm):
+        llm = make_fake_llm()
+        extract_resume_signals(RESUME, llm=llm)
+        assert "PayCo" in llm.prompts[0]
+        assert "University of Toronto" in llm.prompts[0]
+        assert "jane@example.com" not in llm.prompts[0]
+        assert "Chess" not in llm.prompts[0]
+
+    def test_skill_agent_sends_skill_sections(self, monkeypatch, make_fake_llm):
+        llm = make_fake_llm('{"skills": ["Go"]}')
+        monkeypatch.setattr(skill_gap_graph, "get_llm", lambda temperature=0: llm)
+        result = skill_gap_graph.resume_skill_agent({"resume_text": RESUME, "jd_text": ""})
+        assert result == {"resume_skills": ["Go"]}
+        assert "Kubernetes" in llm.prompts[0]
+        assert "University of Toronto" not in llm.prompts[0]
+
+    def test_signal_extraction_keeps_awards(self, make_fake_llm):
+        llm = make_fake_llm()
+        extract_resume_signals(RESUME.replace("Hobbies", "Achievements\nSaved $2M in cloud spend\n\nHobbies"), llm=llm)
+        assert "Saved $2M in cloud spend" in llm.prompts[0]
+        assert "Chess" not in llm.prompts[0]
+
+    def test_quality_agent_scores_whole_resume(self, monkeypatch, make_fake_llm):
+        llm = make_fake_llm('{"clarity": 80, "skills": 70, "format": 90, "overall": 80}')
+        monkeypatch.setattr(resume_quality_graph, "get_llm", lambda temperature=0: llm)
+        state = resume_quality_graph.resume_reader_agent({"resumes": [RESUME]})
+        result = resume_quality_graph.quality_scoring_agent(state)
+        assert result["score"]["overall"] == 80
+        assert RESUME in llm.prompts[0]  # format and completeness need the contact block too
+
+    @pytest.mark.parametrize("text", ["Jane Doe, Go engineer at PayCo.", ""])
+    def test_unstructured_resume_sent_whole(self, text, make_fake_llm):
+        llm = make_fake_llm()
+        extract_resume_signals(text, llm=llm)
+        assert text in llm.prompts[0]
@@ -0,0 +1,77 @@
+"""
+Unit tests for services/signal_backfill.py — uses a fake LLM, no API key.
+
+Run: python3 -m pytest tests/test_signal_backfill.py -v
+"""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+# Ensure project root is on path
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from services import signal_backfill
+from services.db.lancedb_client import (
+    count_missing_signals,
+    find_candidate_ids,
+    get_cached_signals,
+    store_resumes_batch,
+)
+from services.signal_backfill import BackfillWorker, backfill_signals
+
+pytestmark = pytest.mark.usefixtures("temp_db")
+
+
+@pytest.fixture
+def fake_llm(make_fake_llm):
+    """Returns canned signals; raises for resumes containing 'BOOM'."""
+    return make_fake_llm(
+        fail_on="BOOM", skills=[{"skill": "Kubernetes", "context": "ran clusters"}], total_years=6,
+    )
+
+
+@pytest.fixture
+def pool(make_resume_signals):
+    store_resumes_batch([
+        ("a.docx", "Alice", None),
+        ("b.docx", "Bob", None),
+        ("c.docx", "Carol BOOM", None),
+        ("d.docx", "Dave", make_resume_signals()),
+    ])
+
+
+class TestSignalBackfill:
+
+    def test_backfills_missing_only(self, pool, fake_llm):
+        assert count_missing_signals() == 3
+        stats = backfill_signals(llm=fake_llm, max_workers=2)
+
+        assert stats["total"] == 3
+        assert stats["done"] == 2
+        assert stats["failed"] == 1
+        assert "rate limited" in stats["errors"][0]
+        assert fake_llm.calls == 3
+        assert count_missing_signals() == 1
+
+    def test_results_cached_and_filterable(self, pool, fake_llm):
+        backfill_signals(llm=fake_llm)
+        assert get_cached_signals("Alice")["experience_duration"]["total_years"] == 6
+        assert len(find_candidate_ids(skills_all=["kubernetes"], min_years=5)) == 2
+
+    def test_batches_and_progress(self, pool, fake_llm, monkeypatch):
+        monkeypatch.setattr(signal_backfill, "WRITE_BATCH_SIZE", 1)
+        seen = []
+        backfill_signals(llm=fake_llm, progress=lambda stats: seen.append(stats["done"] + stats["failed"]))
+        assert seen == [0, 1, 2, 3]
+
+    def test_limit(self, pool, fake_llm):
+        assert backfill_signals(llm=fake_llm, limit=1)["total"] == 1
+
+    def test_background_worker(self, pool, fake_llm):
+        worker = BackfillWorker(fake_llm, max_workers=2)
+        worker.start()
+        worker.join(timeout=30)
+        assert worker.error is None
+        assert worker.stats["done"] == 2
@@ -0,0 +1,105 @@
+"""
+Unit tests for services/db/skill_index.py — NO LLM required.
+
+Run: python3 -m pytest tests/test_skill_index.py -v
+"""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+# Ensure project root is on path
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from services.db import lancedb_client, migrations
+from services.db.lancedb_client import get_or_create_table, store_resumes_batch, update_signals
+from services.db.skill_index import (
+    canonical_skill,
+    find_candidates_by_skills,
+    get_skills_table,
+    rebuild_skill_index,
+    skill_terms,
+)
+from services.matching_workflow import candidate_prefilter_agent
+
+pytestmark = pytest.mark.usefixtures("temp_db")
+
+
+def _skills(*names):
+    return [{"skill": name} for name in names]
+
+
+@pytest.fixture
+def skill_pool(make_resume_signals):
+    store_resumes_batch([
+        ("backend.docx", "Backend resume", make_resume_signals(skills=_skills("Python", "AWS Lambda", "PostgreSQL"))),
+        ("platform.docx", "Platform resume", make_resume_signals(skills=_skills("Go", "K8s", "AWS"))),
+        ("frontend.docx", "Frontend resume", make_resume_signals(skills=_skills("React", "TypeScript"))),
+        ("unanalyzed.docx", "Unanalyzed resume", None),
+    ])
+    return {r["filename"]: r["id"] for r in get_or_create_table().search().select(["id", "filename"]).to_list()}
+
+
+class TestSkillTerms:
+
+    def test_canonical(self):
+        assert canonical_skill("  Golang ") == "go"
+        assert canonical_skill("Node.js") == "node.js"
+        assert canonical_skill("") == ""
+
+    def test_sub_phrases(self):
+        assert skill_terms(["AWS Lambda"]) == {"aws lambda", "aws", "lambda"}
+        assert skill_terms(["k8s"]) == {"kubernetes"}
+
+
+class TestFindCandidates:
+
+    def test_min_match(self, skill_pool):
+        matches = find_candidates_by_skills(["Python", "AWS", "Kubernetes"], min_match=2)
+        assert matches == sorted([(skill_pool["backend.docx"], 2), (skill_pool["platform.docx"], 2)])
+
+    def test_ranked_by_coverage_and_limited(self, skill_pool):
+        matches = find_candidates_by_skills(["aws", "postgres", "python"], min_match=1, limit=1)
+        assert matches == [(skill_pool["backend.docx"], 3)]
+
+    def test_min_match_capped_at_skill_count(self, skill_pool):
+        assert find_candidates_by_skills(["react"], min_match=5) == [(skill_pool["frontend.docx"], 1)]
+
+    def test_no_skills(self, skill_pool):
+        assert find_candidates_by_skills([]) == []
+        assert find_candidates_by_skills(["cobol"]) == []
+
+    def test_update_signals_replaces_postings(self, skill_pool, make_resume_signals):
+        update_signals({skill_pool["frontend.docx"]: make_resume_signals(skills=_skills("Python"))})
+        update_signals({skill_pool["unanalyzed.docx"]: make_resume_signals(skills=_skills("Python"))})
+        assert find_candidates_by_skills(["react"]) == []
+        assert {rid for rid, _ in find_candidates_by_skills(["python"])} == {
+            skill_pool[f] for f in ["backend.docx", "frontend.docx", "unanalyzed.docx"]}
+
+    def test_rebuild(self, skill_pool):
+        before = get_skills_table().count_rows()
+        assert rebuild_skill_index() == before
+        assert len(find_candidates_by_skills(["aws"])) == 2
+
+    def test_migration_builds_index(self, make_resume_signals):
+        store_resumes_batch([("a.docx", "A", make_resume_signals(skills=_skills("Rust")))])
+        lancedb_client.db.drop_table("resume_skills")
+        table = get_or_create_table()
+        migrations.set_schema_version(table, 5)
+        migrations.migrate_table(table, lancedb_client.resume_schema)
+        assert len(find_candidates_by_skills(["rust"])) == 1
+
+
+class TestPrefilterAgent:
+
+    def test_noop_without_prefilter(self):
+        assert candidate_prefilter_agent({"resume_texts": ["x"], "skill_prefilter": None}) == {}
+
+    def test_picks_covering_resumes(self, skill_pool):
+        result = candidate_prefilter_agent({
+            "resume_texts": [],
+            "jd_requirements": {"must_have_skills": ["Python", "AWS", "Kubernetes"]},
+            "skill_prefilter": {"min_skills": 2, "max_candidates": 10},
+        })
+        assert sorted(result["resume_texts"]) == ["Backend resume", "Platform resume"]